@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Startup load benchmark: DBManager.load_all + EventPlanner.bulk_load vs. the old N+1 path
+(load_events followed by one load_tasks query per event), plus the windowed
+EventPlanner.load_window that loads only recent and upcoming events.
+The legacy path is timed on a sample of events and extrapolated, since running it in full
+on the default dataset takes far too long.
+
+Usage: python benchmarks/bench_startup_load.py [--events 50000] [--tasks-per-event 10] [--db PATH]
+"""
+
+import argparse
+import datetime
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from core.event_planner import EventPlanner, Event
+from database.db_manager import DBManager
+
+
+def build_dataset(db_name: str, events: int, tasks_per_event: int) -> None:
+    """Creates a synthetic database with random event dates and fixed-size checklists."""
+    rng = random.Random(42)
+    db = DBManager(db_name)
+    db.save_events(
+        Event(event_id, f"Event {event_id}",
+              f"{rng.randint(2020, 2030)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+              f"{rng.randint(0, 23):02d}:{rng.choice((0, 15, 30, 45)):02d}",
+              rng.random() < 0.1, "Room 1", "Synthetic event", "Alice,Bob")
+        for event_id in range(1, events + 1)
+    )
+    db.conn.executemany(
+        "INSERT INTO tasks (event_id, task_description, completed) VALUES (?, ?, ?)",
+        ((event_id, f"Task {i}", rng.random() < 0.5)
+         for event_id in range(1, events + 1) for i in range(tasks_per_event))
+    )
+    db.conn.commit()
+    db.close()
+
+
+def time_load_all(db_name: str) -> dict:
+    """Times the single-pass load, then repeats it under tracemalloc to record peak memory."""
+    db = DBManager(db_name)
+    started = time.perf_counter()
+    loaded = EventPlanner().bulk_load(db.load_all())
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    EventPlanner().bulk_load(db.load_all())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    db.close()
+    return {'events': loaded, 'seconds': elapsed, 'peak': peak}
+
+
+def time_load_window(db_name: str, past_days: int) -> dict:
+    """Times loading only the hot window, then faulting in one older month."""
+    db = DBManager(db_name)
+    planner = EventPlanner()
+    started = time.perf_counter()
+    loaded = planner.load_window(db, past_days=past_days)
+    elapsed = time.perf_counter() - started
+    month_start = (planner.window_start - datetime.timedelta(days=365)).replace(day=1)
+    started = time.perf_counter()
+    faulted = planner.ensure_loaded(month_start, month_start + datetime.timedelta(days=27))
+    fault_seconds = time.perf_counter() - started
+    db.close()
+    return {'events': loaded, 'seconds': elapsed, 'faulted': faulted, 'fault_seconds': fault_seconds}
+
+
+def time_legacy(db_name: str, sample: int) -> dict:
+    """Times the N+1 path on the first `sample` events and extrapolates to the full table."""
+    db = DBManager(db_name)
+    planner = EventPlanner()
+    started = time.perf_counter()
+    events = db.load_events()
+    for event in events[:sample]:
+        planner._add_event_for_loading(event)
+        planner._set_tasks_for_loading(event.event_id, db.load_tasks(event.event_id))
+    elapsed = time.perf_counter() - started
+    db.close()
+    sampled = min(sample, len(events))
+    return {'sampled': sampled, 'seconds': elapsed, 'estimated': elapsed * len(events) / max(sampled, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=50000)
+    parser.add_argument('--tasks-per-event', type=int, default=10)
+    parser.add_argument('--legacy-sample', type=int, default=200, help="Events to time on the N+1 path (0 to skip)")
+    parser.add_argument('--past-days', type=int, default=30, help="History kept in the hot window")
+    parser.add_argument('--db', help="Reuse or create this database file instead of a temporary one")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)  # Per-query INFO lines would dominate the timings
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_name = args.db or os.path.join(tmpdir, "bench_events.db")
+        if not os.path.exists(db_name):
+            started = time.perf_counter()
+            build_dataset(db_name, args.events, args.tasks_per_event)
+            print(f"Built {args.events} events / {args.events * args.tasks_per_event} tasks "
+                  f"in {time.perf_counter() - started:.1f}s")
+
+        result = time_load_all(db_name)
+        print(f"load_all + bulk_load: {result['events']} events in {result['seconds']:.2f}s "
+              f"(peak traced memory {result['peak'] / 2**20:.0f} MiB)")
+
+        window = time_load_window(db_name, args.past_days)
+        print(f"load_window ({args.past_days} days + future): {window['events']} events in {window['seconds']:.2f}s; "
+              f"one cold month ({window['faulted']} events) faulted in {window['fault_seconds'] * 1000:.1f}ms")
+
+        if args.legacy_sample:
+            legacy = time_legacy(db_name, args.legacy_sample)
+            print(f"N+1 path: {legacy['sampled']} events in {legacy['seconds']:.2f}s, "
+                  f"estimated {legacy['estimated']:.0f}s for all events")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Storage profile benchmark for DBManager.
+For each profile in STORAGE_PROFILES, writes a synthetic dataset to a fresh database and reports:
+  - small-transaction write throughput (one save_event commit per event, like GUI edits),
+  - bulk write throughput (save_events + save_tasks_bulk in one transaction each),
+  - read throughput (load_all over the whole dataset).
+
+Usage: python benchmarks/bench_storage_profiles.py [--events 20000] [--tasks-per-event 5] [--single-commits 500]
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from core.event_planner import Event, LLNode
+from database.db_manager import DBManager, STORAGE_PROFILES
+
+
+def synthetic_events(count: int, first_id: int = 1):
+    """Generates events with random dates in a fixed, reproducible order."""
+    rng = random.Random(first_id)
+    for event_id in range(first_id, first_id + count):
+        yield Event(event_id, f"Event {event_id}",
+                    f"{rng.randint(2020, 2030)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                    f"{rng.randint(0, 23):02d}:{rng.choice((0, 15, 30, 45)):02d}",
+                    rng.random() < 0.1, "Room 1", "Synthetic event", "Alice,Bob")
+
+
+def task_chain(tasks_per_event: int):
+    """Builds a task linked list of the given length."""
+    head = None
+    for i in reversed(range(tasks_per_event)):
+        node = LLNode(f"Task {i}", completed=i % 2 == 0)
+        node.next = head
+        head = node
+    return head
+
+
+def run_profile(profile: str, directory: str, events: int, tasks_per_event: int, single_commits: int) -> dict:
+    """Runs the write and read workloads against one profile and returns rows per second."""
+    db = DBManager(os.path.join(directory, f"{profile}.db"), profile=profile)
+
+    started = time.perf_counter()
+    for event in synthetic_events(single_commits, first_id=events + 1):
+        db.save_event(event)
+    single = single_commits / (time.perf_counter() - started)
+
+    started = time.perf_counter()
+    db.save_events(synthetic_events(events))
+    chain = task_chain(tasks_per_event)
+    db.save_tasks_bulk({event_id: chain for event_id in range(1, events + 1)})
+    bulk_rows = events * (1 + tasks_per_event)
+    bulk = bulk_rows / (time.perf_counter() - started)
+
+    started = time.perf_counter()
+    read_rows = 0
+    for _, head in db.load_all():
+        read_rows += 1
+        while head:
+            read_rows += 1
+            head = head.next
+    read = read_rows / (time.perf_counter() - started)
+    db.close()
+    return {'single': single, 'bulk': bulk, 'read': read}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=20000)
+    parser.add_argument('--tasks-per-event', type=int, default=5)
+    parser.add_argument('--single-commits', type=int, default=500, help="Events saved with one commit each")
+    parser.add_argument('--dir', help="Directory for the benchmark databases (default: a temporary directory)")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmpdir:
+        print(f"{args.events} events x {args.tasks_per_event} tasks, {args.single_commits} single-commit saves")
+        print(f"{'profile':<12}{'single commits/s':>18}{'bulk rows/s':>14}{'read rows/s':>14}")
+        for profile in STORAGE_PROFILES:
+            result = run_profile(profile, tmpdir, args.events, args.tasks_per_event, args.single_commits)
+            print(f"{profile:<12}{result['single']:>18,.0f}{result['bulk']:>14,.0f}{result['read']:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark: LLNode task chains vs. the array-backed CompactTaskStore.
+Builds the same synthetic checklists with both task stores and reports the memory
+allocated for them, as measured by tracemalloc.
+
+Usage: python benchmarks/bench_task_memory.py [--events N] [--tasks-per-event M] [--distinct D]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from core.event_planner import LinkedTaskStore
+from data_structures.compact_task_store import CompactTaskStore
+
+
+def build(store_class, events: int, tasks_per_event: int, distinct: int):
+    """Fills a task store with `events` lists of `tasks_per_event` tasks each."""
+    store = store_class()
+    for event_id in range(1, events + 1):
+        # Fresh string objects each time, as they would arrive from the DB or the GUI
+        store.append(event_id, (f"Checklist item {(event_id * tasks_per_event + i) % distinct}"
+                                for i in range(tasks_per_event)))
+        store.complete_where(event_id, lambda task: task.endswith("0"))
+    return store
+
+
+def measure(store_class, events: int, tasks_per_event: int, distinct: int) -> dict:
+    """Returns allocated bytes and build time for one store implementation."""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    store = build(store_class, events, tasks_per_event, distinct)
+    elapsed = time.perf_counter() - started
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del store
+    return {'current': current, 'peak': peak, 'seconds': elapsed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=2000)
+    parser.add_argument('--tasks-per-event', type=int, default=100)
+    parser.add_argument('--distinct', type=int, default=5000, help="Number of distinct task descriptions")
+    args = parser.parse_args()
+
+    total = args.events * args.tasks_per_event
+    print(f"{args.events} events x {args.tasks_per_event} tasks = {total} tasks "
+          f"({args.distinct} distinct descriptions)")
+    print(f"{'store':<18}{'current MiB':>12}{'peak MiB':>12}{'bytes/task':>12}{'build s':>10}")
+    results = {}
+    for name, store_class in (('LLNode chains', LinkedTaskStore), ('CompactTaskStore', CompactTaskStore)):
+        result = measure(store_class, args.events, args.tasks_per_event, args.distinct)
+        results[name] = result
+        print(f"{name:<18}{result['current'] / 2**20:>12.1f}{result['peak'] / 2**20:>12.1f}"
+              f"{result['current'] / total:>12.1f}{result['seconds']:>10.2f}")
+    ratio = results['LLNode chains']['current'] / results['CompactTaskStore']['current']
+    print(f"CompactTaskStore uses {ratio:.1f}x less memory")
+
+
+if __name__ == "__main__":
+    main()
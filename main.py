@@ -5,6 +5,7 @@ Main entry point for the Event Planner Application.
 
 import sys
 import os
+import time
 
 # Add the src directory to the Python path
 src_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
@@ -12,13 +13,19 @@ sys.path.insert(0, src_path)
 
 def main():
     """Main function to start the Event Planner application."""
+    started = time.perf_counter() # Startup timings (time to first paint...) are measured from here
     try:
-        from ui.gui import EventPlannerGUI
-        import tkinter as tk
+        import startup_profiler
+        startup_profiler.start("event_planner", sys.argv) # Only if STARTUP_PROFILE or --profile-startup is set
+        with startup_profiler.phase("import_gui"):
+            from ui.gui import EventPlannerGUI
+            import tkinter as tk
         
         # Create and start the GUI application
-        root = tk.Tk()
-        app = EventPlannerGUI(root)
+        with startup_profiler.phase("create_root"):
+            root = tk.Tk()
+        with startup_profiler.phase("build_gui"):
+            app = EventPlannerGUI(root, started=started)
         
         # Configure window close behavior
         root.protocol("WM_DELETE_WINDOW", app._on_closing)
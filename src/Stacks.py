@@ -1,3 +1,8 @@
+import sys
+import startup_profiler
+if __name__ == "__main__":
+    startup_profiler.start("library_app", sys.argv)  # Only if STARTUP_PROFILE or --profile-startup is set
+
 import tkinter as tk
 from tkinter import ttk, messagebox
 import sqlite3
@@ -188,8 +193,10 @@ class BookManager:
         self.queue = CheckoutQueue()
         self.history = BookHistory()
         self.bst = BookBST()
-        self.conn = sqlite3.connect(db_name)
-        self.create_table()
+        with startup_profiler.phase("db.connect"):
+            self.conn = sqlite3.connect(db_name)
+        with startup_profiler.phase("db.create_tables"):
+            self.create_table()
 
     def create_table(self):
         cursor = self.conn.cursor()
@@ -418,10 +425,15 @@ class TestDataStructures(unittest.TestCase):
 
 
 if __name__ == "__main__":
+    startup_profiler.mark("imports_done")
     # Run tests
-    unittest.main(argv=['first-arg-is-ignored'], exit=False)
+    with startup_profiler.phase("self_tests"):
+        unittest.main(argv=['first-arg-is-ignored'], exit=False)
 
     # Launch GUI
-    root = tk.Tk()
-    app = LibraryApp(root)
+    with startup_profiler.phase("create_root"):
+        root = tk.Tk()
+    with startup_profiler.phase("build_gui"):
+        app = LibraryApp(root)
+    startup_profiler.finish_after_first_paint(root)
     root.mainloop()
@@ -1,7 +1,13 @@
+import bisect
 import datetime
+import heapq
+import itertools
 import logging
+import math
+import re
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, Iterable, Iterator, Callable, Union, Tuple, Set
 
 # Import data structures (assuming these paths are correct in your project structure)
 # If LLNode is defined in core/event_planner.py, the import below might be redundant or cause issues
@@ -12,6 +18,8 @@ from typing import Optional, List
 # from data_structures.stack import EventStack # Assuming EventStack is in data_structures/stack.py
 # from data_structures.queue import EventQueue # Assuming EventQueue is in data_structures/queue.py
 
+_WORD_PATTERN = re.compile(r"\w+")  # Words indexed for search_prefix
+
 # Configure basic logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -41,6 +49,17 @@ class Event:
             self.attendees
         )
 
+# Persistent changes accumulated by EventPlanner since the last flush
+@dataclass
+class PlannerChanges:
+    events: List[Event]  # Copies of created or modified events
+    deleted_event_ids: List[int]
+    task_lists: dict  # {event_id: [(task, completed), ...]} - full replacement lists
+
+    def is_empty(self) -> bool:
+        """Returns True if there is nothing to write."""
+        return not (self.events or self.deleted_event_ids or self.task_lists)
+
 # Node for Linked List (tasks) - Keeping it here as per your provided code structure
 class LLNode:
     def __init__(self, data: str, completed: bool = False):
@@ -53,6 +72,122 @@ class LLNode:
         self.completed = completed
         self.next = None
 
+# Task storage backed by LLNode chains - the default for EventPlanner.todo_lists
+class LinkedTaskStore(dict):
+    """
+    A {event_id: LLNode head} dictionary with the task operations EventPlanner needs.
+    CompactTaskStore (data_structures/compact_task_store.py) implements the same operations
+    over array columns, so the planner can switch storage without changing its task API.
+    """
+
+    def iter_tasks(self, event_id: int) -> Iterator[Tuple[str, bool]]:
+        """Yields (description, completed) pairs for an event's tasks in list order."""
+        current = self.get(event_id)
+        while current:
+            yield current.data, current.completed
+            current = current.next
+
+    def append(self, event_id: int, tasks: Iterable[str]) -> int:
+        """
+        Appends incomplete tasks to an event's list in one splice.
+        The new nodes are chained first and attached to the tail, so the list is walked at most once.
+        :return: The number of tasks appended.
+        """
+        new_head = None
+        new_tail = None
+        count = 0
+        for task in tasks:
+            new_node = LLNode(task)
+            if new_head is None:
+                new_head = new_node
+            else:
+                new_tail.next = new_node
+            new_tail = new_node
+            count += 1
+
+        if new_head is None:
+            self.setdefault(event_id, None)
+        elif self.get(event_id) is None:
+            self[event_id] = new_head # First tasks for this event
+        else:
+            current = self[event_id]
+            while current.next:
+                current = current.next
+            current.next = new_head # Append to end of linked list
+        return count
+
+    def remove_first(self, event_id: int, task: str) -> Optional[bool]:
+        """
+        Removes the first task with the given description.
+        :return: The removed task's completed flag, or None if no task matched.
+        """
+        previous = None
+        current = self.get(event_id)
+        while current:
+            if current.data == task:
+                if previous is None:
+                    self[event_id] = current.next
+                else:
+                    previous.next = current.next # Skip the node to remove
+                return current.completed
+            previous = current
+            current = current.next
+        return None
+
+    def complete_first(self, event_id: int, task: str) -> Optional[bool]:
+        """
+        Marks the first task with the given description as complete.
+        :return: True if it was newly completed, False if already complete, None if not found.
+        """
+        current = self.get(event_id)
+        while current:
+            if current.data == task:
+                if current.completed:
+                    return False
+                current.completed = True
+                return True
+            current = current.next
+        return None
+
+    def complete_where(self, event_id: int, matches: Callable[[str], bool]) -> int:
+        """Marks every incomplete matching task as complete. Returns how many changed."""
+        count = 0
+        current = self.get(event_id)
+        while current:
+            if not current.completed and matches(current.data):
+                current.completed = True
+                count += 1
+            current = current.next
+        return count
+
+    def remove_where(self, event_id: int, matches: Callable[[str], bool]) -> Tuple[int, int]:
+        """
+        Removes every matching task in a single pass.
+        :return: (tasks removed, incomplete tasks among them).
+        """
+        removed = 0
+        open_removed = 0
+        new_head = None
+        tail = None
+        current = self.get(event_id)
+        while current:
+            next_node = current.next
+            if matches(current.data):
+                removed += 1
+                if not current.completed:
+                    open_removed += 1
+            else:
+                # Relink surviving nodes behind the last kept node
+                current.next = None
+                if new_head is None:
+                    new_head = current
+                else:
+                    tail.next = current
+                tail = current
+            current = next_node
+        self[event_id] = new_head
+        return removed, open_removed
+
 # Node for Binary Search Tree - Keeping it here as per your provided code structure
 class BSTNode:
     def __init__(self, event: Event):
@@ -63,19 +198,76 @@ class BSTNode:
         self.event = event
         self.left = None
         self.right = None
+        self.size = 1  # Number of nodes in this subtree, for positional access (see events_slice)
+
+# Read-only copy of a planner's state, for work done off the Tk thread (see EventPlanner.freeze)
+class PlannerSnapshot:
+    """
+    Holds copies of the events, task lists, undo stack, reminder queue and execution log of an
+    EventPlanner, with the attribute names and read methods reports use, so it can stand in for
+    the planner while the original keeps changing on another thread.
+    """
+
+    def __init__(self, events: List[Event], todo_lists: dict, edit_stack: List[Event],
+                 reminder_queue: List[Event], execution_log: dict):
+        self._events = events  # Chronological
+        self._events_by_id = {event.event_id: event for event in events}
+        self.todo_lists = todo_lists  # {event_id: LLNode chain or None}
+        self.edit_stack = edit_stack
+        self.reminder_queue = reminder_queue
+        self.execution_log = execution_log
+        self.taken_at = datetime.datetime.now()
+
+    def view_events(self, upcoming: bool = True) -> List[Event]:
+        """Returns the upcoming or past events (relative to now) in chronological order."""
+        now = datetime.datetime.now()
+        return [event for event in self._events
+                if (EventPlanner._get_datetime(event.date, event.time) >= now) == upcoming]
+
+    def view_reminder_queue(self) -> List[Event]:
+        """Returns a copy of the reminder queue."""
+        return self.reminder_queue.copy()
 
 # Event Planner class integrating BST, Stack, Linked List, and Queue
 class EventPlanner:
-    def __init__(self, initial_event_id_counter: int = 1):
+    def __init__(self, initial_event_id_counter: int = 1, compact_tasks: bool = False):
         """
         Initializes the EventPlanner with various data structures.
         :param initial_event_id_counter: The starting ID for new events, typically max_id + 1 from DB.
+        :param compact_tasks: If True, store tasks in array columns (CompactTaskStore) instead of
+                              LLNode chains. Trades a little speed for much lower memory per task.
         """
         self.bst_root = None  # BST for events (for ordered retrieval by date/time)
         self._events_by_id = {} # Dictionary for O(1) event lookup by ID
         self.edit_stack = []  # Stack for recently edited events, max 10
-        self.todo_lists = {}  # {event_id: LLNode} for tasks
+        if compact_tasks:
+            from data_structures.compact_task_store import CompactTaskStore
+            self.todo_lists = CompactTaskStore()  # {event_id: task chain} backed by arrays
+        else:
+            self.todo_lists = LinkedTaskStore()  # {event_id: LLNode} for tasks
         self.reminder_queue = []  # Queue for events with reminders
+        self._open_task_counts = {}  # {event_id: number of incomplete tasks}
+        self._open_task_index = []  # Sorted [(datetime, event_id)] of events with incomplete tasks
+        self._open_task_keys = {}  # {event_id: key currently stored in _open_task_index}
+        # Word index for prefix searches, built on the first search and kept in sync afterwards
+        self._word_index = None  # {word: sorted [(datetime, event_id)]} over names, locations and attendees
+        self._words = []  # Sorted keys of _word_index, for prefix ranges
+        self._word_keys = {}  # {event_id: (datetime, words)} currently stored in _word_index
+
+        # Dirty tracking for incremental persistence (see flush)
+        self._dirty_events = set()  # Event IDs created or modified since the last flush
+        self._deleted_events = set()  # Event IDs deleted since the last flush
+        self._dirty_task_lists = set()  # Event IDs whose task list changed since the last flush
+        self._view_changes = set()  # Event IDs created, modified or deleted since take_view_changes
+
+        # Windowed loading (see load_window): events older than window_start live on disk
+        # and are faulted in one calendar month ("cold page") at a time
+        self.window_start = None  # None means the whole history is in memory
+        self.max_cold_pages = 12
+        self._window_source = None  # DBManager used to fault in cold pages
+        self._cold_pages = OrderedDict()  # {(year, month): {evictable event_id}} in LRU order
+        self._cold_page_of = {}  # {event_id: (year, month)} for evictable cold events
+        self._tombstones = set()  # Event IDs deleted while windowed, never faulted back in
         self.event_id_counter = initial_event_id_counter # Starts from 1 or max_id + 1 from DB
         
         # Execution tracking for reporting
@@ -99,6 +291,232 @@ class EventPlanner:
         }
         self.execution_log[data_structure].append(execution_record)
 
+    def _mark_event_dirty(self, event_id: int) -> None:
+        """Records that an event was created or modified since the last flush."""
+        self._deleted_events.discard(event_id)
+        self._dirty_events.add(event_id)
+        self._view_changes.add(event_id)
+        self._pin_event(event_id)
+        self._reindex_words(event_id)
+
+    def _mark_event_deleted(self, event_id: int) -> None:
+        """Records that an event (and therefore its tasks) was deleted since the last flush."""
+        self._dirty_events.discard(event_id)
+        self._dirty_task_lists.discard(event_id)
+        self._deleted_events.add(event_id)
+        self._view_changes.add(event_id)
+        self._pin_event(event_id)
+        self._reindex_words(event_id)
+        if self.window_start is not None:
+            self._tombstones.add(event_id)
+
+    def _mark_tasks_dirty(self, event_id: int) -> None:
+        """Records that an event's task list changed since the last flush."""
+        self._dirty_task_lists.add(event_id)
+        self._pin_event(event_id)
+
+    def _pin_event(self, event_id: int) -> None:
+        """
+        Keeps a changed cold event resident for the rest of the session.
+        Its page may still be evicted, but the event itself is never dropped, so an edit that
+        has not reached the database yet can't be lost or overwritten by a stale reload.
+        """
+        key = self._cold_page_of.pop(event_id, None)
+        if key is not None:
+            self._cold_pages[key].discard(event_id)
+
+    def mark_all_dirty(self) -> None:
+        """Marks every event and task list as changed, so the next flush rewrites everything."""
+        self._dirty_events.update(self._events_by_id)
+        self._dirty_task_lists.update(self._events_by_id)
+
+    def take_view_changes(self) -> Set[int]:
+        """
+        Returns and clears the IDs of events created, modified or deleted since the last call,
+        so a view can update just those rows. Unlike collect_changes this is independent of
+        persistence, and events faulted in or evicted by windowed loading are not reported.
+        """
+        changes, self._view_changes = self._view_changes, set()
+        return changes
+
+    def has_unsaved_changes(self) -> bool:
+        """Returns True if anything changed since the last flush."""
+        return bool(self._dirty_events or self._deleted_events or self._dirty_task_lists)
+
+    def collect_changes(self) -> PlannerChanges:
+        """
+        Snapshots and clears the changes recorded since the last call.
+        Events are copied and task lists converted to (task, completed) tuples, so the result
+        stays valid while the planner keeps being modified.
+        :return: A PlannerChanges describing the delta.
+        """
+        changes = PlannerChanges(
+            events=[self._events_by_id[event_id].__copy__()
+                    for event_id in self._dirty_events if event_id in self._events_by_id],
+            deleted_event_ids=sorted(self._deleted_events),
+            task_lists={event_id: list(self.todo_lists.iter_tasks(event_id))
+                        for event_id in self._dirty_task_lists if event_id in self._events_by_id},
+        )
+        self._dirty_events.clear()
+        self._deleted_events.clear()
+        self._dirty_task_lists.clear()
+        return changes
+
+    def _restore_changes(self, changes: PlannerChanges) -> None:
+        """Re-marks the contents of an unsaved PlannerChanges so a later flush retries them."""
+        for event in changes.events:
+            if event.event_id not in self._deleted_events:
+                self._dirty_events.add(event.event_id)
+        for event_id in changes.deleted_event_ids:
+            if event_id not in self._events_by_id:
+                self._deleted_events.add(event_id)
+        for event_id in changes.task_lists:
+            if event_id in self._events_by_id:
+                self._dirty_task_lists.add(event_id)
+
+    def flush(self, db_manager) -> PlannerChanges:
+        """
+        Writes only what changed since the last flush to the database, in one transaction.
+        The cost is proportional to the number of edits, not to the size of the calendar.
+        If the write fails, the changes stay recorded and the error is re-raised.
+        :param db_manager: A DBManager (anything with apply_changes(PlannerChanges)).
+        :return: The PlannerChanges that were written.
+        """
+        changes = self.collect_changes()
+        if changes.is_empty():
+            return changes
+        try:
+            db_manager.apply_changes(changes)
+        except Exception:
+            self._restore_changes(changes)
+            raise
+        logger.info(f"Flushed {len(changes.events)} events, {len(changes.deleted_event_ids)} deletions "
+                    f"and {len(changes.task_lists)} task lists.")
+        return changes
+
+    def _adjust_open_tasks(self, event_id: int, delta: int) -> None:
+        """
+        Updates the incomplete-task counter of an event and keeps the open-task index in sync.
+        An event enters the index when its counter becomes positive and leaves it when it drops to zero.
+        :param event_id: The ID of the event whose counter changes.
+        :param delta: The change in the number of incomplete tasks.
+        """
+        if not delta:
+            return
+        count = self._open_task_counts.get(event_id, 0) + delta
+        if count > 0:
+            self._open_task_counts[event_id] = count
+            if event_id not in self._open_task_keys:
+                self._index_open_event(event_id)
+        else:
+            self._open_task_counts.pop(event_id, None)
+            self._unindex_open_event(event_id)
+
+    def _index_open_event(self, event_id: int) -> None:
+        """Inserts an event into the chronological open-task index."""
+        event = self._events_by_id[event_id]
+        key = (self._get_datetime(event.date, event.time), event_id)
+        bisect.insort(self._open_task_index, key)
+        self._open_task_keys[event_id] = key
+
+    def _unindex_open_event(self, event_id: int) -> None:
+        """Removes an event from the chronological open-task index, if present."""
+        key = self._open_task_keys.pop(event_id, None)
+        if key is not None:
+            position = bisect.bisect_left(self._open_task_index, key)
+            del self._open_task_index[position]
+
+    def _reindex_open_event(self, event_id: int) -> None:
+        """Re-keys an event in the open-task index after its date or time changed."""
+        if event_id in self._open_task_keys:
+            self._unindex_open_event(event_id)
+            self._index_open_event(event_id)
+
+    def _forget_open_tasks(self, event_id: int) -> None:
+        """Drops all open-task bookkeeping for an event that is leaving the planner."""
+        self._open_task_counts.pop(event_id, None)
+        self._unindex_open_event(event_id)
+
+    @staticmethod
+    def _search_words(event: Event) -> Tuple[str, ...]:
+        """Returns the distinct lowercase words of an event's name, location and attendees, sorted."""
+        text = " ".join((event.name or "", event.location or "", event.attendees or ""))
+        return tuple(sorted(set(_WORD_PATTERN.findall(text.casefold()))))
+
+    def _word_entries(self, event_ids: Iterable[int]) -> dict:
+        """Records the word index keys of resident events. Returns {word: [(datetime, event_id)]}."""
+        entries = {}
+        for event_id in event_ids:
+            event = self._events_by_id.get(event_id)
+            if event is None:
+                continue
+            key = (self._get_datetime(event.date, event.time), event_id)
+            words = self._search_words(event)
+            self._word_keys[event_id] = (key[0], words)
+            for word in words:
+                entries.setdefault(word, []).append(key)
+        return entries
+
+    def _add_words(self, event_ids: Iterable[int]) -> None:
+        """
+        Adds events to the word index (if built). Posting lists are replaced rather than modified,
+        so searches still iterating over the old lists (iter_search_prefix) are not disturbed.
+        """
+        if self._word_index is None:
+            return
+        for word, keys in self._word_entries(event_ids).items():
+            postings = self._word_index.get(word)
+            if postings is None:
+                bisect.insort(self._words, word)
+                self._word_index[word] = sorted(keys)
+            elif len(keys) == 1:
+                postings = postings.copy()
+                bisect.insort(postings, keys[0])
+                self._word_index[word] = postings
+            else:
+                self._word_index[word] = list(heapq.merge(postings, sorted(keys)))
+
+    def _remove_words(self, event_ids: Iterable[int]) -> None:
+        """Removes events from the word index (if built), replacing the posting lists they were in."""
+        if self._word_index is None:
+            return
+        removed = {}  # {word: {(datetime, event_id)}}
+        for event_id in event_ids:
+            keys = self._word_keys.pop(event_id, None)
+            if keys is not None:
+                event_dt, words = keys
+                for word in words:
+                    removed.setdefault(word, set()).add((event_dt, event_id))
+        for word, keys in removed.items():
+            postings = self._word_index[word]
+            if len(keys) == 1:
+                position = bisect.bisect_left(postings, next(iter(keys)))
+                postings = postings[:position] + postings[position + 1:]
+            else:
+                postings = [key for key in postings if key not in keys]
+            if postings:
+                self._word_index[word] = postings
+            else:
+                del self._word_index[word]
+                del self._words[bisect.bisect_left(self._words, word)]
+
+    def _reindex_words(self, event_id: int) -> None:
+        """Re-keys an event in the word index after it changed, was created or deleted."""
+        if self._word_index is not None:
+            self._remove_words((event_id,))
+            self._add_words((event_id,))
+
+    def _set_tasks_for_loading(self, event_id: int, tasks_ll_head: Optional[LLNode]) -> None:
+        """
+        Attaches a task linked list loaded from the database to an event and counts its open tasks.
+        :param event_id: The ID of an event already added with `_add_event_for_loading`.
+        :param tasks_ll_head: The head of the loaded task linked list, or None.
+        """
+        self._forget_open_tasks(event_id)
+        self.todo_lists[event_id] = tasks_ll_head
+        open_count = sum(1 for _, completed in self.todo_lists.iter_tasks(event_id) if not completed)
+        self._adjust_open_tasks(event_id, open_count)
+
     @staticmethod
     def _get_datetime(date: str, time: str) -> datetime.datetime:
         """
@@ -108,6 +526,12 @@ class EventPlanner:
         :return: A datetime object.
         :raises ValueError: If the date or time format is invalid.
         """
+        # Fast path for the canonical zero-padded form; anything else goes through strptime
+        if len(date) == 10 and len(time) == 5 and date[4] == date[7] == '-' and time[2] == ':':
+            try:
+                return datetime.datetime.fromisoformat(f"{date} {time}")
+            except ValueError:
+                pass
         try:
             dt = datetime.datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M")
             logger.debug(f"Parsed datetime: {date} {time} -> {dt}")
@@ -159,6 +583,7 @@ class EventPlanner:
             self.edit_stack.pop(0) # Maintain stack limit
         self._log_execution('stack', 'PUSH', f'Event "{name}" (ID: {event.event_id}) state pushed to edit stack')
             
+        self._mark_event_dirty(event.event_id)
         self.event_id_counter += 1
         logger.info(f"Event created: ID={event.event_id}")
         return event
@@ -177,8 +602,331 @@ class EventPlanner:
             self.todo_lists[event.event_id] = None 
         if event.reminder_set and event not in self.reminder_queue:
             self.reminder_queue.append(event)
+        self._reindex_words(event.event_id)
         # Do NOT increment event_id_counter or push to edit_stack here
 
+    def bulk_load(self, rows: Iterable[Tuple[Event, Optional[LLNode]]]) -> int:
+        """
+        Loads many events and their task lists (e.g. from DBManager.load_all) in a single pass.
+        When the planner is empty and rows arrive in chronological order, the BST is built
+        balanced directly from the sorted events instead of by repeated insertion.
+        Like _add_event_for_loading, this has no undo, logging or persistence side effects.
+        :param rows: An iterable of (Event, head of task linked list or None).
+        :return: The number of events loaded.
+        """
+        build_balanced = self.bst_root is None
+        sorted_events = []
+        previous_dt = None
+        loaded = 0
+        loaded_ids = [] if self._word_index is not None else None
+        for event, tasks_ll_head in rows:
+            event_dt = self._get_datetime(event.date, event.time)
+            if build_balanced and previous_dt is not None and event_dt < previous_dt:
+                # Input is not chronological: insert what we have so far and fall back to per-event inserts
+                for pending in sorted_events:
+                    self._insert_bst(pending)
+                sorted_events = []
+                build_balanced = False
+            previous_dt = event_dt
+
+            self._events_by_id[event.event_id] = event
+            if build_balanced:
+                sorted_events.append(event)
+            else:
+                self._insert_bst(event)
+            if event.reminder_set:
+                self.reminder_queue.append(event)
+            self._set_tasks_for_loading(event.event_id, tasks_ll_head)
+            if loaded_ids is not None:
+                loaded_ids.append(event.event_id)
+            loaded += 1
+
+        if build_balanced and sorted_events:
+            self.bst_root = self._build_balanced_bst(sorted_events, 0, len(sorted_events) - 1)
+        if loaded_ids:
+            self._remove_words(loaded_ids)
+            self._add_words(loaded_ids)
+        logger.info(f"Bulk-loaded {loaded} events into planner.")
+        return loaded
+
+    def _build_balanced_bst(self, events: List[Event], low: int, high: int) -> Optional[BSTNode]:
+        """Builds a height-balanced BST from chronologically sorted events[low..high]."""
+        if low > high:
+            return None
+        middle = (low + high) // 2
+        node = BSTNode(events[middle])
+        node.left = self._build_balanced_bst(events, low, middle - 1)
+        node.right = self._build_balanced_bst(events, middle + 1, high)
+        node.size = high - low + 1
+        return node
+
+    def _inorder_events(self) -> List[Event]:
+        """Returns the events currently in the BST in chronological order (iteratively, without recursion)."""
+        events, stack, node = [], [], self.bst_root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            events.append(node.event)
+            node = node.right
+        return events
+
+    def _rebuild_bst(self, extra_events: Iterable[Event] = (), drop: Iterable[int] = ()) -> None:
+        """
+        Rebuilds a balanced BST from the current tree, merged with chronologically sorted
+        extra_events and without the event IDs in drop. Nodes whose event is no longer the
+        live object in _events_by_id are discarded as well.
+        """
+        drop = set(drop)
+        current = [event for event in self._inorder_events()
+                   if event.event_id not in drop and self._events_by_id.get(event.event_id) is event]
+        merged = list(heapq.merge(current, extra_events, key=lambda e: self._get_datetime(e.date, e.time)))
+        self.bst_root = self._build_balanced_bst(merged, 0, len(merged) - 1)
+
+    def _prefers_rebuild(self, changed: int) -> bool:
+        """
+        Returns True if changing `changed` nodes one at a time (about log n steps each) would
+        cost more than rebuilding the whole tree (about n steps).
+        """
+        size = self._subtree_size(self.bst_root)
+        return changed * max(1, size.bit_length()) >= size
+
+    def _insert_sorted_bst(self, events: List[Event]) -> None:
+        """
+        Inserts chronologically sorted events into the BST one at a time, medians first, so a
+        run of consecutive events lands as a balanced subtree instead of a chain.
+        """
+        ranges = deque([(0, len(events) - 1)])
+        while ranges:
+            low, high = ranges.popleft()
+            if low > high:
+                continue
+            mid = (low + high) // 2
+            self._insert_bst(events[mid])
+            ranges.append((low, mid - 1))
+            ranges.append((mid + 1, high))
+
+    # --- Windowed loading ---
+    def load_window(self, db_manager, past_days: int = 30, max_cold_pages: int = 12,
+                    now: Optional[datetime.datetime] = None) -> int:
+        """
+        Loads only the hot window into an empty planner: events from the last `past_days` days
+        and every future event. Older events stay on disk until ensure_loaded faults them in,
+        one calendar month (cold page) at a time, keeping at most `max_cold_pages` months
+        in memory and evicting the least recently used.
+        :param db_manager: A DBManager (anything with load_range(start, end)).
+        :param past_days: How many days of history to keep in the hot window.
+        :param max_cold_pages: Maximum number of older months held in memory at once.
+        :param now: The reference time for the window (defaults to the current time).
+        :return: The number of events loaded.
+        """
+        now = now or datetime.datetime.now()
+        window_start = datetime.datetime.combine((now - datetime.timedelta(days=past_days)).date(), datetime.time())
+        return self.restore_window(db_manager, window_start, db_manager.load_range(start=window_start), max_cold_pages)
+
+    def restore_window(self, db_manager, window_start: datetime.datetime,
+                       rows: Iterable[Tuple[Event, Optional[LLNode]]], max_cold_pages: int = 12) -> int:
+        """
+        Loads an already selected hot window into an empty planner, e.g. one read back from a
+        snapshot: rows must hold every event from window_start onwards, in chronological order.
+        Older events are faulted in from db_manager on demand, as with load_window.
+        :param db_manager: A DBManager (anything with load_range(start, end)).
+        :param window_start: The oldest datetime covered by rows.
+        :param rows: An iterable of (Event, head of task linked list or None).
+        :param max_cold_pages: Maximum number of older months held in memory at once.
+        :return: The number of events loaded.
+        """
+        self._window_source = db_manager
+        self.max_cold_pages = max_cold_pages
+        self.window_start = window_start
+        loaded = self.bulk_load(rows)
+        logger.info(f"Loaded hot window from {self.window_start:%Y-%m-%d}: {loaded} events.")
+        return loaded
+
+    def window_rows(self) -> Iterator[Tuple[Event, List[Tuple[str, bool]]]]:
+        """
+        Yields the hot window (every resident event if the planner is not windowed) in
+        chronological order with its tasks, in the form restore_window accepts after the task
+        lists are chained. Faulted-in older months are left out, since they reload on demand.
+        """
+        for event in self._inorder_events():
+            if self._events_by_id.get(event.event_id) is not event:
+                continue
+            if self.window_start is not None and self._get_datetime(event.date, event.time) < self.window_start:
+                continue
+            yield event, list(self.todo_lists.iter_tasks(event.event_id))
+
+    @staticmethod
+    def _page_bounds(key: Tuple[int, int]) -> Tuple[datetime.datetime, datetime.datetime]:
+        """Returns the [start, end) datetimes of a (year, month) cold page."""
+        year, month = key
+        return datetime.datetime(year, month, 1), datetime.datetime(year + month // 12, month % 12 + 1, 1)
+
+    def ensure_loaded(self, start: datetime.datetime, end: Optional[datetime.datetime] = None) -> int:
+        """
+        Makes sure every event between start and end (inclusive) is in memory, faulting in the
+        cold pages that are not resident through indexed range queries.
+        :param start: Earliest datetime needed.
+        :param end: Latest datetime needed, or None for everything up to the hot window.
+        :return: The number of events loaded from the database.
+        """
+        if self.window_start is None or start >= self.window_start:
+            return 0
+        stop = self.window_start if end is None else min(end, self.window_start)
+        wanted = []
+        year, month = start.year, start.month
+        while datetime.datetime(year, month, 1) <= stop:
+            wanted.append((year, month))
+            year, month = year + month // 12, month % 12 + 1
+
+        loaded = 0
+        for key in wanted:
+            if key in self._cold_pages:
+                self._cold_pages.move_to_end(key)
+            else:
+                loaded += self._load_cold_page(key)
+        self._evict_cold_pages(keep=len(wanted))
+        return loaded
+
+    def _load_cold_page(self, key: Tuple[int, int]) -> int:
+        """Loads one month of events older than the hot window. Returns the number of events added."""
+        page_start, page_end = self._page_bounds(key)
+        page_events = []
+        for event, tasks_ll_head in self._window_source.load_range(page_start, min(page_end, self.window_start)):
+            # Skip events already resident (created or edited in memory) and deletions not yet on disk
+            if event.event_id in self._events_by_id or event.event_id in self._tombstones:
+                continue
+            self._events_by_id[event.event_id] = event
+            self._set_tasks_for_loading(event.event_id, tasks_ll_head)
+            self._cold_page_of[event.event_id] = key
+            page_events.append(event)
+        self._cold_pages[key] = {event.event_id for event in page_events}
+        if page_events:
+            if self._prefers_rebuild(len(page_events)):
+                self._rebuild_bst(extra_events=page_events)
+            else:
+                self._insert_sorted_bst(page_events)
+            self._add_words(event.event_id for event in page_events)
+        logger.info(f"Faulted in {len(page_events)} events for {key[0]}-{key[1]:02d}.")
+        return len(page_events)
+
+    def _evict_cold_pages(self, keep: int = 0) -> None:
+        """Drops least recently used cold pages beyond max_cold_pages (but never the `keep` most recent)."""
+        limit = max(self.max_cold_pages, keep)
+        evicted = set()
+        evicted_dts = []
+        while len(self._cold_pages) > limit:
+            key, event_ids = self._cold_pages.popitem(last=False)
+            for event_id in event_ids:
+                del self._cold_page_of[event_id]
+                event = self._events_by_id.pop(event_id)
+                evicted_dts.append((event_id, self._get_datetime(event.date, event.time)))
+                self.todo_lists.pop(event_id, None)
+                self._forget_open_tasks(event_id)
+            evicted |= event_ids
+            logger.info(f"Evicted cold page {key[0]}-{key[1]:02d} ({len(event_ids)} events).")
+        if evicted:
+            if self._prefers_rebuild(len(evicted)):
+                self._rebuild_bst(drop=evicted)
+            else:
+                for event_id, event_dt in evicted_dts:
+                    self.bst_root = self._delete_bst_node(self.bst_root, event_id, event_dt)
+            self._remove_words(evicted)
+
+    def events_between(self, start: datetime.datetime, end: datetime.datetime) -> List[Event]:
+        """
+        Returns the events between two datetimes (inclusive) in chronological order,
+        faulting in any cold pages the range needs first.
+        :param start: Earliest event datetime to include.
+        :param end: Latest event datetime to include.
+        :return: A list of Event objects.
+        """
+        self.ensure_loaded(start, end)
+        events = []
+        for event in self._inorder_events():
+            event_dt = self._get_datetime(event.date, event.time)
+            if event_dt > end:
+                break
+            if event_dt >= start and self._events_by_id.get(event.event_id) is event:
+                events.append(event)
+        return events
+
+    def get_event(self, event_id: int) -> Optional[Event]:
+        """Returns the in-memory event with the given ID, or None."""
+        return self._events_by_id.get(event_id)
+
+    # --- Positional access (for virtual scrolling) ---
+    def event_count(self) -> int:
+        """Returns the number of events in the BST."""
+        return self._subtree_size(self.bst_root)
+
+    def count_before(self, when: datetime.datetime) -> int:
+        """
+        Returns the number of events before a datetime, i.e. the position of the first event at or after it.
+        :param when: The datetime to compare against.
+        """
+        count, node = 0, self.bst_root
+        while node:
+            if self._get_datetime(node.event.date, node.event.time) < when:
+                count += self._subtree_size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+    def events_slice(self, start: int, count: int) -> List[Event]:
+        """
+        Returns up to `count` events in chronological order, starting at position `start`.
+        Runs in O(height + count): the walk descends to `start` by subtree sizes instead of
+        traversing everything before it.
+        :param start: Position of the first event (0 is the earliest).
+        :param count: Maximum number of events to return.
+        :return: A list of Event objects.
+        """
+        return list(itertools.islice(self._iter_from(start), max(count, 0)))
+
+    def _iter_from(self, start: int) -> Iterator[Event]:
+        """Yields the events in chronological order from position `start` onwards."""
+        stack, node = [], self.bst_root
+        position = max(start, 0)
+        # Descend to the start position, keeping the nodes still to be visited after it
+        while node:
+            left_size = self._subtree_size(node.left)
+            if position < left_size:
+                stack.append(node)
+                node = node.left
+            elif position == left_size:
+                stack.append(node)
+                break
+            else:
+                position -= left_size + 1
+                node = node.right
+        while stack:
+            node = stack.pop()
+            yield node.event
+            node = node.right
+            while node:
+                stack.append(node)
+                node = node.left
+
+    def position_of(self, event_id: int) -> Optional[int]:
+        """
+        Returns the chronological position of an event, or None if it is not in memory.
+        :param event_id: The ID of the event.
+        """
+        event = self._events_by_id.get(event_id)
+        if event is None:
+            return None
+        position = self.count_before(self._get_datetime(event.date, event.time))
+        # Events sharing the datetime follow in tree order; find this one among them
+        for offset, candidate in enumerate(self._iter_from(position)):
+            if candidate.event_id == event_id:
+                return position + offset
+            if candidate.date != event.date or candidate.time != event.time:
+                break
+        return None
+
     def _insert_bst(self, event: Event) -> None:
         """
         Inserts an event into the Binary Search Tree based on its date and time.
@@ -196,6 +944,7 @@ class EventPlanner:
         event_dt = self._get_datetime(event.date, event.time)
         node_dt = self._get_datetime(node.event.date, node.event.time)
 
+        node.size += 1
         if event_dt < node_dt:
             if node.left is None:
                 node.left = BSTNode(event)
@@ -282,15 +1031,18 @@ class EventPlanner:
         # So, we delete the old node and re-insert the updated event.
         if date_time_changed:
             logger.debug(f"Date/time changed for event {event_id}. Re-inserting into BST.")
-            self.bst_root = self._delete_bst_node(self.bst_root, event_id) # Remove old node by ID
+            old_dt = self._get_datetime(old_event_state.date, old_event_state.time)
+            self.bst_root = self._delete_bst_node(self.bst_root, event_id, old_dt) # Remove old node by its old position
             self._insert_bst(event_to_update) # Insert updated event
             self._log_execution('bst', 'UPDATE', f'Event "{event_to_update.name}" (ID: {event_id}) re-inserted into BST due to time change')
+            self._reindex_open_event(event_id)
         
         # Push the *original* state of the event to the undo stack
         self.edit_stack.append(old_event_state)
         if len(self.edit_stack) > 10:
             self.edit_stack.pop(0) # Maintain stack limit by removing oldest
 
+        self._mark_event_dirty(event_id)
         logger.info(f"Event {event_id} updated.")
         return event_to_update
 
@@ -313,23 +1065,28 @@ class EventPlanner:
         return self._find_event_in_bst_recursive(node.right, event_id)
 
 
-    def _delete_bst_node(self, node: Optional[BSTNode], event_id: int) -> Optional[BSTNode]:
+    def _delete_bst_node(self, node: Optional[BSTNode], event_id: int,
+                         event_dt: Optional[datetime.datetime] = None) -> Optional[BSTNode]:
         """
         Deletes an event from the Binary Search Tree based on its event_id.
+        The tree is ordered by date/time, so the search follows the event's datetime and
+        checks both subtrees only where several events share it.
         Handles nodes with zero, one, or two children.
         :param node: The current BSTNode being considered.
         :param event_id: The ID of the event to delete.
+        :param event_dt: The datetime the event was inserted with; looked up from the
+                         planner's events if omitted (pass it when the event was just rescheduled).
         :return: The new root of the (sub)tree after deletion.
         """
         if not node:
             return None
+        if event_dt is None:
+            event = self._events_by_id.get(event_id)
+            if event is None:
+                return node
+            event_dt = self._get_datetime(event.date, event.time)
 
-        # Traverse the BST to find the node to delete based on event_id
-        if event_id < node.event.event_id: 
-            node.left = self._delete_bst_node(node.left, event_id)
-        elif event_id > node.event.event_id:
-            node.right = self._delete_bst_node(node.right, event_id)
-        else: # node.event.event_id == event_id, this is the node to delete
+        if node.event.event_id == event_id: # This is the node to delete
             logger.debug(f"Found node to delete: Event ID={event_id}")
             # Case 1: Node has no left child (or no children)
             if not node.left:
@@ -337,16 +1094,34 @@ class EventPlanner:
             # Case 2: Node has no right child
             elif not node.right:
                 return node.left
-            
+
             # Case 3: Node has two children
             # Find the inorder successor (smallest in the right subtree)
             successor = self._find_min(node.right)
             # Copy the successor's event data to this node
-            node.event = successor.event 
+            node.event = successor.event
             # Delete the inorder successor from the right subtree
-            node.right = self._delete_bst_node(node.right, successor.event.event_id)
+            node.right = self._delete_bst_node(node.right, successor.event.event_id,
+                                               self._get_datetime(successor.event.date, successor.event.time))
+        else:
+            node_dt = self._get_datetime(node.event.date, node.event.time)
+            if event_dt < node_dt:
+                node.left = self._delete_bst_node(node.left, event_id, event_dt)
+            elif event_dt > node_dt:
+                node.right = self._delete_bst_node(node.right, event_id, event_dt)
+            else: # Equal datetimes can sit on either side
+                left_size = self._subtree_size(node.left)
+                node.left = self._delete_bst_node(node.left, event_id, event_dt)
+                if self._subtree_size(node.left) == left_size:
+                    node.right = self._delete_bst_node(node.right, event_id, event_dt)
+        node.size = 1 + self._subtree_size(node.left) + self._subtree_size(node.right)
         return node
 
+    @staticmethod
+    def _subtree_size(node: Optional[BSTNode]) -> int:
+        """Returns the number of nodes in a BST subtree."""
+        return node.size if node else 0
+
     def _find_min(self, node: BSTNode) -> BSTNode:
         """
         Finds the node with the minimum event (earliest date/time) in a BST subtree.
@@ -381,6 +1156,7 @@ class EventPlanner:
         
         # Remove associated linked list tasks
         self.todo_lists.pop(event_id, None)
+        self._forget_open_tasks(event_id)
         self._log_execution('linked_list', 'DELETE_ALL', f'All tasks deleted for Event ID: {event_id}')
         
         # Remove from reminder queue if present
@@ -389,9 +1165,31 @@ class EventPlanner:
             self.reminder_queue = [e for e in self.reminder_queue if e.event_id != event_id]
             self._log_execution('queue', 'DEQUEUE', f'Event "{event_to_delete.name}" (ID: {event_id}) removed from reminder queue')
 
+        self._mark_event_deleted(event_id)
         logger.info(f"Event {event_id} deleted.")
         return True
 
+    def freeze(self) -> PlannerSnapshot:
+        """
+        Copies the state reports read into a PlannerSnapshot, e.g. to build a report on a worker
+        thread. Copying is O(events + tasks) and must happen on the thread that modifies the planner.
+        :return: A PlannerSnapshot independent of later changes to this planner.
+        """
+        events = [event.__copy__() for event in self._inorder_events()
+                  if self._events_by_id.get(event.event_id) is event]
+        copies = {event.event_id: event for event in events}
+        todo_lists = {}
+        for event_id in self.todo_lists.keys():
+            head = None
+            for description, completed in reversed(list(self.todo_lists.iter_tasks(event_id))):
+                node = LLNode(description, completed)
+                node.next = head
+                head = node
+            todo_lists[event_id] = head
+        reminder_queue = [copies.get(event.event_id) or event.__copy__() for event in self.reminder_queue]
+        return PlannerSnapshot(events, todo_lists, [event.__copy__() for event in self.edit_stack], reminder_queue,
+                               {structure: list(records) for structure, records in self.execution_log.items()})
+
     def view_events(self, upcoming: bool = True) -> List[Event]:
         """
         Retrieves events from the BST in chronological order, filtered by upcoming or past.
@@ -433,14 +1231,9 @@ class EventPlanner:
             logger.warning(f"Event {event_id} not found for adding task.")
             return False
         
-        new_node = LLNode(task)
-        if self.todo_lists.get(event_id) is None:
-            self.todo_lists[event_id] = new_node # First task for this event
-        else:
-            current = self.todo_lists[event_id]
-            while current.next:
-                current = current.next
-            current.next = new_node # Append to end of linked list
+        self.todo_lists.append(event_id, (task,))
+        self._adjust_open_tasks(event_id, 1)
+        self._mark_tasks_dirty(event_id)
         logger.info(f"Task '{task}' added to event {event_id}.")
         self._log_execution('linked_list', 'ADD', f'Task "{task}" added to Event ID: {event_id}')
         return True
@@ -457,24 +1250,17 @@ class EventPlanner:
             logger.warning(f"Event {event_id} or task list not found.")
             return False
         
-        head = self.todo_lists[event_id]
-        # If head node is the task to remove
-        if head and head.data == task: # Check head is not None
-            self.todo_lists[event_id] = head.next
-            logger.info(f"Task '{task}' removed from event {event_id}.")
-            self._log_execution('linked_list', 'REMOVE', f'Task "{task}" removed from Event ID: {event_id}')
-            return True
-        
-        current = head
-        while current and current.next: # Ensure current and current.next are not None
-            if current.next.data == task:
-                current.next = current.next.next # Skip the node to remove
-                logger.info(f"Task '{task}' removed from event {event_id}.")
-                return True
-            current = current.next
-        
-        logger.warning(f"Task '{task}' not found in event {event_id}'s task list.")
-        return False
+        was_completed = self.todo_lists.remove_first(event_id, task)
+        if was_completed is None:
+            logger.warning(f"Task '{task}' not found in event {event_id}'s task list.")
+            return False
+
+        if not was_completed:
+            self._adjust_open_tasks(event_id, -1)
+        self._mark_tasks_dirty(event_id)
+        logger.info(f"Task '{task}' removed from event {event_id}.")
+        self._log_execution('linked_list', 'REMOVE', f'Task "{task}" removed from Event ID: {event_id}')
+        return True
 
     def mark_task_complete(self, event_id: int, task: str) -> bool:
         """
@@ -488,17 +1274,91 @@ class EventPlanner:
             logger.warning(f"Event {event_id} or task list not found.")
             return False
         
-        current = self.todo_lists[event_id]
-        while current:
-            if current.data == task:
-                current.completed = True
-                logger.info(f"Task '{task}' marked complete for event {event_id}.")
-                self._log_execution('linked_list', 'MARK_COMPLETE', f'Task "{task}" marked complete for Event ID: {event_id}')
-                return True
-            current = current.next
-        
-        logger.warning(f"Task '{task}' not found in event {event_id}'s task list.")
-        return False
+        newly_completed = self.todo_lists.complete_first(event_id, task)
+        if newly_completed is None:
+            logger.warning(f"Task '{task}' not found in event {event_id}'s task list.")
+            return False
+
+        if newly_completed:
+            self._adjust_open_tasks(event_id, -1)
+            self._mark_tasks_dirty(event_id)
+        logger.info(f"Task '{task}' marked complete for event {event_id}.")
+        self._log_execution('linked_list', 'MARK_COMPLETE', f'Task "{task}" marked complete for Event ID: {event_id}')
+        return True
+
+    @staticmethod
+    def _task_matcher(tasks: Union[Callable[[str], bool], Iterable[str]]) -> Callable[[str], bool]:
+        """
+        Normalizes a task selector into a predicate over task descriptions.
+        :param tasks: Either a callable taking a task description, or an iterable of descriptions.
+        :return: A predicate returning True for tasks that should be selected.
+        """
+        if callable(tasks):
+            return tasks
+        wanted = set(tasks)
+        return wanted.__contains__
+
+    def add_tasks(self, event_id: int, tasks: Iterable[str]) -> int:
+        """
+        Adds several tasks to an event's linked list in a single splice.
+        The new nodes are chained together first and then attached to the tail of the
+        existing list, so the list is walked at most once regardless of how many tasks are added.
+        :param event_id: The ID of the event to add the tasks to.
+        :param tasks: An iterable of task descriptions, in the order they should appear.
+        :return: The number of tasks added (0 if the event was not found).
+        """
+        if event_id not in self._events_by_id:
+            logger.warning(f"Event {event_id} not found for adding tasks.")
+            return 0
+
+        count = self.todo_lists.append(event_id, tasks)
+        if not count:
+            return 0
+
+        self._adjust_open_tasks(event_id, count)
+        self._mark_tasks_dirty(event_id)
+        logger.info(f"{count} tasks added to event {event_id}.")
+        self._log_execution('linked_list', 'ADD_BULK', f'{count} tasks added to Event ID: {event_id}')
+        return count
+
+    def complete_tasks(self, event_id: int, predicate: Union[Callable[[str], bool], Iterable[str]]) -> int:
+        """
+        Marks every matching task of an event as complete in a single pass over its linked list.
+        :param event_id: The ID of the event.
+        :param predicate: A callable taking a task description, or an iterable of task descriptions.
+        :return: The number of tasks that changed from incomplete to complete.
+        """
+        if event_id not in self._events_by_id or self.todo_lists.get(event_id) is None:
+            logger.warning(f"Event {event_id} or task list not found.")
+            return 0
+
+        count = self.todo_lists.complete_where(event_id, self._task_matcher(predicate))
+        if count:
+            self._adjust_open_tasks(event_id, -count)
+            self._mark_tasks_dirty(event_id)
+            logger.info(f"{count} tasks marked complete for event {event_id}.")
+            self._log_execution('linked_list', 'MARK_COMPLETE_BULK', f'{count} tasks marked complete for Event ID: {event_id}')
+        return count
+
+    def remove_tasks(self, event_id: int, predicate: Union[Callable[[str], bool], Iterable[str]]) -> int:
+        """
+        Removes every matching task from an event's linked list in a single pass.
+        :param event_id: The ID of the event.
+        :param predicate: A callable taking a task description, or an iterable of task descriptions.
+        :return: The number of tasks removed.
+        """
+        if event_id not in self._events_by_id or self.todo_lists.get(event_id) is None:
+            logger.warning(f"Event {event_id} or task list not found.")
+            return 0
+
+        count, open_removed = self.todo_lists.remove_where(event_id, self._task_matcher(predicate))
+        self._adjust_open_tasks(event_id, -open_removed)
+
+        if count:
+            self._mark_tasks_dirty(event_id)
+            logger.info(f"{count} tasks removed from event {event_id}.")
+            self._log_execution('linked_list', 'REMOVE_BULK', f'{count} tasks removed from Event ID: {event_id}')
+        return count
 
     def get_tasks(self, event_id: int) -> List[dict]:
         """
@@ -516,14 +1376,134 @@ class EventPlanner:
             logger.info(f"Event {event_id} has no tasks yet.")
             return []
         
-        tasks = []
-        current = self.todo_lists[event_id]
-        while current:
-            tasks.append({"task": current.data, "completed": current.completed})
-            current = current.next
+        tasks = [{"task": task, "completed": completed}
+                 for task, completed in self.todo_lists.iter_tasks(event_id)]
         logger.info(f"Retrieved {len(tasks)} tasks for event {event_id}.")
         return tasks
 
+    def open_tasks_between(self, start: datetime.datetime,
+                           end: datetime.datetime) -> List[tuple[Event, List[dict]]]:
+        """
+        Finds events between two datetimes (inclusive) that still have incomplete tasks.
+        Uses the chronological open-task index, so fully completed events are never visited:
+        the cost is O(log n) to locate the range plus the size of the returned task lists.
+        :param start: Earliest event datetime to include.
+        :param end: Latest event datetime to include.
+        :return: A list of (Event, open tasks) pairs in chronological order, where open tasks
+                 are dictionaries with 'task' and 'completed' keys as returned by get_tasks.
+        """
+        low = bisect.bisect_left(self._open_task_index, (start,))
+        high = bisect.bisect_right(self._open_task_index, (end, math.inf))
+        results = []
+        for _, event_id in self._open_task_index[low:high]:
+            open_tasks = [{"task": task, "completed": False}
+                          for task, completed in self.todo_lists.iter_tasks(event_id) if not completed]
+            results.append((self._events_by_id[event_id], open_tasks))
+        logger.info(f"Found {len(results)} events with open tasks between {start} and {end}.")
+        return results
+
+    def has_search_index(self) -> bool:
+        """Returns True if the word index used by prefix searches has been built."""
+        return self._word_index is not None
+
+    def build_search_index(self) -> None:
+        """
+        Builds the word index used by prefix searches over every resident event, if not built yet.
+        This takes about a second per 100k events; searches build it on first use, so callers
+        with a UI may prefer to build it ahead of time.
+        """
+        if self._word_index is not None:
+            return
+        # Events are visited chronologically, so most posting lists come out sorted
+        live_ids = [event.event_id for event in self._inorder_events()
+                    if self._events_by_id.get(event.event_id) is event]
+        entries = self._word_entries(live_ids)
+        for keys in entries.values():
+            keys.sort()  # Only reorders events sharing a datetime
+        self._word_index = entries
+        self._words = sorted(entries)
+        logger.info(f"Built word index: {len(self._words)} words for {len(self._word_keys)} events.")
+
+    def iter_search_prefix(self, query: str, start: Optional[datetime.datetime] = None,
+                           end: Optional[datetime.datetime] = None) -> Iterator[Event]:
+        """
+        Lazily finds events whose name, location or attendees contain a word starting with each
+        word of the query (case-insensitive), e.g. "bo mee" matches "Board meeting".
+        Only events in memory are searched (the hot window and any faulted-in months).
+        The word index keeps a chronological posting list per word. The query word matching the
+        fewest entries is looked up with a binary search over the sorted words, the posting lists
+        of the words it prefixes are merged lazily in date order and the other query words are
+        checked against those events only, so the first matches are found without visiting the rest.
+        The index is built on the first search and kept up to date by every change afterwards.
+        Changes made while the iterator is in use are safe: deleted or rescheduled events are
+        skipped, and other changed events are matched against their current words.
+        :param query: Words or word prefixes, separated by anything but letters and digits.
+        :param start: If given, only events at or after this datetime are returned.
+        :param end: If given, only events before this datetime are returned.
+        :return: An iterator over the matching events in chronological order
+                 (empty for a query without words).
+        """
+        prefixes = sorted(set(_WORD_PATTERN.findall(query.casefold())))
+        if not prefixes:
+            return iter(())
+        self.build_search_index()
+
+        candidates = None
+        for prefix in prefixes:
+            low = bisect.bisect_left(self._words, prefix)
+            high = bisect.bisect_left(self._words, prefix + "\U0010ffff", low)
+            lists = [self._word_index[word] for word in self._words[low:high]]
+            size = sum(len(postings) for postings in lists)
+            if candidates is None or size < candidates[0]:
+                candidates = (size, lists)
+        # Every prefix is checked against the event's current words, in case it changed mid-search
+        return self._merge_matches(candidates[1], prefixes, start, end)
+
+    def _merge_matches(self, lists: List[list], prefixes: List[str], start: Optional[datetime.datetime],
+                       end: Optional[datetime.datetime]) -> Iterator[Event]:
+        """Merges posting lists in date order and yields the live events that match every prefix."""
+        streams = []
+        for postings in lists:
+            position = 0 if start is None else bisect.bisect_left(postings, (start,))
+            if position < len(postings):
+                streams.append(itertools.islice(postings, position, None))
+        if len(streams) > 32:
+            # Short prefixes can cover thousands of small lists (e.g. numbers): sorting the
+            # concatenated runs beats a heap that large
+            keys = sorted(itertools.chain.from_iterable(streams))
+        elif len(streams) > 1:
+            keys = heapq.merge(*streams)
+        else:
+            keys = streams[0] if streams else ()
+
+        previous = None
+        for key in keys:
+            if key == previous:
+                continue  # Several of the event's words start with the prefix
+            previous = key
+            event_dt, event_id = key
+            if end is not None and event_dt >= end:
+                return
+            current = self._word_keys.get(event_id)
+            if current is None or current[0] != event_dt:
+                continue  # Deleted or rescheduled since the search started
+            words = current[1]
+            for prefix in prefixes:
+                # words is sorted, so the first word >= prefix is the only candidate to check
+                position = bisect.bisect_left(words, prefix)
+                if position == len(words) or not words[position].startswith(prefix):
+                    break
+            else:
+                yield self._events_by_id[event_id]
+
+    def search_prefix(self, query: str, start: Optional[datetime.datetime] = None,
+                      end: Optional[datetime.datetime] = None, limit: Optional[int] = None) -> List[Event]:
+        """
+        Returns the events matching a prefix query in chronological order (see iter_search_prefix).
+        :param limit: If given, at most this many (the earliest) matches are returned.
+        """
+        return list(itertools.islice(self.iter_search_prefix(query, start, end), limit))
+
     def undo_last_edit(self) -> Optional[Event]:
         """
         Undoes the last create or update operation by popping from the edit stack.
@@ -555,6 +1535,7 @@ class EventPlanner:
             
             # Re-insert the original state into the BST
             self._insert_bst(last_event_original_state)
+            self._reindex_open_event(event_id_to_undo)
 
             # Also, ensure reminder queue is updated based on restored state
             # Remove old event if it was in queue and new state says no reminder
@@ -562,6 +1543,7 @@ class EventPlanner:
             if last_event_original_state.reminder_set:
                 self.reminder_queue.append(last_event_original_state)
 
+            self._mark_event_dirty(event_id_to_undo)
             logger.info(f"Successfully restored event ID={event_id_to_undo} to its previous state.")
             return last_event_original_state
         else:
@@ -572,8 +1554,10 @@ class EventPlanner:
             self.bst_root = self._delete_bst_node(self.bst_root, event_id_to_undo)
             self._events_by_id.pop(event_id_to_undo, None)
             self.todo_lists.pop(event_id_to_undo, None)
+            self._forget_open_tasks(event_id_to_undo)
             self.reminder_queue = [e for e in self.reminder_queue if e.event_id != event_id_to_undo]
 
+            self._mark_event_deleted(event_id_to_undo)
             logger.info(f"Successfully undid creation/removed event ID={event_id_to_undo}.")
             return None # Indicate that the event was removed/un-created
 
@@ -0,0 +1,279 @@
+"""
+Array-backed task storage for very large checklists.
+Stores every task of every event in shared columns instead of one LLNode object per task:
+descriptions are interned into a string table and referenced by index, while completion
+flags and next pointers live in compact `bytearray`/`array` columns.
+"""
+
+import sys
+from array import array
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+_END = -1  # Next-pointer value marking the end of a list
+
+
+class TaskNodeView:
+    """
+    Read-only cursor over one slot of a CompactTaskStore.
+    Exposes the same `data`, `completed` and `next` attributes as LLNode so code that walks
+    task chains (reports, DBManager.save_tasks) works unchanged. A view is only valid until
+    the next mutation of the store.
+    """
+    __slots__ = ('_store', '_slot')
+
+    def __init__(self, store: 'CompactTaskStore', slot: int):
+        self._store = store
+        self._slot = slot
+
+    @property
+    def data(self) -> str:
+        return self._store._strings[self._store._text[self._slot]]
+
+    @property
+    def completed(self) -> bool:
+        return bool(self._store._completed[self._slot])
+
+    @property
+    def next(self) -> Optional['TaskNodeView']:
+        next_slot = self._store._next[self._slot]
+        return TaskNodeView(self._store, next_slot) if next_slot != _END else None
+
+
+class CompactTaskStore:
+    """
+    Column-oriented replacement for the `{event_id: LLNode}` task dictionary.
+    Each task occupies one slot across three columns (string id, completed flag, next slot),
+    costing roughly 9 bytes plus its share of the interned description. Freed slots are reused.
+    Behaves like a mapping from event_id to the head of a (read-only) task chain.
+    """
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._heads = {}  # {event_id: head slot or _END}
+        self._tails = {}  # {event_id: tail slot} for O(1) appends
+        self._text = array('i')  # Slot -> index into _strings
+        self._completed = bytearray()  # Slot -> 0/1
+        self._next = array('i')  # Slot -> next slot or _END
+        self._free_slots = array('i')
+        self._strings = []  # Interned description table
+        self._string_ids = {}  # {description: index into _strings}
+        self._string_refs = array('i')  # String index -> number of slots referencing it
+        self._free_strings = array('i')
+
+    # --- Internal slot and string management ---
+    def _intern(self, description: str) -> int:
+        """Returns the string-table index for a description, adding it if needed."""
+        string_id = self._string_ids.get(description)
+        if string_id is None:
+            description = sys.intern(description)
+            if self._free_strings:
+                string_id = self._free_strings.pop()
+                self._strings[string_id] = description
+                self._string_refs[string_id] = 0
+            else:
+                string_id = len(self._strings)
+                self._strings.append(description)
+                self._string_refs.append(0)
+            self._string_ids[description] = string_id
+        self._string_refs[string_id] += 1
+        return string_id
+
+    def _release_string(self, string_id: int) -> None:
+        """Drops one reference to a string, freeing its table entry when unused."""
+        self._string_refs[string_id] -= 1
+        if self._string_refs[string_id] == 0:
+            del self._string_ids[self._strings[string_id]]
+            self._strings[string_id] = None
+            self._free_strings.append(string_id)
+
+    def _allocate(self, description: str, completed: bool) -> int:
+        """Allocates a slot for a task, reusing a freed slot when possible."""
+        string_id = self._intern(description)
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._text[slot] = string_id
+            self._completed[slot] = 1 if completed else 0
+            self._next[slot] = _END
+        else:
+            slot = len(self._text)
+            self._text.append(string_id)
+            self._completed.append(1 if completed else 0)
+            self._next.append(_END)
+        return slot
+
+    def _free(self, slot: int) -> None:
+        """Returns a slot to the free list."""
+        self._release_string(self._text[slot])
+        self._free_slots.append(slot)
+
+    def _clear(self, event_id: int) -> None:
+        """Frees every slot of an event's list, leaving the event with no tasks."""
+        slot = self._heads.get(event_id, _END)
+        while slot != _END:
+            next_slot = self._next[slot]
+            self._free(slot)
+            slot = next_slot
+        self._tails.pop(event_id, None)
+
+    def _build_chain(self, tasks: Iterable[Tuple[str, bool]]) -> Tuple[int, int, int]:
+        """Allocates a linked chain of slots. Returns (head, tail, count)."""
+        head = tail = _END
+        count = 0
+        for description, completed in tasks:
+            slot = self._allocate(description, completed)
+            if head == _END:
+                head = slot
+            else:
+                self._next[tail] = slot
+            tail = slot
+            count += 1
+        return head, tail, count
+
+    # --- Mapping interface (compatible with the todo_lists dictionary) ---
+    def __contains__(self, event_id) -> bool:
+        return event_id in self._heads
+
+    def __iter__(self):
+        return iter(self._heads)
+
+    def __len__(self) -> int:
+        return len(self._heads)
+
+    def __getitem__(self, event_id: int) -> Optional[TaskNodeView]:
+        head = self._heads[event_id]
+        return TaskNodeView(self, head) if head != _END else None
+
+    def __setitem__(self, event_id: int, tasks_ll_head) -> None:
+        """
+        Replaces an event's tasks with a copy of a chain of nodes (LLNode or TaskNodeView), or clears them if None.
+        """
+        tasks = []
+        current = tasks_ll_head
+        while current:
+            tasks.append((current.data, current.completed))
+            current = current.next
+        self._clear(event_id)
+        head, tail, _ = self._build_chain(tasks)
+        self._heads[event_id] = head
+        if tail != _END:
+            self._tails[event_id] = tail
+
+    def get(self, event_id: int, default=None) -> Optional[TaskNodeView]:
+        head = self._heads.get(event_id, _END)
+        return TaskNodeView(self, head) if head != _END else default
+
+    def pop(self, event_id: int, default=None):
+        """Removes an event and frees its tasks. Returns None, or default if the event was absent."""
+        if event_id not in self._heads:
+            return default
+        self._clear(event_id)
+        del self._heads[event_id]
+        return None
+
+    def keys(self):
+        return self._heads.keys()
+
+    def items(self) -> Iterator[Tuple[int, Optional[TaskNodeView]]]:
+        for event_id in self._heads:
+            yield event_id, self.get(event_id)
+
+    # --- Task operations used by EventPlanner ---
+    def iter_tasks(self, event_id: int) -> Iterator[Tuple[str, bool]]:
+        """Yields (description, completed) pairs for an event's tasks in list order."""
+        slot = self._heads.get(event_id, _END)
+        while slot != _END:
+            yield self._strings[self._text[slot]], bool(self._completed[slot])
+            slot = self._next[slot]
+
+    def append(self, event_id: int, tasks: Iterable[str]) -> int:
+        """
+        Appends incomplete tasks to an event's list in one splice.
+        :return: The number of tasks appended.
+        """
+        head, tail, count = self._build_chain((task, False) for task in tasks)
+        if count:
+            old_tail = self._tails.get(event_id, _END)
+            if old_tail == _END:
+                self._heads[event_id] = head
+            else:
+                self._next[old_tail] = head
+            self._tails[event_id] = tail
+        else:
+            self._heads.setdefault(event_id, _END)
+        return count
+
+    def remove_first(self, event_id: int, task: str) -> Optional[bool]:
+        """
+        Removes the first task with the given description.
+        :return: The removed task's completed flag, or None if no task matched.
+        """
+        previous = _END
+        slot = self._heads.get(event_id, _END)
+        while slot != _END:
+            if self._strings[self._text[slot]] == task:
+                completed = bool(self._completed[slot])
+                self._unlink(event_id, previous, slot)
+                return completed
+            previous = slot
+            slot = self._next[slot]
+        return None
+
+    def complete_first(self, event_id: int, task: str) -> Optional[bool]:
+        """
+        Marks the first task with the given description as complete.
+        :return: True if it was newly completed, False if already complete, None if not found.
+        """
+        slot = self._heads.get(event_id, _END)
+        while slot != _END:
+            if self._strings[self._text[slot]] == task:
+                if self._completed[slot]:
+                    return False
+                self._completed[slot] = 1
+                return True
+            slot = self._next[slot]
+        return None
+
+    def complete_where(self, event_id: int, matches: Callable[[str], bool]) -> int:
+        """Marks every incomplete matching task as complete. Returns how many changed."""
+        count = 0
+        slot = self._heads.get(event_id, _END)
+        while slot != _END:
+            if not self._completed[slot] and matches(self._strings[self._text[slot]]):
+                self._completed[slot] = 1
+                count += 1
+            slot = self._next[slot]
+        return count
+
+    def remove_where(self, event_id: int, matches: Callable[[str], bool]) -> Tuple[int, int]:
+        """
+        Removes every matching task in a single pass.
+        :return: (tasks removed, incomplete tasks among them).
+        """
+        removed = open_removed = 0
+        previous = _END
+        slot = self._heads.get(event_id, _END)
+        while slot != _END:
+            next_slot = self._next[slot]
+            if matches(self._strings[self._text[slot]]):
+                removed += 1
+                if not self._completed[slot]:
+                    open_removed += 1
+                self._unlink(event_id, previous, slot)
+            else:
+                previous = slot
+            slot = next_slot
+        return removed, open_removed
+
+    def _unlink(self, event_id: int, previous: int, slot: int) -> None:
+        """Detaches a slot from an event's list and frees it."""
+        next_slot = self._next[slot]
+        if previous == _END:
+            self._heads[event_id] = next_slot
+        else:
+            self._next[previous] = next_slot
+        if self._tails.get(event_id) == slot:
+            if previous == _END:
+                self._tails.pop(event_id)
+            else:
+                self._tails[event_id] = previous
+        self._free(slot)
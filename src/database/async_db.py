@@ -0,0 +1,209 @@
+"""
+Asyncio facade over DBManager for headless services (e.g. a local JSON-RPC front end).
+All sqlite3 work runs on a dedicated thread pool, so the event loop never blocks on disk.
+The number of outstanding database jobs is bounded, and small concurrent writes are
+grouped into shared transactions.
+"""
+
+import asyncio
+import datetime
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Iterable, List, Optional
+
+from core.event_planner import Event, PlannerChanges, logger as app_logger
+from database.db_manager import DBManager
+
+
+class AsyncDBManager:
+    def __init__(self, db_name: str = "events.db", db_manager: Optional[DBManager] = None,
+                 max_workers: int = 4, max_queue: int = 64, batch_window: float = 0.005,
+                 max_batch_rows: int = 1000):
+        """
+        Creates the facade and its executor. Use `async with` (or await close()) to shut it down.
+        :param db_name: The SQLite database file, used when no db_manager is given.
+        :param db_manager: An existing DBManager to wrap (it is closed with the facade only if created here).
+        :param max_workers: Threads in the dedicated executor. Reads run concurrently on pooled
+                            connections; writes are serialized by DBManager.
+        :param max_queue: Maximum database jobs queued or running at once; further calls wait.
+        :param batch_window: Seconds a write waits for other writes to share its transaction.
+        :param max_batch_rows: Pending rows that start a batched write before the window ends.
+        """
+        self._owns_db = db_manager is None
+        self.db = db_manager or DBManager(db_name=db_name, max_readers=max_workers)
+        self.batch_window = batch_window
+        self.max_batch_rows = max_batch_rows
+        if self.db.pool.shares_writer:
+            # An in-memory database has a single connection (and a thread-owned writer lock held
+            # by open streams), so all work stays on one thread
+            max_workers = 1
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="async-db")
+        self._slots = asyncio.Semaphore(max_queue)
+
+        # Pending small writes: [(events, future)] written together by _write_batches
+        self._pending = []
+        self._pending_rows = 0
+        self._batch_full = asyncio.Event()
+        self._batch_task = None
+        self._closed = False
+        self._stats = {'jobs': 0, 'batches': 0, 'batched_calls': 0, 'batched_rows': 0, 'split_batches': 0}
+
+    async def __aenter__(self) -> 'AsyncDBManager':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def _run(self, func: Callable, *args):
+        """Runs a blocking call on the executor, waiting for a queue slot first."""
+        if self._closed:
+            raise RuntimeError("AsyncDBManager is closed.")
+        async with self._slots:
+            self._stats['jobs'] += 1
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    # --- Writes ---
+    async def save_events(self, events: Iterable[Event]) -> int:
+        """
+        Saves events, sharing one transaction with any other writes made at about the same time.
+        Returns once the transaction containing them has committed. If the shared transaction
+        fails, each call in it is retried on its own, so only calls with bad events raise.
+        :param events: The events to insert or update.
+        :return: The number of events saved by this call.
+        """
+        events = list(events)
+        if not events:
+            return 0
+        if self._closed:
+            raise RuntimeError("AsyncDBManager is closed.")
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((events, future))
+        self._pending_rows += len(events)
+        if self._pending_rows >= self.max_batch_rows:
+            self._batch_full.set()
+        if self._batch_task is None or self._batch_task.done():
+            self._batch_task = asyncio.create_task(self._write_batches())
+        return await future
+
+    async def save_event(self, event: Event) -> None:
+        """Saves a single event (batched like save_events)."""
+        await self.save_events([event])
+
+    async def _write_batches(self) -> None:
+        """Waits for the batch window, then writes pending batches until none are left."""
+        try:
+            await asyncio.wait_for(self._batch_full.wait(), self.batch_window)
+        except asyncio.TimeoutError:
+            pass
+        # Writes submitted while a batch is being written form the next batch
+        while self._pending:
+            batch, self._pending, self._pending_rows = self._pending, [], 0
+            self._batch_full.clear()
+            events = [event for batch_events, _ in batch for event in batch_events]
+            try:
+                await self._run(self.db.save_events, events)
+            except Exception as e:
+                app_logger.error(f"Async batched write of {len(events)} events failed: {e}")
+                if len(batch) == 1:
+                    self._settle(batch[0][1], exception=e)
+                else:
+                    await self._write_separately(batch)
+                continue
+            self._stats['batches'] += 1
+            self._stats['batched_calls'] += len(batch)
+            self._stats['batched_rows'] += len(events)
+            for batch_events, future in batch:
+                if not future.done():
+                    future.set_result(len(batch_events))
+
+    async def _write_separately(self, batch) -> None:
+        """
+        Retries the calls of a failed batch each in its own transaction, so only the calls
+        whose own events are rejected get the error.
+        """
+        self._stats['split_batches'] += 1
+        for batch_events, future in batch:
+            try:
+                await self._run(self.db.save_events, batch_events)
+            except Exception as e:
+                self._settle(future, exception=e)
+            else:
+                self._settle(future, result=len(batch_events))
+
+    @staticmethod
+    def _settle(future: asyncio.Future, result=None, exception: Optional[BaseException] = None) -> None:
+        """Completes a caller's future unless it was already cancelled."""
+        if future.done():
+            return
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
+    async def apply_changes(self, changes: PlannerChanges) -> None:
+        """Writes a planner delta (EventPlanner.collect_changes) in its own transaction."""
+        await self._run(self.db.apply_changes, changes)
+
+    async def delete_event(self, event_id: int) -> None:
+        """Deletes an event and its tasks."""
+        await self._run(self.db.delete_event, event_id)
+
+    async def flush(self) -> None:
+        """Writes any pending batched writes now and waits for them to commit."""
+        if self._batch_task is not None and not self._batch_task.done():
+            self._batch_full.set()
+            await self._batch_task
+
+    # --- Reads ---
+    async def load_events(self) -> List[Event]:
+        """Loads all events (see DBManager.load_events)."""
+        return await self._run(self.db.load_events)
+
+    async def get_max_event_id(self) -> int:
+        """Returns the highest event ID in the database, or 0."""
+        return await self._run(self.db.get_max_event_id)
+
+    async def stream_events(self, start: Optional[datetime.datetime] = None,
+                            end: Optional[datetime.datetime] = None,
+                            chunk_size: int = 500) -> AsyncIterator[Event]:
+        """
+        Streams events starting in [start, end) in chronological order, without loading them all.
+        Rows are fetched from DBManager.load_range (without the task query) on the executor,
+        chunk_size at a time, so at most one chunk of events is in memory.
+        A pooled reader connection is held until the stream ends; wrap it in contextlib.aclosing
+        when breaking out early so the connection is returned promptly.
+        :param start: Earliest event datetime, or None for no lower bound.
+        :param end: Datetime to stop before, or None for no upper bound.
+        :param chunk_size: Rows fetched per executor call.
+        """
+        rows = self.db.load_range(start, end, with_tasks=False)
+        try:
+            while True:
+                chunk = await self._run(lambda: list(itertools.islice(rows, chunk_size)))
+                for event, _ in chunk:
+                    yield event
+                if len(chunk) < chunk_size:
+                    break
+        finally:
+            # Releases the pooled reader connection if the caller stopped early
+            await asyncio.get_running_loop().run_in_executor(self._executor, rows.close)
+
+    # --- Lifecycle ---
+    def stats(self) -> dict:
+        """Returns facade counters plus the connection pool statistics."""
+        stats = dict(self._stats)
+        stats['pending_rows'] = self._pending_rows
+        stats['pool'] = self.db.pool_stats()
+        return stats
+
+    async def close(self) -> None:
+        """Writes pending batches, stops the executor and closes the DBManager if this facade opened it."""
+        if self._closed:
+            return
+        await self.flush()
+        self._closed = True
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._executor.shutdown)
+        if self._owns_db:
+            self.db.close()
+        app_logger.info("Async database facade closed.")
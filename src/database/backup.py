@@ -0,0 +1,226 @@
+"""
+Online backups of the Event Planner database.
+Backups use SQLite's backup API, which copies the database page by page from a live
+connection, so they are consistent even while the planner keeps writing. Copying runs on a
+background thread in small steps, releasing the database between steps so other connections
+are never locked out for long. Backups are written to a temporary file and renamed into place,
+so a backup file is either complete or absent.
+"""
+
+import datetime
+import glob
+import os
+import pathlib
+import sqlite3
+import threading
+from typing import Callable, List, Optional
+
+from core.event_planner import logger as app_logger
+
+BACKUP_SUFFIX = ".db"
+_TIMESTAMP_FORMAT = "%Y%m%d-%H%M%S"
+
+
+class BackupCancelled(Exception):
+    """Raised by BackupJob.wait (via BackupJob.error) when a backup was cancelled."""
+
+
+class BackupJob:
+    def __init__(self, pool, dest: str, pages_per_step: int = 256, sleep: float = 0.005,
+                 progress: Optional[Callable[[int, int], None]] = None):
+        """
+        Starts copying the pool's database to dest on a background thread.
+        :param pool: The ConnectionPool of the database to back up. One reader connection is
+                     held for the duration of the copy.
+        :param dest: The backup file to create (replaced if it exists).
+        :param pages_per_step: Pages copied per step; the source is unlocked between steps.
+                               -1 copies everything in one step.
+        :param sleep: Seconds to pause between steps, leaving room for other connections.
+        :param progress: Called as progress(pages_copied, total_pages) after every step,
+                         on the backup thread.
+        """
+        self.dest = dest
+        self.pages_per_step = pages_per_step
+        self.sleep = sleep
+        self.pages_copied = 0
+        self.total_pages = 0
+        self.error = None
+        self._pool = pool
+        self._progress = progress
+        self._cancelled = threading.Event()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="db-backup", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        """Copies the database into a temporary file, checks it and renames it into place."""
+        partial = self.dest + ".part"
+        try:
+            if os.path.exists(partial):
+                os.remove(partial)
+            target = sqlite3.connect(partial)
+            try:
+                with self._pool.reader() as source:
+                    source.backup(target, pages=self.pages_per_step, progress=self._on_step, sleep=self.sleep)
+                result = target.execute("PRAGMA quick_check").fetchone()[0]
+                if result != "ok":
+                    raise sqlite3.DatabaseError(f"Backup failed its integrity check: {result}")
+            finally:
+                target.close()
+            os.replace(partial, self.dest)
+            app_logger.info(f"Backed up {self._pool.db_name} to {self.dest} ({self.total_pages} pages).")
+        except Exception as e:
+            if self._cancelled.is_set():
+                e = BackupCancelled(f"Backup to {self.dest} was cancelled.")
+                app_logger.info(str(e))
+            else:
+                app_logger.error(f"Backup of {self._pool.db_name} to {self.dest} failed: {e}")
+            self.error = e
+            if os.path.exists(partial):
+                os.remove(partial)
+        finally:
+            self._done.set()
+
+    def _on_step(self, status: int, remaining: int, total: int):
+        """sqlite3 backup progress hook; raising here aborts the copy."""
+        if self._cancelled.is_set():
+            raise BackupCancelled()
+        self.total_pages = total
+        self.pages_copied = total - remaining
+        if self._progress is not None:
+            self._progress(self.pages_copied, total)
+
+    @property
+    def done(self) -> bool:
+        """True once the backup has finished, failed or been cancelled."""
+        return self._done.is_set()
+
+    def cancel(self) -> None:
+        """Stops the copy after the current step and removes the partial file."""
+        self._cancelled.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits for the backup to finish.
+        :param timeout: Seconds to wait, or None to wait indefinitely.
+        :return: True if the backup completed successfully, False if it failed, was cancelled
+                 or is still running (see `error` and `done`).
+        """
+        return self._done.wait(timeout) and self.error is None
+
+
+def backup_path(directory: str, db_name: str, when: Optional[datetime.datetime] = None) -> str:
+    """Returns a timestamped backup file name for db_name in directory, e.g. events-20250715-090000.db."""
+    stem = os.path.splitext(os.path.basename(db_name))[0]
+    when = when or datetime.datetime.now()
+    return os.path.join(directory, f"{stem}-{when.strftime(_TIMESTAMP_FORMAT)}{BACKUP_SUFFIX}")
+
+
+def list_backups(directory: str, db_name: str) -> List[str]:
+    """Returns the timestamped backups of db_name in directory, oldest first."""
+    stem = os.path.splitext(os.path.basename(db_name))[0]
+    pattern = os.path.join(glob.escape(directory), f"{glob.escape(stem)}-*{BACKUP_SUFFIX}")
+    # The timestamp format sorts chronologically
+    return sorted(path for path in glob.glob(pattern) if not path.endswith(".part"))
+
+
+def rotate_backups(directory: str, db_name: str, keep: int) -> List[str]:
+    """
+    Deletes all but the newest `keep` backups of db_name in directory.
+    :return: The deleted backup files.
+    """
+    backups = list_backups(directory, db_name)
+    removed = backups[:max(len(backups) - keep, 0)]
+    for path in removed:
+        try:
+            os.remove(path)
+        except OSError as e:
+            app_logger.warning(f"Could not remove old backup {path}: {e}")
+    if removed:
+        app_logger.info(f"Removed {len(removed)} old backups from {directory}.")
+    return removed
+
+
+def validate_backup(path: str, max_version: int) -> int:
+    """
+    Checks that a file is an intact Event Planner database that this version can open.
+    :param path: The backup file.
+    :param max_version: The newest schema version (PRAGMA user_version) that is supported.
+    :return: The backup's schema version.
+    :raises ValueError: If the file is missing, corrupt, not an Event Planner database or too new.
+    """
+    if not os.path.isfile(path):
+        raise ValueError(f"Backup file {path} does not exist.")
+    try:
+        conn = sqlite3.connect(pathlib.Path(path).resolve().as_uri() + "?mode=ro", uri=True)
+        try:
+            result = conn.execute("PRAGMA quick_check").fetchone()[0]
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        finally:
+            conn.close()
+    except sqlite3.DatabaseError as e:
+        raise ValueError(f"{path} is not a readable SQLite database: {e}") from e
+    if result != "ok":
+        raise ValueError(f"{path} failed its integrity check: {result}")
+    if not {'events', 'tasks'} <= tables:
+        raise ValueError(f"{path} is not an Event Planner database.")
+    if version > max_version:
+        raise ValueError(f"{path} has schema version {version}, newer than the supported version {max_version}.")
+    return version
+
+
+class BackupScheduler:
+    def __init__(self, db_manager, directory: str, interval: float = 3600.0, keep: int = 24,
+                 pages_per_step: int = 256):
+        """
+        Starts a background thread that backs up the database every `interval` seconds into
+        timestamped files in `directory`, keeping only the newest `keep`.
+        :param db_manager: The DBManager to back up.
+        :param directory: Where backups are written (created if missing).
+        :param interval: Seconds between backups.
+        :param keep: Number of backups to keep.
+        :param pages_per_step: Passed to DBManager.backup.
+        """
+        self.db_manager = db_manager
+        self.directory = directory
+        self.interval = interval
+        self.keep = keep
+        self.pages_per_step = pages_per_step
+        self.last_backup = None  # Path of the newest successful backup
+        self._job = None
+        self._lock = threading.Lock()  # Serializes backup_now between the timer thread and callers
+        self._stop = threading.Event()
+        os.makedirs(directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="db-backup-scheduler", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.backup_now()
+
+    def backup_now(self) -> Optional[str]:
+        """
+        Makes a backup immediately, waits for it and rotates old backups.
+        :return: The new backup file, or None if it failed or the scheduler was stopped.
+        """
+        with self._lock:
+            if self._stop.is_set():
+                return None
+            dest = backup_path(self.directory, self.db_manager.db_name)
+            self._job = self.db_manager.backup(dest, pages_per_step=self.pages_per_step)
+            if self._stop.is_set():  # stop() may have run before the job existed
+                self._job.cancel()
+            if not self._job.wait():
+                return None
+            self.last_backup = dest
+            rotate_backups(self.directory, self.db_manager.db_name, self.keep)
+            return dest
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stops scheduling and cancels a backup in progress."""
+        self._stop.set()
+        job = self._job
+        if job is not None:
+            job.cancel()
+        self._thread.join(timeout)
@@ -0,0 +1,158 @@
+"""
+Thread-safe SQLite connection pool for the Event Planner.
+WAL mode lets readers run concurrently with one writer, so the pool hands out a bounded set
+of read-only connections and a single writer connection guarded by a lock. Every connection
+is used by one thread at a time, which keeps cursor state private to the caller.
+"""
+
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from core.event_planner import logger as app_logger
+
+
+class ConnectionPool:
+    def __init__(self, db_name: str, configure: Optional[Callable[[sqlite3.Connection], None]] = None,
+                 max_readers: int = 4, timeout: Optional[float] = None):
+        """
+        Opens the writer connection. Reader connections are opened lazily, up to max_readers.
+        :param db_name: The SQLite database file. ':memory:' databases cannot be shared between
+                        connections, so readers then borrow the writer connection instead.
+        :param configure: Called with every new connection (e.g. to apply PRAGMAs).
+        :param max_readers: Maximum number of reader connections open at once.
+        :param timeout: Seconds to wait for a connection before raising TimeoutError, or None to wait indefinitely.
+        """
+        self.db_name = db_name
+        self.max_readers = max_readers
+        self.timeout = timeout
+        self._configure = configure
+        # True when readers borrow the writer connection (in-memory databases)
+        self.shares_writer = db_name == ":memory:" or db_name.startswith("file::memory:")
+
+        self._write_lock = threading.RLock()
+        self._idle_readers = queue.LifoQueue()  # Most recently used first, so its page cache is warm
+        self._all_readers = []
+        self._reader_lock = threading.Lock()  # Guards _all_readers and the counters
+        self._closed = False
+        self._stats = {'reader_checkouts': 0, 'reader_waits': 0, 'reader_wait_seconds': 0.0,
+                       'writer_checkouts': 0, 'writer_waits': 0, 'writer_wait_seconds': 0.0,
+                       'writer_hold_seconds': 0.0}
+        self._readers_in_use = 0
+
+        self.writer_connection = self._open(read_only=False)
+
+    def _open(self, read_only: bool) -> sqlite3.Connection:
+        """Opens and configures a connection that may be handed between threads."""
+        conn = sqlite3.connect(self.db_name, check_same_thread=False)
+        if self._configure is not None:
+            self._configure(conn)
+        if read_only:
+            conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """
+        Checks out the single writer connection, serializing writers across threads.
+        Re-entrant within a thread. Rolls back an open transaction if the block raises.
+        """
+        started = time.perf_counter()
+        if not self._write_lock.acquire(blocking=False):
+            with self._reader_lock:
+                self._stats['writer_waits'] += 1
+            if not self._write_lock.acquire(timeout=-1 if self.timeout is None else self.timeout):
+                raise TimeoutError(f"Timed out waiting for the writer connection to {self.db_name}")
+        acquired = time.perf_counter()
+        try:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Connection pool is closed.")
+            yield self.writer_connection
+        except BaseException:
+            if self.writer_connection.in_transaction:
+                self.writer_connection.rollback()
+            raise
+        finally:
+            with self._reader_lock:
+                self._stats['writer_checkouts'] += 1
+                self._stats['writer_wait_seconds'] += acquired - started
+                self._stats['writer_hold_seconds'] += time.perf_counter() - acquired
+            self._write_lock.release()
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        Checks out a read-only connection, opening a new one if none is idle and the pool is below
+        max_readers, otherwise waiting for one to be returned.
+        """
+        if self.shares_writer:
+            with self.writer() as conn:
+                yield conn
+            return
+
+        conn = self._checkout_reader()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            with self._reader_lock:
+                self._readers_in_use -= 1
+                closed = self._closed
+            if closed:
+                conn.close()
+            else:
+                self._idle_readers.put(conn)
+
+    def _checkout_reader(self) -> sqlite3.Connection:
+        """Takes an idle reader, opens a new one, or waits for one to be returned."""
+        with self._reader_lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Connection pool is closed.")
+            self._stats['reader_checkouts'] += 1
+            self._readers_in_use += 1
+            try:
+                return self._idle_readers.get_nowait()
+            except queue.Empty:
+                pass
+            if len(self._all_readers) < self.max_readers:
+                conn = self._open(read_only=True)
+                self._all_readers.append(conn)
+                return conn
+            self._stats['reader_waits'] += 1
+
+        started = time.perf_counter()
+        try:
+            conn = self._idle_readers.get(timeout=self.timeout)
+        except queue.Empty:
+            with self._reader_lock:
+                self._readers_in_use -= 1
+            raise TimeoutError(f"Timed out waiting for a reader connection to {self.db_name}")
+        with self._reader_lock:
+            self._stats['reader_wait_seconds'] += time.perf_counter() - started
+        return conn
+
+    def stats(self) -> dict:
+        """Returns a copy of the pool counters plus current reader usage, for tuning max_readers."""
+        with self._reader_lock:
+            stats = dict(self._stats)
+            stats['readers_open'] = len(self._all_readers)
+            stats['readers_in_use'] = self._readers_in_use
+            stats['max_readers'] = self.max_readers
+            return stats
+
+    def close(self) -> None:
+        """Closes the writer and every idle reader; readers still checked out close when returned."""
+        with self._write_lock:
+            with self._reader_lock:
+                self._closed = True
+            while True:
+                try:
+                    self._idle_readers.get_nowait().close()
+                except queue.Empty:
+                    break
+            self.writer_connection.close()
+        app_logger.info(f"Connection pool for {self.db_name} closed.")
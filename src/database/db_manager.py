@@ -1,9 +1,16 @@
 import sqlite3
 import json
-from typing import List, Optional
+import itertools
+import calendar
+import datetime
+import time
+from contextlib import contextmanager
+from typing import List, Optional, Iterable, Iterator, Tuple, Mapping
 import logging
 from dataclasses import dataclass
 
+import startup_profiler
+
 # Assuming Event and LLNode classes are available from event_planner_integrated.py
 # In a real application, you might put these into a separate 'models.py' file
 # and import them from there. For this setup, we'll assume they are accessible
@@ -11,6 +18,9 @@ from dataclasses import dataclass
 # For now, we'll import them directly, assuming event_planner_integrated.py is in the same directory.
 try:
     from core.event_planner import Event, logger as app_logger # Import Event and logger
+    from database.connection_pool import ConnectionPool
+    from database.backup import BackupJob, validate_backup
+    from database.statement_stats import StatementStats
     from data_structures.linked_list import LLNode # Import LLNode
 except ImportError:
     # Fallback for standalone testing or if classes are defined elsewhere
@@ -39,81 +49,620 @@ except ImportError:
     app_logger = logging.getLogger(__name__)
 
 
+# Named connection profiles applied by DBManager._connect.
+# cache_size is negative KiB (SQLite convention); mmap_size is bytes.
+# All profiles run in WAL mode so the GUI connection and the write-behind writer can coexist.
+STORAGE_PROFILES = {
+    # Every commit is fsynced, including the WAL; safest for user edits on unreliable storage
+    'durable': {
+        'journal_mode': 'WAL',
+        'synchronous': 'FULL',
+        'cache_size': -8000,
+        'mmap_size': 0,
+        'temp_store': 'DEFAULT',
+        'foreign_keys': 'ON',
+    },
+    # WAL with NORMAL sync: a power loss can drop the last commits but never corrupts the file
+    'balanced': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -32000,
+        'mmap_size': 256 * 1024 * 1024,
+        'temp_store': 'MEMORY',
+        'foreign_keys': 'ON',
+    },
+    # For imports and benchmarks: no fsync at all, large cache; rerun the import if the machine crashes
+    'bulk_load': {
+        'journal_mode': 'WAL',
+        'synchronous': 'OFF',
+        'cache_size': -256000,
+        'mmap_size': 1024 * 1024 * 1024,
+        'temp_store': 'MEMORY',
+        'foreign_keys': 'ON',
+    },
+}
+DEFAULT_STORAGE_PROFILE = 'balanced'
+
+_EPOCH = datetime.datetime(1970, 1, 1)  # starts_at treats event times as UTC
+_ONE_SECOND = datetime.timedelta(seconds=1)
+
+
 class DBManager:
-    def __init__(self, db_name: str = "events.db"):
+    # Upsert statement shared by the single-row and bulk event writers.
+    # ON CONFLICT ... DO UPDATE (rather than INSERT OR REPLACE) keeps the row in place, so
+    # enforced foreign keys do not cascade-delete the event's tasks on every save.
+    _SAVE_EVENT_SQL = """
+        INSERT INTO events (event_id, name, date, time, reminder_set, location, description, attendees, starts_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(event_id) DO UPDATE SET
+            name = excluded.name, date = excluded.date, time = excluded.time,
+            reminder_set = excluded.reminder_set, location = excluded.location,
+            description = excluded.description, attendees = excluded.attendees,
+            starts_at = excluded.starts_at
+    """
+    _INSERT_TASK_SQL = """
+        INSERT INTO tasks (event_id, task_description, completed)
+        VALUES (?, ?, ?)
+    """
+
+    def __init__(self, db_name: str = "events.db", chunk_size: int = 1000,
+                 profile: str = DEFAULT_STORAGE_PROFILE, max_readers: int = 4,
+                 stats_sample_rate: float = 0.1, stats_log_interval: Optional[float] = None):
         """
         Initializes the database manager and connects to the SQLite database.
         Creates the 'events' and 'tasks' tables if they do not exist.
         :param db_name: The name of the SQLite database file.
+        :param chunk_size: Default number of rows handed to each `executemany` call by bulk writers,
+                           and rows per committed step when a migration backfills existing data.
+        :param profile: Name of a STORAGE_PROFILES entry ('durable', 'balanced' or 'bulk_load').
+        :param max_readers: Maximum number of pooled read connections. Writes always go through
+                            a single connection, serialized across threads.
+        :param stats_sample_rate: Fraction of statements whose latency is recorded (see stats()).
+                                  The default of 1 in 10 keeps the overhead under 2% even for
+                                  cached microsecond reads; 1 times every statement, 0 turns it off.
+        :param stats_log_interval: If set, logs a statement latency summary at most this often (seconds).
         """
         self.db_name = db_name
-        self.conn = None
-        self.cursor = None
-        self._connect()
-        self._create_tables()
+        self.chunk_size = chunk_size
+        self.profile = self._profile_name(profile)
+        self.pool = None
+        self.conn = None  # The pool's writer connection
+        self.cursor = None  # Cursor on the writer connection; only used while holding pool.writer()
+        self.statement_stats = StatementStats(sample_rate=stats_sample_rate, log_interval=stats_log_interval)
+        with startup_profiler.phase("db.connect"):
+            self._connect(max_readers)
+        with startup_profiler.phase("db.create_tables"):
+            self._create_tables()
+        with startup_profiler.phase("db.migrate"):
+            self._migrate()
         app_logger.info(f"Database manager initialized for {self.db_name}")
 
-    def _connect(self):
-        """Establishes a connection to the SQLite database."""
+    def _connect(self, max_readers: int):
+        """Opens the connection pool; every pooled connection gets the current storage profile."""
         try:
-            self.conn = sqlite3.connect(self.db_name)
+            self.pool = ConnectionPool(self.db_name, configure=lambda conn: self._apply_settings(conn, self.profile),
+                                       max_readers=max_readers)
+            self.conn = self.pool.writer_connection
             self.cursor = self.conn.cursor()
-            app_logger.debug(f"Connected to database: {self.db_name}")
+            app_logger.debug(f"Connected to database: {self.db_name} (profile: {self.profile})")
         except sqlite3.Error as e:
             app_logger.error(f"Error connecting to database {self.db_name}: {e}")
             raise
 
+    @staticmethod
+    def _profile_name(profile: str) -> str:
+        """Normalizes and validates a storage profile name ('bulk-load' is accepted for 'bulk_load')."""
+        name = profile.replace('-', '_')
+        if name not in STORAGE_PROFILES:
+            raise ValueError(f"Unknown storage profile '{profile}'. Choose from: {', '.join(STORAGE_PROFILES)}.")
+        return name
+
+    def apply_profile(self, profile: str) -> dict:
+        """
+        Applies a named storage profile to the writer connection; reader connections opened
+        afterwards use it too. Can be called at any time outside a transaction, e.g. to switch
+        to 'bulk_load' for an import.
+        :param profile: Name of a STORAGE_PROFILES entry.
+        :return: The PRAGMA values SQLite reports after applying the profile.
+        """
+        self.profile = self._profile_name(profile)
+        with self.pool.writer() as conn:
+            return self._apply_settings(conn, self.profile)
+
+    @staticmethod
+    def _apply_settings(conn: sqlite3.Connection, profile: str) -> dict:
+        """Runs a profile's PRAGMAs on one connection and returns the values SQLite reports back."""
+        applied = {}
+        for pragma, value in STORAGE_PROFILES[profile].items():
+            conn.execute(f"PRAGMA {pragma} = {value}")
+            row = conn.execute(f"PRAGMA {pragma}").fetchone()
+            applied[pragma] = row[0] if row else None # Some pragmas report nothing for in-memory databases
+        app_logger.debug(f"Applied storage profile '{profile}': {applied}")
+        return applied
+
+    # --- Timed statements ---
+    # Queries and writes go through these so each statement kind gets latency statistics.
+    def _execute(self, kind: str, sql: str, params=()) -> sqlite3.Cursor:
+        """Runs one statement on the writer cursor, timed under the given kind when sampled."""
+        stats = self.statement_stats
+        if not stats.sample(kind):
+            return self.cursor.execute(sql, params)
+        started = time.perf_counter_ns()
+        try:
+            cursor = self.cursor.execute(sql, params)
+        except sqlite3.Error:
+            stats.record(kind, time.perf_counter_ns() - started, failed=True)
+            raise
+        stats.record(kind, time.perf_counter_ns() - started, cursor.rowcount)
+        return cursor
+
+    def _executemany(self, kind: str, sql: str, rows) -> int:
+        """Runs `executemany` on the writer cursor, timed under the given kind. Returns rows affected."""
+        with self.statement_stats.timer(kind) as timer:
+            affected = timer.rows = self.cursor.executemany(sql, rows).rowcount
+        return affected
+
+    def _commit(self) -> None:
+        """
+        Bumps the database generation and commits the writer connection's transaction,
+        timed under 'commit' when sampled.
+        """
+        self.cursor.execute("UPDATE planner_state SET generation = generation + 1")
+        stats = self.statement_stats
+        if not stats.sample('commit'):
+            self.conn.commit()
+            return
+        started = time.perf_counter_ns()
+        try:
+            self.conn.commit()
+        except sqlite3.Error:
+            stats.record('commit', time.perf_counter_ns() - started, failed=True)
+            raise
+        stats.record('commit', time.perf_counter_ns() - started)
+
     def _create_tables(self):
         """Creates the 'events' and 'tasks' tables if they don't already exist."""
+        with self.pool.writer():
+            try:
+                # Events table
+                self.cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS events (
+                        event_id INTEGER PRIMARY KEY,
+                        name TEXT NOT NULL,
+                        date TEXT NOT NULL,
+                        time TEXT NOT NULL,
+                        reminder_set INTEGER NOT NULL, -- SQLite stores booleans as 0 or 1
+                        location TEXT,
+                        description TEXT,
+                        attendees TEXT
+                    )
+                """)
+                # Tasks table (associated with events)
+                self.cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS tasks (
+                        task_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        event_id INTEGER NOT NULL,
+                        task_description TEXT NOT NULL,
+                        completed INTEGER NOT NULL,
+                        FOREIGN KEY (event_id) REFERENCES events(event_id) ON DELETE CASCADE
+                    )
+                """)
+                self.conn.commit()
+                app_logger.info("Database tables checked/created.")
+            except sqlite3.Error as e:
+                app_logger.error(f"Error creating tables: {e}")
+                raise
+
+    # --- Schema migrations ---
+    # Each migration runs once, in order; PRAGMA user_version stores how many have been applied.
+    # Migrations must be safe to re-run if interrupted before the version is bumped.
+    def _migration_1_task_indexes(self):
+        """Indexes tasks by event so per-event loads, deletes and cascades stop scanning the whole table."""
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_event_id ON tasks(event_id, task_id)")
+
+    def _migration_2_starts_at(self):
+        """
+        Adds an indexed integer `starts_at` column (seconds since the epoch, event local time
+        treated as UTC) derived from `date` and `time`, so date ranges can use an index.
+        """
+        columns = [row[1] for row in self.cursor.execute("PRAGMA table_info(events)")]
+        if 'starts_at' not in columns:
+            self.cursor.execute("ALTER TABLE events ADD COLUMN starts_at INTEGER")
+            self.conn.commit()
+        self._backfill_starts_at()
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_starts_at ON events(starts_at)")
+
+    def _backfill_starts_at(self):
+        """
+        Fills in `starts_at` for rows where it is NULL, using _starts_at so migrated rows get
+        exactly the values saved rows do. Works in chunks of chunk_size, committing after each
+        chunk so large databases never hold the write lock for long. Rows whose date or time
+        cannot be parsed are left NULL and logged.
+        """
+        last_id = 0
+        backfilled = 0
+        unparseable = []
+        while True:
+            rows = self.cursor.execute(
+                "SELECT event_id, date, time FROM events WHERE event_id > ? AND starts_at IS NULL "
+                "ORDER BY event_id LIMIT ?", (last_id, self.chunk_size)
+            ).fetchall()
+            if not rows:
+                break
+            updates = []
+            for event_id, date, time_ in rows:
+                starts_at = self._starts_at(date, time_)
+                if starts_at is None:
+                    unparseable.append(event_id)
+                else:
+                    updates.append((starts_at, event_id))
+            backfilled += self._executemany('backfill_starts_at',
+                                            "UPDATE events SET starts_at = ? WHERE event_id = ?", updates)
+            self.conn.commit()
+            last_id = rows[-1][0]
+        app_logger.info(f"Backfilled starts_at for {backfilled} events.")
+        if unparseable:
+            app_logger.warning(f"Could not compute starts_at for {len(unparseable)} events with an unparseable "
+                               f"date or time; they are left out of date ranges until re-saved. "
+                               f"Event IDs: {unparseable[:20]}{' ...' if len(unparseable) > 20 else ''}")
+
+    # External-content FTS5 indexes over events and tasks, kept in sync by triggers.
+    # The 'delete' command must be given the old column values, as FTS5 requires.
+    _FTS_TABLES = (
+        """CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+               name, location, description, attendees,
+               content='events', content_rowid='event_id',
+               tokenize='unicode61 remove_diacritics 2', prefix='2 3')""",
+        """CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+               task_description,
+               content='tasks', content_rowid='task_id',
+               tokenize='unicode61 remove_diacritics 2', prefix='2 3')""",
+    )
+    _FTS_TRIGGERS = {
+        'events_fts_insert': """CREATE TRIGGER IF NOT EXISTS events_fts_insert AFTER INSERT ON events BEGIN
+               INSERT INTO events_fts(rowid, name, location, description, attendees)
+               VALUES (new.event_id, new.name, new.location, new.description, new.attendees);
+           END""",
+        'events_fts_delete': """CREATE TRIGGER IF NOT EXISTS events_fts_delete AFTER DELETE ON events BEGIN
+               INSERT INTO events_fts(events_fts, rowid, name, location, description, attendees)
+               VALUES ('delete', old.event_id, old.name, old.location, old.description, old.attendees);
+           END""",
+        'events_fts_update': """CREATE TRIGGER IF NOT EXISTS events_fts_update
+               AFTER UPDATE OF name, location, description, attendees ON events BEGIN
+               INSERT INTO events_fts(events_fts, rowid, name, location, description, attendees)
+               VALUES ('delete', old.event_id, old.name, old.location, old.description, old.attendees);
+               INSERT INTO events_fts(rowid, name, location, description, attendees)
+               VALUES (new.event_id, new.name, new.location, new.description, new.attendees);
+           END""",
+        'tasks_fts_insert': """CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+               INSERT INTO tasks_fts(rowid, task_description) VALUES (new.task_id, new.task_description);
+           END""",
+        'tasks_fts_delete': """CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+               INSERT INTO tasks_fts(tasks_fts, rowid, task_description)
+               VALUES ('delete', old.task_id, old.task_description);
+           END""",
+        'tasks_fts_update': """CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF task_description ON tasks BEGIN
+               INSERT INTO tasks_fts(tasks_fts, rowid, task_description)
+               VALUES ('delete', old.task_id, old.task_description);
+               INSERT INTO tasks_fts(rowid, task_description) VALUES (new.task_id, new.task_description);
+           END""",
+    }
+
+    def _migration_3_full_text_search(self):
+        """Adds FTS5 indexes over event text and task descriptions, and indexes existing rows."""
+        for statement in itertools.chain(self._FTS_TABLES, self._FTS_TRIGGERS.values()):
+            self.cursor.execute(statement)
+        self._rebuild_search_index()
+
+    def _rebuild_search_index(self):
+        """Re-indexes every event and task row in the FTS tables, without committing."""
+        self._execute('rebuild_search_index', "INSERT INTO events_fts(events_fts) VALUES ('rebuild')")
+        self._execute('rebuild_search_index', "INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+
+    def _migration_4_generation(self):
+        """
+        Adds a one-row `planner_state` table with a random database id and a generation counter
+        that every DBManager commit increments, so caches of the data (planner snapshots) can
+        tell whether the database changed since they were written.
+        """
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS planner_state (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                db_uid TEXT NOT NULL,
+                generation INTEGER NOT NULL
+            )
+        """)
+        self.cursor.execute("INSERT OR IGNORE INTO planner_state VALUES (1, lower(hex(randomblob(16))), 0)")
+
+    def _migration_5_starts_at_unpadded(self):
+        """
+        Re-runs the starts_at backfill for rows that an earlier SQL conversion left NULL
+        (dates and times without zero padding, such as '2030-2-1' and '9:00').
+        """
+        self._backfill_starts_at()
+
+    def _migration_6_orphaned_tasks(self):
+        """
+        Deletes task rows whose event no longer exists. They piled up while foreign keys were
+        not enforced, so ON DELETE CASCADE never ran. The search index is rebuilt afterwards.
+        """
+        deleted = self.cursor.execute(
+            "DELETE FROM tasks WHERE event_id NOT IN (SELECT event_id FROM events)").rowcount
+        self._rebuild_search_index()
+        app_logger.info(f"Deleted {deleted} orphaned tasks.")
+
+    _MIGRATIONS = (
+        _migration_1_task_indexes,
+        _migration_2_starts_at,
+        _migration_3_full_text_search,
+        _migration_4_generation,
+        _migration_5_starts_at_unpadded,
+        _migration_6_orphaned_tasks,
+    )
+
+    def generation(self) -> Tuple[str, int]:
+        """
+        Returns (database id, generation). The generation grows with every committed write made
+        through DBManager, and the id changes when a backup is restored, so the pair identifies
+        the current contents. (PRAGMA data_version cannot be used: it only compares states seen
+        by one open connection.)
+        """
+        with self.pool.reader() as conn:
+            return conn.execute("SELECT db_uid, generation FROM planner_state").fetchone()
+
+    def schema_version(self) -> int:
+        """Returns the number of schema migrations applied to the database (PRAGMA user_version)."""
+        with self.pool.reader() as conn:
+            return conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def _migrate(self):
+        """Applies any schema migrations the database has not seen yet."""
+        with self.pool.writer():
+            version = self.cursor.execute("PRAGMA user_version").fetchone()[0]
+            for target, migration in enumerate(self._MIGRATIONS[version:], start=version + 1):
+                app_logger.info(f"Migrating {self.db_name} to schema version {target} ({migration.__name__}).")
+                try:
+                    migration(self)
+                    self.cursor.execute(f"PRAGMA user_version = {target}")
+                    self.conn.commit()
+                except sqlite3.Error as e:
+                    app_logger.error(f"Migration to schema version {target} failed: {e}")
+                    self.conn.rollback()
+                    raise
+            self._restore_search_triggers()
+
+    def _restore_search_triggers(self):
+        """
+        Recreates full-text search triggers that are missing, e.g. because a bulk_import was
+        interrupted before it could put them back, and rebuilds the search index to cover
+        whatever was written without them. Caller must hold the writer.
+        """
+        if self.cursor.execute("PRAGMA user_version").fetchone()[0] < 3:
+            return
+        existing = {row[0] for row in self.cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+        missing = [name for name in self._FTS_TRIGGERS if name not in existing]
+        if not missing:
+            return
+        app_logger.warning(f"Search triggers missing from {self.db_name} ({', '.join(missing)}); "
+                           f"recreating them and rebuilding the search index.")
         try:
-            # Events table
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS events (
-                    event_id INTEGER PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    date TEXT NOT NULL,
-                    time TEXT NOT NULL,
-                    reminder_set INTEGER NOT NULL, -- SQLite stores booleans as 0 or 1
-                    location TEXT,
-                    description TEXT,
-                    attendees TEXT
-                )
-            """)
-            # Tasks table (associated with events)
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS tasks (
-                    task_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    event_id INTEGER NOT NULL,
-                    task_description TEXT NOT NULL,
-                    completed INTEGER NOT NULL,
-                    FOREIGN KEY (event_id) REFERENCES events(event_id) ON DELETE CASCADE
-                )
-            """)
+            for name in missing:
+                self.cursor.execute(self._FTS_TRIGGERS[name])
+            self._rebuild_search_index()
             self.conn.commit()
-            app_logger.info("Database tables checked/created.")
         except sqlite3.Error as e:
-            app_logger.error(f"Error creating tables: {e}")
+            app_logger.error(f"Error restoring search triggers: {e}")
+            self.conn.rollback()
             raise
 
+    @staticmethod
+    def _starts_at(date: str, time: str) -> Optional[int]:
+        """
+        Computes the `starts_at` column value for a date and time: seconds since the epoch,
+        with the event's local time treated as UTC. Accepts anything the planner accepts
+        (including unpadded values such as '2030-2-1' and '9:00'). Returns None for
+        unparseable values.
+        """
+        try:
+            if len(date) == 10 and len(time) == 5 and date[4] == date[7] == '-' and time[2] == ':':
+                moment = datetime.datetime.fromisoformat(f"{date} {time}")  # Fast path for the canonical form
+            else:
+                moment = datetime.datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M")
+        except ValueError:
+            return None
+        return (moment - _EPOCH) // _ONE_SECOND
+
     def save_event(self, event: Event):
         """
         Inserts a new event or updates an existing one in the database.
         :param event: The Event object to save.
         """
-        try:
-            self.cursor.execute("""
-                INSERT OR REPLACE INTO events (event_id, name, date, time, reminder_set, location, description, attendees)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                event.event_id, event.name, event.date, event.time, 
-                1 if event.reminder_set else 0, # Convert boolean to integer
-                event.location, event.description, event.attendees
-            ))
+        with self.pool.writer():
+            try:
+                self._execute('save_event', self._SAVE_EVENT_SQL, self._event_row(event))
+                self._commit()
+                app_logger.info(f"Event ID {event.event_id} saved/updated in DB.")
+            except sqlite3.Error as e:
+                app_logger.error(f"Error saving event {event.event_id}: {e}")
+                self.conn.rollback()
+                raise
+
+    @staticmethod
+    def _event_row(event: Event) -> tuple:
+        """Converts an Event into the parameter tuple used by the event upsert."""
+        return (
+            event.event_id, event.name, event.date, event.time,
+            1 if event.reminder_set else 0, # Convert boolean to integer
+            event.location, event.description, event.attendees,
+            DBManager._starts_at(event.date, event.time)
+        )
+
+    @staticmethod
+    def _chunked(rows: Iterable, chunk_size: int) -> Iterator[list]:
+        """Splits an iterable of rows into lists of at most chunk_size rows."""
+        iterator = iter(rows)
+        while True:
+            chunk = list(itertools.islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def save_events(self, events: Iterable[Event], chunk_size: Optional[int] = None) -> int:
+        """
+        Inserts or updates many events in a single transaction.
+        Rows are streamed to `executemany` in chunks, so the input may be a generator of any size
+        and the whole batch costs one commit (one fsync) instead of one per event.
+        :param events: An iterable of Event objects.
+        :param chunk_size: Rows per `executemany` call (defaults to self.chunk_size).
+        :return: The number of events written.
+        """
+        with self.pool.writer():
+            try:
+                saved = self._write_events(events, chunk_size or self.chunk_size)
+                self._commit()
+                app_logger.info(f"Saved {saved} events to DB in one transaction.")
+            except sqlite3.Error as e:
+                app_logger.error(f"Error saving events in bulk: {e}")
+                self.conn.rollback()
+                raise
+            return saved
+
+    def _write_events(self, events: Iterable[Event], chunk_size: int) -> int:
+        """Upserts events in chunks without committing. Returns the number of rows written."""
+        saved = 0
+        for chunk in self._chunked(map(self._event_row, events), chunk_size):
+            self._executemany('upsert_events', self._SAVE_EVENT_SQL, chunk)
+            saved += len(chunk)
+        return saved
+
+    def _delete_events(self, event_ids: Iterable[int], chunk_size: int) -> None:
+        """Deletes events and their task rows in chunks without committing."""
+        for chunk in self._chunked(((event_id,) for event_id in event_ids), chunk_size):
+            self._executemany('delete_events.tasks', "DELETE FROM tasks WHERE event_id = ?", chunk)
+            self._executemany('delete_events.events', "DELETE FROM events WHERE event_id = ?", chunk)
+
+    def _replace_task_lists(self, task_lists: Mapping[int, Iterable[Tuple[str, bool]]], chunk_size: int) -> int:
+        """
+        Replaces the task rows of every event in the mapping without committing.
+        :param task_lists: {event_id: iterable of (task description, completed)}.
+        :return: The number of task rows inserted.
+        """
+        for chunk in self._chunked(((event_id,) for event_id in task_lists.keys()), chunk_size):
+            self._executemany('replace_tasks.delete', "DELETE FROM tasks WHERE event_id = ?", chunk)
+        rows = itertools.chain.from_iterable(
+            ((event_id, task, 1 if completed else 0) for task, completed in tasks)
+            for event_id, tasks in task_lists.items()
+        )
+        written = 0
+        for chunk in self._chunked(rows, chunk_size):
+            self._executemany('replace_tasks.insert', self._INSERT_TASK_SQL, chunk)
+            written += len(chunk)
+        return written
+
+    def apply_changes(self, changes, chunk_size: Optional[int] = None) -> None:
+        """
+        Writes a planner delta (EventPlanner.collect_changes) in a single transaction:
+        deleted events are removed with their tasks, changed events are upserted and
+        changed task lists are replaced.
+        :param changes: A PlannerChanges with events, deleted_event_ids and task_lists.
+        :param chunk_size: Rows per `executemany` call (defaults to self.chunk_size).
+        """
+        with self.pool.writer():
+            chunk_size = chunk_size or self.chunk_size
+            try:
+                self._delete_events(changes.deleted_event_ids, chunk_size)
+                self._write_events(changes.events, chunk_size)
+                self._replace_task_lists(changes.task_lists, chunk_size)
+                self._commit()
+                app_logger.info(f"Applied changes to DB: {len(changes.events)} events saved, "
+                                f"{len(changes.deleted_event_ids)} deleted, {len(changes.task_lists)} task lists replaced.")
+            except sqlite3.Error as e:
+                app_logger.error(f"Error applying changes: {e}")
+                self.conn.rollback()
+                raise
+
+    def insert_batch(self, events: List[Event], task_lists: Mapping[int, Iterable[Tuple[str, bool]]],
+                     chunk_size: Optional[int] = None) -> int:
+        """
+        Writes a batch of new events and their tasks in one transaction (used by bulk imports).
+        Unlike apply_changes, existing task rows are not deleted first, so the events should be new.
+        :param events: The events to insert (or update).
+        :param task_lists: {event_id: iterable of (task description, completed)} to append.
+        :param chunk_size: Rows per `executemany` call (defaults to self.chunk_size).
+        :return: The number of task rows inserted.
+        """
+        with self.pool.writer():
+            chunk_size = chunk_size or self.chunk_size
+            try:
+                self._write_events(events, chunk_size)
+                rows = ((event_id, task, 1 if completed else 0)
+                        for event_id, tasks in task_lists.items() for task, completed in tasks)
+                written = 0
+                for chunk in self._chunked(rows, chunk_size):
+                    self._executemany('insert_tasks', self._INSERT_TASK_SQL, chunk)
+                    written += len(chunk)
+                self._commit()
+                return written
+            except sqlite3.Error as e:
+                app_logger.error(f"Error inserting batch of {len(events)} events: {e}")
+                self.conn.rollback()
+                raise
+
+    @contextmanager
+    def bulk_import(self):
+        """
+        Context manager for large imports: switches to the 'bulk_load' profile and suspends the
+        full-text search triggers, then recreates them, rebuilds the search index once and
+        restores the previous profile on exit. Rebuilding once is far cheaper than updating
+        the index row by row, and it also covers anything written meanwhile.
+        """
+        previous_profile = self.profile
+        with self.pool.writer():
+            self.apply_profile('bulk_load')
+            for trigger in self._FTS_TRIGGERS:
+                self.cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
             self.conn.commit()
-            app_logger.info(f"Event ID {event.event_id} saved/updated in DB.")
+        try:
+            yield self
+        finally:
+            with self.pool.writer():
+                try:
+                    for statement in self._FTS_TRIGGERS.values():
+                        self.cursor.execute(statement)
+                    self._rebuild_search_index()
+                    self._commit()
+                except sqlite3.Error as e:
+                    app_logger.error(f"Error restoring search index after import: {e}")
+                    self.conn.rollback()
+                    raise
+                finally:
+                    self.apply_profile(previous_profile)
+
+    def iter_events_with_tasks(self) -> Iterator[Tuple[Event, List[Tuple[str, bool]]]]:
+        """
+        Streams every event with its tasks, ordered by event_id, in constant memory:
+        the events and tasks queries are both ordered by event_id and merged as they are read.
+        :return: A generator of (Event, [(task description, completed), ...]).
+        """
+        try:
+            with self.pool.reader() as conn:
+                task_rows = conn.execute(
+                    "SELECT event_id, task_description, completed FROM tasks ORDER BY event_id, task_id")
+                pending = next(task_rows, None)
+                for row in conn.execute(
+                        "SELECT event_id, name, date, time, reminder_set, location, description, attendees "
+                        "FROM events ORDER BY event_id"):
+                    event_id = row[0]
+                    # Skip orphaned tasks of events that no longer exist
+                    while pending is not None and pending[0] < event_id:
+                        pending = next(task_rows, None)
+                    tasks = []
+                    while pending is not None and pending[0] == event_id:
+                        tasks.append((pending[1], bool(pending[2])))
+                        pending = next(task_rows, None)
+                    yield self._row_to_event(row), tasks
         except sqlite3.Error as e:
-            app_logger.error(f"Error saving event {event.event_id}: {e}")
-            self.conn.rollback()
+            app_logger.error(f"Error streaming events and tasks: {e}")
             raise
 
     def load_events(self) -> List[Event]:
@@ -123,65 +672,200 @@ class DBManager:
         """
         events = []
         try:
-            self.cursor.execute("SELECT event_id, name, date, time, reminder_set, location, description, attendees FROM events")
-            rows = self.cursor.fetchall()
-            for row in rows:
-                event = Event(
-                    event_id=row[0],
-                    name=row[1],
-                    date=row[2],
-                    time=row[3],
-                    reminder_set=bool(row[4]), # Convert integer back to boolean
-                    location=row[5],
-                    description=row[6],
-                    attendees=row[7]
-                )
-                events.append(event)
+            with self.pool.reader() as conn, self.statement_stats.timer('load_events') as timer:
+                for row in conn.execute("SELECT event_id, name, date, time, reminder_set, location, description, attendees FROM events"):
+                    events.append(self._row_to_event(row))
+                timer.rows = len(events)
             app_logger.info(f"Loaded {len(events)} events from DB.")
         except sqlite3.Error as e:
             app_logger.error(f"Error loading events: {e}")
             raise
         return events
 
-    def delete_event(self, event_id: int):
+    @staticmethod
+    def _row_to_event(row: tuple) -> Event:
+        """Builds an Event from an `events` row in column order."""
+        return Event(
+            event_id=row[0],
+            name=row[1],
+            date=row[2],
+            time=row[3],
+            reminder_set=bool(row[4]), # Convert integer back to boolean
+            location=row[5],
+            description=row[6],
+            attendees=row[7]
+        )
+
+    def load_all(self) -> Iterator[Tuple[Event, Optional[LLNode]]]:
         """
-        Deletes an event and all its associated tasks from the database.
-        :param event_id: The ID of the event to delete.
+        Streams every event together with its task linked list using two ordered queries.
+        Events and their tasks are both read in chronological order (via the starts_at index),
+        so the caller can build a balanced BST directly, and the two cursors are merged: each
+        event's task list is chained just before the event is yielded, keeping memory flat.
+        Both queries iterate the cursor rather than calling fetchall().
+        :return: A generator of (Event, head of LLNode task list or None), ordered by date and time.
         """
+        return self.load_range()
+
+    def load_range(self, start: Optional[datetime.datetime] = None, end: Optional[datetime.datetime] = None,
+                   with_tasks: bool = True) -> Iterator[Tuple[Event, Optional[LLNode]]]:
+        """
+        Streams the events starting in [start, end) with their task linked lists, like load_all.
+        Both queries are range scans on the starts_at index, so the cost depends on the size of
+        the range rather than on the size of the whole history, and only the current event's
+        tasks are held at a time.
+        :param start: Earliest event datetime to include, or None for no lower bound.
+        :param end: Datetime to stop before, or None for no upper bound.
+        :param with_tasks: If False, the task query is skipped and every task list is None.
+        :return: A generator of (Event, head of LLNode task list or None), ordered by date and time.
+        """
+        conditions, params = [], []
+        if start is not None:
+            conditions.append("e.starts_at >= ?")
+            params.append(calendar.timegm(start.timetuple()))
+        if end is not None:
+            conditions.append("e.starts_at < ?")
+            params.append(calendar.timegm(end.timetuple()))
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
         try:
-            self.cursor.execute("DELETE FROM events WHERE event_id = ?", (event_id,))
-            # ON DELETE CASCADE in tasks table definition handles task deletion automatically
-            self.conn.commit()
-            app_logger.info(f"Event ID {event_id} and its tasks deleted from DB.")
+            with self.pool.reader() as conn:
+                # Both cursors walk the range in the same (starts_at, event_id) order, so each event's
+                # tasks are the next rows of the task cursor and nothing is buffered ahead
+                task_rows = iter(())
+                if with_tasks:
+                    with self.statement_stats.timer('load_range.tasks'):
+                        task_rows = conn.execute(
+                            "SELECT t.event_id, t.task_description, t.completed FROM events e "
+                            "JOIN tasks t ON t.event_id = e.event_id" + where +
+                            " ORDER BY e.starts_at, e.event_id, t.task_id", params)
+                # Rows are streamed to the caller, so only the time to the first row is recorded
+                with self.statement_stats.timer('load_range.events'):
+                    event_rows = conn.execute(
+                        "SELECT e.event_id, e.name, e.date, e.time, e.reminder_set, e.location, e.description, "
+                        "e.attendees FROM events e" + where + " ORDER BY e.starts_at, e.event_id", params)
+                event_count = task_count = 0
+                pending = next(task_rows, None)
+                for row in event_rows:
+                    event_id = row[0]
+                    head = tail = None
+                    while pending is not None and pending[0] == event_id:
+                        new_node = LLNode(data=pending[1], completed=bool(pending[2]))
+                        if head is None:
+                            head = new_node
+                        else:
+                            tail.next = new_node
+                        tail = new_node
+                        task_count += 1
+                        pending = next(task_rows, None)
+                    event_count += 1
+                    yield self._row_to_event(row), head
+            app_logger.info(f"Loaded {event_count} events and {task_count} tasks from DB "
+                            f"(range {start or 'start'} to {end or 'end'}).")
         except sqlite3.Error as e:
-            app_logger.error(f"Error deleting event {event_id}: {e}")
-            self.conn.rollback()
+            app_logger.error(f"Error loading events and tasks: {e}")
             raise
 
+    def delete_event(self, event_id: int):
+        """
+        Deletes an event and all its associated tasks from the database.
+        :param event_id: The ID of the event to delete.
+        """
+        with self.pool.writer():
+            try:
+                self._execute('delete_event', "DELETE FROM events WHERE event_id = ?", (event_id,))
+                # ON DELETE CASCADE in tasks table definition handles task deletion automatically
+                self._commit()
+                app_logger.info(f"Event ID {event_id} and its tasks deleted from DB.")
+            except sqlite3.Error as e:
+                app_logger.error(f"Error deleting event {event_id}: {e}")
+                self.conn.rollback()
+                raise
+
+    @staticmethod
+    def _iter_chain(tasks_ll_head: Optional[LLNode]) -> Iterator[Tuple[str, bool]]:
+        """Yields (description, completed) for each node of a task linked list."""
+        current_node = tasks_ll_head
+        while current_node:
+            yield current_node.data, current_node.completed
+            current_node = current_node.next
+
+    @staticmethod
+    def _task_rows(event_id: int, tasks_ll_head: Optional[LLNode]) -> Iterator[Tuple[int, str, int]]:
+        """
+        Yields one `tasks` row per node of a task linked list, in list order.
+        Used to stream rows into `executemany` without building an intermediate list.
+        """
+        current_node = tasks_ll_head
+        while current_node:
+            yield (event_id, current_node.data, 1 if current_node.completed else 0)
+            current_node = current_node.next
+
     def save_tasks(self, event_id: int, tasks_ll_head: Optional[LLNode]):
         """
         Saves the linked list of tasks for a given event to the database.
-        It first deletes all existing tasks for the event, then inserts the new ones.
+        It first deletes all existing tasks for the event, then inserts the new ones
+        with a single `executemany` call. Both steps run in one transaction.
         :param event_id: The ID of the event to save tasks for.
         :param tasks_ll_head: The head of the LLNode linked list for tasks.
         """
-        try:
-            # Delete existing tasks for this event
-            self.cursor.execute("DELETE FROM tasks WHERE event_id = ?", (event_id,))
-            
-            current_node = tasks_ll_head
-            while current_node:
-                self.cursor.execute("""
+        with self.pool.writer():
+            try:
+                # Delete existing tasks for this event
+                self._execute('save_tasks.delete', "DELETE FROM tasks WHERE event_id = ?", (event_id,))
+                self._executemany('save_tasks.insert', self._INSERT_TASK_SQL, self._task_rows(event_id, tasks_ll_head))
+                self._commit()
+                app_logger.info(f"Tasks for Event ID {event_id} saved to DB.")
+            except sqlite3.Error as e:
+                app_logger.error(f"Error saving tasks for event {event_id}: {e}")
+                self.conn.rollback()
+                raise
+
+    def save_tasks_bulk(self, task_lists: Mapping[int, Optional[LLNode]], chunk_size: Optional[int] = None) -> int:
+        """
+        Saves the task linked lists of many events in a single transaction.
+        Existing rows for every event in the mapping are deleted and the new rows inserted,
+        both streamed through `executemany` in chunks.
+        :param task_lists: A mapping of {event_id: head of LLNode task list (or None)}.
+        :param chunk_size: Rows per `executemany` call (defaults to self.chunk_size).
+        :return: The number of task rows written.
+        """
+        with self.pool.writer():
+            try:
+                written = self._replace_task_lists(
+                    {event_id: self._iter_chain(head) for event_id, head in task_lists.items()},
+                    chunk_size or self.chunk_size
+                )
+                self._commit()
+                app_logger.info(f"Saved {written} tasks for {len(task_lists)} events to DB in one transaction.")
+            except sqlite3.Error as e:
+                app_logger.error(f"Error saving tasks in bulk: {e}")
+                self.conn.rollback()
+                raise
+            return written
+
+    def insert_tasks(self, event_id: int, tasks: Iterable[str]) -> int:
+        """
+        Appends new (incomplete) tasks for an event in a single transaction.
+        This is the persistence counterpart of `EventPlanner.add_tasks`: existing rows
+        are left untouched and the new rows are written with one `executemany` call.
+        :param event_id: The ID of the event the tasks belong to.
+        :param tasks: An iterable of task descriptions.
+        :return: The number of rows inserted.
+        """
+        with self.pool.writer():
+            try:
+                inserted = self._executemany('insert_tasks', """
                     INSERT INTO tasks (event_id, task_description, completed)
-                    VALUES (?, ?, ?)
-                """, (event_id, current_node.data, 1 if current_node.completed else 0))
-                current_node = current_node.next
-            self.conn.commit()
-            app_logger.info(f"Tasks for Event ID {event_id} saved to DB.")
-        except sqlite3.Error as e:
-            app_logger.error(f"Error saving tasks for event {event_id}: {e}")
-            self.conn.rollback()
-            raise
+                    VALUES (?, ?, 0)
+                """, ((event_id, task) for task in tasks))
+                self._commit()
+                app_logger.info(f"Inserted {inserted} tasks for Event ID {event_id}.")
+                return inserted
+            except sqlite3.Error as e:
+                app_logger.error(f"Error inserting tasks for event {event_id}: {e}")
+                self.conn.rollback()
+                raise
 
     def load_tasks(self, event_id: int) -> Optional[LLNode]:
         """
@@ -192,22 +876,85 @@ class DBManager:
         head = None
         tail = None
         try:
-            self.cursor.execute("SELECT task_description, completed FROM tasks WHERE event_id = ?", (event_id,))
-            rows = self.cursor.fetchall()
-            for row in rows:
-                new_node = LLNode(data=row[0], completed=bool(row[1]))
-                if head is None:
-                    head = new_node
-                    tail = new_node
-                else:
-                    tail.next = new_node
-                    tail = new_node
-            app_logger.info(f"Loaded {len(rows)} tasks for Event ID {event_id}.")
+            count = 0
+            with self.pool.reader() as conn, self.statement_stats.timer('load_tasks') as timer:
+                for row in conn.execute("SELECT task_description, completed FROM tasks WHERE event_id = ? ORDER BY task_id", (event_id,)):
+                    new_node = LLNode(data=row[0], completed=bool(row[1]))
+                    if head is None:
+                        head = new_node
+                        tail = new_node
+                    else:
+                        tail.next = new_node
+                        tail = new_node
+                    count += 1
+                timer.rows = count
+            app_logger.info(f"Loaded {count} tasks for Event ID {event_id}.")
         except sqlite3.Error as e:
             app_logger.error(f"Error loading tasks for event {event_id}: {e}")
             raise
         return head
 
+    _SEARCH_SQL = """
+        SELECT 'event' AS kind, e.event_id, e.name, e.date, e.time,
+               snippet(events_fts, -1, ?, ?, '...', ?) AS snippet, bm25(events_fts, 10.0, 2.0, 1.0, 1.0) AS rank
+        FROM events_fts JOIN events e ON e.event_id = events_fts.rowid
+        WHERE events_fts MATCH ?
+        UNION ALL
+        SELECT 'task' AS kind, e.event_id, e.name, e.date, e.time,
+               snippet(tasks_fts, 0, ?, ?, '...', ?) AS snippet, bm25(tasks_fts) AS rank
+        FROM tasks_fts JOIN tasks t ON t.task_id = tasks_fts.rowid JOIN events e ON e.event_id = t.event_id
+        WHERE tasks_fts MATCH ?
+        ORDER BY rank, event_id
+        LIMIT ? OFFSET ?
+    """
+
+    @staticmethod
+    def _fts_query(text: str) -> str:
+        """
+        Turns free text into an FTS5 query: every word must match, and the last word may be a prefix.
+        Words are quoted, so punctuation and FTS operators typed by the user are matched literally.
+        """
+        words = [word.replace('"', '""') for word in text.split()]
+        if not words:
+            return ""
+        terms = [f'"{word}"' for word in words]
+        terms[-1] += "*"
+        return " ".join(terms)
+
+    def search(self, query: str, limit: int = 20, offset: int = 0, raw: bool = False,
+               highlight: Tuple[str, str] = ("[", "]"), snippet_tokens: int = 12) -> List[dict]:
+        """
+        Keyword search over all events (name, location, description, attendees) and task
+        descriptions in the database, including events not loaded into the planner.
+        Results from both indexes are ranked together by bm25, event names weighted highest.
+        :param query: Words to search for; each must appear, and the last may be a prefix.
+        :param limit: Maximum number of results.
+        :param offset: Number of results to skip, for paging.
+        :param raw: If True, `query` is passed to FTS5 unchanged (phrases, OR, NOT, NEAR). Column
+                    filters are not supported, since the same query runs against both indexes.
+        :param highlight: Markers placed around matched words in snippets.
+        :param snippet_tokens: Maximum number of tokens per snippet.
+        :return: A list of dictionaries with 'kind' ('event' or 'task'), 'event_id', 'name',
+                 'date', 'time', 'snippet' and 'rank' (lower is better).
+        """
+        match = query if raw else self._fts_query(query)
+        if not match:
+            return []
+        start_mark, end_mark = highlight
+        params = (start_mark, end_mark, snippet_tokens, match,
+                  start_mark, end_mark, snippet_tokens, match, limit, offset)
+        try:
+            with self.pool.reader() as conn, self.statement_stats.timer('search') as timer:
+                rows = conn.execute(self._SEARCH_SQL, params).fetchall()
+                timer.rows = len(rows)
+        except sqlite3.Error as e:
+            app_logger.error(f"Error searching for '{query}': {e}")
+            raise
+        columns = ('kind', 'event_id', 'name', 'date', 'time', 'snippet', 'rank')
+        results = [dict(zip(columns, row)) for row in rows]
+        app_logger.info(f"Search for '{query}' returned {len(results)} results.")
+        return results
+
     def get_max_event_id(self) -> int:
         """
         Retrieves the maximum event_id currently in the database.
@@ -215,17 +962,76 @@ class DBManager:
         :return: The maximum event ID, or 0 if no events exist.
         """
         try:
-            self.cursor.execute("SELECT MAX(event_id) FROM events")
-            max_id = self.cursor.fetchone()[0]
+            with self.pool.reader() as conn, self.statement_stats.timer('get_max_event_id'):
+                max_id = conn.execute("SELECT MAX(event_id) FROM events").fetchone()[0]
             return max_id if max_id is not None else 0
         except sqlite3.Error as e:
             app_logger.error(f"Error getting max event ID: {e}")
             return 0 # Return 0 or raise, depending on desired error handling
 
+    def backup(self, dest: str, pages_per_step: int = 256, progress=None, sleep: float = 0.005) -> 'BackupJob':
+        """
+        Starts an online backup of the database to dest and returns immediately.
+        The copy runs on a background thread from a pooled reader connection, a few pages at a
+        time, so the planner can keep reading and writing meanwhile. Writes made by other
+        connections during the copy make SQLite restart it from the first page.
+        :param dest: The backup file to create (replaced once the copy has succeeded).
+        :param pages_per_step: Pages copied per step; -1 copies everything in one step.
+        :param progress: Optional progress(pages_copied, total_pages), called on the backup thread.
+        :param sleep: Seconds to pause between steps.
+        :return: A BackupJob to wait on, poll or cancel.
+        """
+        app_logger.info(f"Starting backup of {self.db_name} to {dest}.")
+        return BackupJob(self.pool, dest, pages_per_step=pages_per_step, sleep=sleep, progress=progress)
+
+    def restore(self, source: str) -> int:
+        """
+        Replaces the contents of the database with a backup, after checking that the backup is
+        intact and not from a newer schema version. The copy is made through the writer
+        connection, so pooled connections see the restored data afterwards; older backups are
+        migrated to the current schema. Any in-memory planner must be reloaded afterwards.
+        :param source: The backup file.
+        :return: The schema version of the restored database.
+        :raises ValueError: If the backup fails validation (the database is left unchanged).
+        """
+        version = validate_backup(source, len(self._MIGRATIONS))
+        backup_conn = sqlite3.connect(source)
+        try:
+            with self.pool.writer() as conn:
+                backup_conn.backup(conn)
+                self._migrate()
+                # The restored contents are a different lineage from anything cached before
+                self.cursor.execute("UPDATE planner_state SET db_uid = lower(hex(randomblob(16)))")
+                self._commit()
+        except sqlite3.Error as e:
+            app_logger.error(f"Error restoring {self.db_name} from {source}: {e}")
+            raise
+        finally:
+            backup_conn.close()
+        app_logger.info(f"Restored {self.db_name} from {source} (schema version {version}).")
+        return self.schema_version()
+
+    def stats(self) -> dict:
+        """
+        Returns latency statistics per statement kind (e.g. 'save_event', 'save_tasks.delete',
+        'save_tasks.insert', 'commit', 'load_events'): call count, sampled calls, errors, rows
+        affected or returned, and total, mean, p50, p95, p99 and max latency in milliseconds.
+        Commit times include the fsync, so slow disks show up under 'commit'.
+        """
+        return self.statement_stats.snapshot()
+
+    def reset_stats(self) -> None:
+        """Clears the statement statistics, e.g. before measuring a specific workload."""
+        self.statement_stats.reset()
+
+    def pool_stats(self) -> dict:
+        """Returns the connection pool counters (checkouts, waits, time spent waiting and holding the writer)."""
+        return self.pool.stats()
+
     def close(self):
-        """Closes the database connection."""
-        if self.conn:
-            self.conn.close()
+        """Closes every pooled database connection."""
+        if self.pool:
+            self.pool.close()
             app_logger.info("Database connection closed.")
 
 # Example usage for testing DBManager
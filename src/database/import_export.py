@@ -0,0 +1,428 @@
+"""
+Streaming import and export of events and their tasks (CSV, JSON Lines and iCalendar).
+Readers and writers are generators working one record at a time, so memory use does not
+grow with the size of the calendar. Imports are validated and written in batches through
+DBManager.insert_batch inside DBManager.bulk_import.
+
+Usage: python src/database/import_export.py import|export FILE [--db events.db] [--format csv|jsonl|ics]
+"""
+
+import csv
+import datetime
+import itertools
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from core.event_planner import Event, EventPlanner, PlannerChanges, logger as app_logger
+from database.db_manager import DBManager
+
+FORMATS = ('csv', 'jsonl', 'ics')
+CSV_COLUMNS = ('event_id', 'name', 'date', 'time', 'reminder_set', 'location', 'description', 'attendees', 'tasks')
+MAX_REPORTED_ERRORS = 100
+
+# A record is a dictionary with the Event fields plus 'tasks': [(description, completed), ...]
+Record = dict
+ExportRow = Tuple[Event, List[Tuple[str, bool]]]
+
+
+@dataclass
+class ImportResult:
+    imported: int = 0
+    skipped: int = 0
+    tasks: int = 0
+    seconds: float = 0.0
+    errors: List[str] = field(default_factory=list)  # First MAX_REPORTED_ERRORS problems, with line numbers
+
+
+def detect_format(path: str) -> str:
+    """Guesses the file format from its extension."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension in ('.jsonl', '.ndjson'):
+        return 'jsonl'
+    if extension in ('.ics', '.ical', '.ifb'):
+        return 'ics'
+    if extension in ('.csv', '.txt'):
+        return 'csv'
+    raise ValueError(f"Cannot tell the format of '{path}'. Use one of: {', '.join(FORMATS)}.")
+
+
+def _parse_bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ('1', 'true', 'yes', 'y', 'x')
+
+
+def _parse_tasks(value) -> List[Tuple[str, bool]]:
+    """Accepts [["task", completed], ...], [{"task": ..., "completed": ...}, ...] or ["task", ...]."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = json.loads(value)
+    tasks = []
+    for item in value:
+        if isinstance(item, str):
+            tasks.append((item, False))
+        elif isinstance(item, dict):
+            tasks.append((str(item['task']), _parse_bool(item.get('completed', False))))
+        else:
+            tasks.append((str(item[0]), _parse_bool(item[1]) if len(item) > 1 else False))
+    return tasks
+
+
+# --- Readers: yield (line number, record) ---
+def read_csv(stream: TextIO) -> Iterator[Tuple[int, Record]]:
+    """Reads records from CSV with a header row (see CSV_COLUMNS; event_id and tasks are optional)."""
+    reader = csv.DictReader(stream)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def read_jsonl(stream: TextIO) -> Iterator[Tuple[int, Record]]:
+    """Reads one JSON object per line; blank lines are ignored."""
+    for line_no, line in enumerate(stream, start=1):
+        if line.strip():
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_no, {'_error': f"invalid JSON: {e.msg}"}
+                continue
+            if isinstance(record, dict):
+                yield line_no, record
+            else:
+                yield line_no, {'_error': "expected a JSON object"}
+
+
+def _ics_unescape(value: str) -> str:
+    result, chars = [], iter(value)
+    for char in chars:
+        if char == '\\':
+            escaped = next(chars, '')
+            result.append('\n' if escaped in 'nN' else escaped)
+        else:
+            result.append(char)
+    return ''.join(result)
+
+
+def _ics_lines(stream: TextIO) -> Iterator[Tuple[int, str]]:
+    """Yields unfolded content lines (continuation lines start with a space or tab)."""
+    current, start_line = None, 0
+    for line_no, line in enumerate(stream, start=1):
+        line = line.rstrip('\r\n')
+        if line[:1] in (' ', '\t') and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield start_line, current
+        current, start_line = line, line_no
+    if current is not None:
+        yield start_line, current
+
+
+def _ics_property(line: str) -> Tuple[str, dict, str]:
+    """Splits 'NAME;PARAM=VALUE:content' into (NAME, {PARAM: VALUE}, content), honouring quoted parameters."""
+    in_quotes = False
+    for index, char in enumerate(line):
+        if char == '"':
+            in_quotes = not in_quotes
+        elif char == ':' and not in_quotes:
+            head, value = line[:index], line[index + 1:]
+            break
+    else:
+        head, value = line, ''
+    name, *params = head.split(';')
+    parsed = {}
+    for param in params:
+        key, _, param_value = param.partition('=')
+        parsed[key.upper()] = param_value.strip('"')
+    return name.upper(), parsed, value
+
+
+def read_ics(stream: TextIO) -> Iterator[Tuple[int, Record]]:
+    """
+    Reads VEVENT components. DTSTART may be a local, UTC (read as-is) or all-day (00:00) value;
+    a VALARM sets the reminder, ATTENDEE common names become attendees (commas in a name become
+    spaces) and X-PLANNER-TASK
+    lines (written by write_ics) become tasks.
+    """
+    record, start_line, depth = None, 0, []
+    for line_no, line in _ics_lines(stream):
+        name, params, value = _ics_property(line)
+        if name == 'BEGIN':
+            depth.append(value.upper())
+            if value.upper() == 'VEVENT':
+                record, start_line = {'attendees': [], 'tasks': [], 'reminder_set': False}, line_no
+            elif value.upper() == 'VALARM' and record is not None:
+                record['reminder_set'] = True
+            continue
+        if name == 'END':
+            if depth:
+                depth.pop()
+            if value.upper() == 'VEVENT' and record is not None:
+                record['attendees'] = ','.join(record['attendees'])
+                yield start_line, record
+                record = None
+            continue
+        if record is None or depth[-1:] != ['VEVENT']:
+            continue
+        if name == 'SUMMARY':
+            record['name'] = _ics_unescape(value)
+        elif name == 'LOCATION':
+            record['location'] = _ics_unescape(value)
+        elif name == 'DESCRIPTION':
+            record['description'] = _ics_unescape(value)
+        elif name == 'DTSTART':
+            stamp = value.rstrip('Z')
+            if len(stamp) < 8 or not stamp[:8].isdigit():
+                record['_error'] = f"invalid DTSTART '{value}'"
+                continue
+            record['date'] = f"{stamp[:4]}-{stamp[4:6]}-{stamp[6:8]}"
+            record['time'] = f"{stamp[9:11]}:{stamp[11:13]}" if len(stamp) >= 13 and stamp[8] == 'T' else "00:00"
+        elif name == 'ATTENDEE':
+            attendee = params.get('CN') or value.split(':', 1)[-1]
+            # Attendees are stored comma-separated, so a comma inside a name ("Lee, Sam") would split it
+            attendee = ' '.join(attendee.replace(',', ' ').split())
+            if attendee:
+                record['attendees'].append(attendee)
+        elif name == 'X-PLANNER-TASK':
+            record['tasks'].append((_ics_unescape(value), _parse_bool(params.get('X-COMPLETED', 'FALSE'))))
+
+
+READERS = {'csv': read_csv, 'jsonl': read_jsonl, 'ics': read_ics}
+
+
+# --- Validation ---
+def _validate(line_no: int, record: Record) -> Tuple[Optional[Event], List[Tuple[str, bool]], Optional[str]]:
+    """
+    Turns a record into an Event (with a placeholder ID) and its tasks.
+    :return: (Event, tasks, None) or (None, [], error message).
+    """
+    if '_error' in record:
+        return None, [], f"line {line_no}: {record['_error']}"
+    name = (record.get('name') or '').strip()
+    date = (record.get('date') or '').strip()
+    time_ = (record.get('time') or '').strip()
+    if not name:
+        return None, [], f"line {line_no}: missing name"
+    try:
+        event_dt = EventPlanner._get_datetime(date, time_)
+        tasks = _parse_tasks(record.get('tasks'))
+        event_id = int(record['event_id']) if record.get('event_id') not in (None, '') else 0
+    except (ValueError, TypeError, KeyError, IndexError) as e:
+        return None, [], f"line {line_no}: {e}"
+    if len(date) != 10 or len(time_) != 5:
+        # Store the canonical zero-padded form the rest of the planner relies on
+        date, time_ = event_dt.strftime("%Y-%m-%d"), event_dt.strftime("%H:%M")
+    event = Event(event_id, name, date, time_, _parse_bool(record.get('reminder_set', False)),
+                  record.get('location') or "", record.get('description') or "", record.get('attendees') or "")
+    return event, tasks, None
+
+
+# --- Import ---
+def import_events(db_manager: DBManager, path: str, fmt: Optional[str] = None, batch_size: int = 5000,
+                  keep_ids: bool = False, progress: Optional[Callable[[int, int], None]] = None,
+                  planner: Optional[EventPlanner] = None, window_days: Optional[int] = None) -> ImportResult:
+    """
+    Imports events and tasks from a CSV, JSONL or ICS file in constant memory.
+    Records are validated and written batch_size at a time (one transaction per batch);
+    invalid records are skipped and reported in the result.
+    :param db_manager: The database to import into.
+    :param path: The file to read.
+    :param fmt: 'csv', 'jsonl' or 'ics'; guessed from the extension if None.
+    :param batch_size: Records validated and committed together.
+    :param keep_ids: Keep event_id values from the file (overwriting those events and replacing
+                     their tasks) instead of assigning new IDs after the current maximum.
+    :param progress: Called as progress(imported, skipped) after every batch.
+    :param planner: An empty EventPlanner to bulk-build from the database once the import is done.
+    :param window_days: If given, the planner loads only that many past days plus the future (load_window).
+    :return: An ImportResult with counts, timing and the first errors.
+    """
+    fmt = fmt or detect_format(path)
+    if fmt not in READERS:
+        raise ValueError(f"Unknown format '{fmt}'. Use one of: {', '.join(FORMATS)}.")
+    result = ImportResult()
+    started = time.perf_counter()
+    next_id = db_manager.get_max_event_id() + 1
+
+    with open(path, newline='' if fmt == 'csv' else None, encoding='utf-8') as stream, db_manager.bulk_import():
+        records = READERS[fmt](stream)
+        while True:
+            batch = list(itertools.islice(records, batch_size))
+            if not batch:
+                break
+            events, task_lists = [], {}
+            for line_no, record in batch:
+                event, tasks, error = _validate(line_no, record)
+                if error:
+                    result.skipped += 1
+                    if len(result.errors) < MAX_REPORTED_ERRORS:
+                        result.errors.append(error)
+                    continue
+                if not keep_ids or not event.event_id:
+                    event.event_id = next_id
+                    next_id += 1
+                else:
+                    next_id = max(next_id, event.event_id + 1)
+                events.append(event)
+                task_lists[event.event_id] = tasks
+            if keep_ids:
+                db_manager.apply_changes(PlannerChanges(events=events, deleted_event_ids=[], task_lists=task_lists))
+                result.tasks += sum(len(tasks) for tasks in task_lists.values())
+            else:
+                result.tasks += db_manager.insert_batch(events, task_lists)
+            result.imported += len(events)
+            if progress:
+                progress(result.imported, result.skipped)
+
+    if planner is not None:
+        if window_days is not None:
+            planner.load_window(db_manager, past_days=window_days)
+        else:
+            planner.bulk_load(db_manager.load_all())
+        planner.event_id_counter = max(planner.event_id_counter, next_id)
+    result.seconds = time.perf_counter() - started
+    app_logger.info(f"Imported {result.imported} events ({result.tasks} tasks) from {path} in "
+                    f"{result.seconds:.1f}s; skipped {result.skipped}.")
+    return result
+
+
+# --- Writers: consume (Event, tasks) rows ---
+def write_csv(stream: TextIO, rows: Iterable[ExportRow]) -> Iterator[int]:
+    """Writes CSV with a header row; tasks are a JSON list of [description, completed] pairs."""
+    writer = csv.writer(stream)
+    writer.writerow(CSV_COLUMNS)
+    for event, tasks in rows:
+        writer.writerow((event.event_id, event.name, event.date, event.time, int(event.reminder_set),
+                         event.location, event.description, event.attendees,
+                         json.dumps(tasks, ensure_ascii=False) if tasks else ""))
+        yield 1
+
+
+def write_jsonl(stream: TextIO, rows: Iterable[ExportRow]) -> Iterator[int]:
+    """Writes one JSON object per event; tasks use the get_tasks shape ({"task", "completed"})."""
+    for event, tasks in rows:
+        stream.write(json.dumps({
+            'event_id': event.event_id, 'name': event.name, 'date': event.date, 'time': event.time,
+            'reminder_set': event.reminder_set, 'location': event.location,
+            'description': event.description, 'attendees': event.attendees,
+            'tasks': [{'task': task, 'completed': completed} for task, completed in tasks],
+        }, ensure_ascii=False))
+        stream.write('\n')
+        yield 1
+
+
+def _ics_escape(value: str) -> str:
+    return (value.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\\n').replace('\n', '\\n'))
+
+
+def _ics_fold(line: str) -> str:
+    """Folds a content line at 75 octets, as RFC 5545 requires."""
+    encoded = line.encode('utf-8')
+    if len(encoded) <= 75:
+        return line + '\r\n'
+    parts, start, limit = [], 0, 75
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        while end < len(encoded) and (encoded[end] & 0xC0) == 0x80:  # Don't split a UTF-8 sequence
+            end -= 1
+        parts.append(encoded[start:end].decode('utf-8'))
+        start, limit = end, 74  # Continuation lines start with a space
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def write_ics(stream: TextIO, rows: Iterable[ExportRow]) -> Iterator[int]:
+    """
+    Writes an iCalendar file with one VEVENT per event (floating local DTSTART), a display
+    VALARM three minutes before events with reminders, and tasks as X-PLANNER-TASK lines.
+    """
+    stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    stream.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Event Planner//EN\r\n")
+    for event, tasks in rows:
+        lines = ["BEGIN:VEVENT",
+                 f"UID:event-{event.event_id}@event-planner",
+                 f"DTSTAMP:{stamp}",
+                 f"DTSTART:{event.date.replace('-', '')}T{event.time.replace(':', '')}00",
+                 f"SUMMARY:{_ics_escape(event.name)}"]
+        if event.location:
+            lines.append(f"LOCATION:{_ics_escape(event.location)}")
+        if event.description:
+            lines.append(f"DESCRIPTION:{_ics_escape(event.description)}")
+        for attendee in filter(None, (a.strip() for a in (event.attendees or "").split(','))):
+            lines.append(f'ATTENDEE;CN="{attendee.replace(chr(34), "")}":urn:x-event-planner:attendee')
+        for task, completed in tasks:
+            lines.append(f"X-PLANNER-TASK;X-COMPLETED={'TRUE' if completed else 'FALSE'}:{_ics_escape(task)}")
+        if event.reminder_set:
+            lines += ["BEGIN:VALARM", "ACTION:DISPLAY", "TRIGGER:-PT3M", "DESCRIPTION:Reminder", "END:VALARM"]
+        lines.append("END:VEVENT")
+        stream.write(''.join(_ics_fold(line) for line in lines))
+        yield 1
+    stream.write("END:VCALENDAR\r\n")
+
+
+WRITERS = {'csv': write_csv, 'jsonl': write_jsonl, 'ics': write_ics}
+
+
+def export_events(db_manager: DBManager, path: str, fmt: Optional[str] = None,
+                  progress: Optional[Callable[[int], None]] = None, progress_every: int = 10000) -> int:
+    """
+    Exports every event and its tasks from the database in constant memory.
+    :param db_manager: The database to export.
+    :param path: The file to write (overwritten).
+    :param fmt: 'csv', 'jsonl' or 'ics'; guessed from the extension if None.
+    :param progress: Called as progress(exported) every progress_every events and at the end.
+    :param progress_every: Events between progress calls.
+    :return: The number of events exported.
+    """
+    fmt = fmt or detect_format(path)
+    if fmt not in WRITERS:
+        raise ValueError(f"Unknown format '{fmt}'. Use one of: {', '.join(FORMATS)}.")
+    exported = 0
+    with open(path, 'w', newline='' if fmt in ('csv', 'ics') else None, encoding='utf-8') as stream:
+        for _ in WRITERS[fmt](stream, db_manager.iter_events_with_tasks()):
+            exported += 1
+            if progress and exported % progress_every == 0:
+                progress(exported)
+    if progress:
+        progress(exported)
+    app_logger.info(f"Exported {exported} events to {path}.")
+    return exported
+
+
+def main():
+    import argparse
+    import logging
+    parser = argparse.ArgumentParser(description="Import or export Event Planner data.")
+    parser.add_argument('action', choices=('import', 'export'))
+    parser.add_argument('file')
+    parser.add_argument('--db', default="events.db")
+    parser.add_argument('--format', choices=FORMATS)
+    parser.add_argument('--keep-ids', action='store_true', help="Import: keep event IDs from the file")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    db_manager = DBManager(args.db)
+    try:
+        if args.action == 'import':
+            result = import_events(db_manager, args.file, args.format, keep_ids=args.keep_ids,
+                                   progress=lambda done, skipped: print(f"\r{done} imported, {skipped} skipped",
+                                                                        end='', flush=True))
+            print(f"\nImported {result.imported} events and {result.tasks} tasks in {result.seconds:.1f}s.")
+            for error in result.errors:
+                print(f"  skipped {error}")
+        else:
+            count = export_events(db_manager, args.file, args.format,
+                                  progress=lambda done: print(f"\r{done} exported", end='', flush=True))
+            print(f"\nExported {count} events.")
+    finally:
+        db_manager.close()
+
+
+if __name__ == "__main__":
+    main()
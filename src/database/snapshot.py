@@ -0,0 +1,251 @@
+"""
+Binary snapshots of the planner's hot window for fast startup.
+A snapshot holds the hot-window events in chronological order as packed integer columns,
+every distinct string (names, dates, times, task descriptions...) once in a shared string
+table, and all tasks as two flat arrays. Loading it needs no SQL and no sorting: the file is
+read in one pass (memory-mapped where possible) and the rows are handed, already in order,
+to EventPlanner.restore_window.
+
+A snapshot is only used if it was written by this format version, for the same schema version
+(PRAGMA user_version) and for the same database contents (DBManager.generation), and if its
+CRC-32 checksum matches; otherwise callers fall back to loading from the database.
+
+Layout: a fixed header (see _HEADER), then the payload sections in this order:
+string end offsets (int32, in characters), the UTF-8 string blob, the event columns
+(event_id int64; name, date, time, location, description, attendees string ids int32;
+flags uint8; task count int32) and the task columns (description string id int32; completed uint8).
+"""
+
+import datetime
+import mmap
+import os
+import struct
+import sys
+import time
+import zlib
+from array import array
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from core.event_planner import Event, EventPlanner, LLNode, logger as app_logger
+
+_MAGIC = b"EPSNAP\x00\x01"
+FORMAT_VERSION = 1
+# magic, format version, schema version, byte order, generation, window start (minutes since
+# the epoch, or _NO_WINDOW), event count, task count, string count, blob bytes, db uid, payload CRC-32
+_HEADER = struct.Struct("<8sIIBxxxqqIIIQ32sI")
+_NO_WINDOW = -(1 << 63)
+_BYTE_ORDER = 0 if sys.byteorder == "little" else 1
+_EPOCH = datetime.datetime(1970, 1, 1)
+_REMINDER_FLAG = 1
+_EVENT_STRING_FIELDS = ('name', 'date', 'time', 'location', 'description', 'attendees')
+
+# Fixed-size array typecodes; 'i' is 4 bytes and 'q' 8 bytes on every supported platform
+assert array('i').itemsize == 4 and array('q').itemsize == 8
+
+
+@dataclass
+class SnapshotInfo:
+    events: int
+    tasks: int
+    strings: int
+    size: int  # Bytes
+    seconds: float
+
+
+def default_path(db_name: str) -> str:
+    """Returns the snapshot file used for a database file (next to it)."""
+    return db_name + ".snapshot"
+
+
+def _state_token(db_manager) -> Tuple[int, str, int]:
+    """Returns (schema version, database id, generation) of the database the snapshot must match."""
+    db_uid, generation = db_manager.generation()
+    return db_manager.schema_version(), db_uid, generation
+
+
+def write_snapshot(planner: EventPlanner, db_manager, path: str) -> SnapshotInfo:
+    """
+    Writes the planner's hot window to a snapshot file, atomically (temporary file + rename).
+    Only call this when everything in the planner has been written to the database
+    (e.g. on a clean shutdown), since the snapshot is stamped with the database generation.
+    :param planner: The planner to snapshot.
+    :param db_manager: The DBManager holding the same data.
+    :param path: The snapshot file.
+    :return: A SnapshotInfo with counts and the file size.
+    :raises ValueError: If the planner has unsaved changes.
+    """
+    started = time.perf_counter()
+    if planner.has_unsaved_changes():
+        raise ValueError("The planner has unsaved changes; flush them before writing a snapshot.")
+    schema_version, db_uid, generation = _state_token(db_manager)
+
+    string_ids = {}
+    strings = []
+
+    def intern(text) -> int:
+        text = "" if text is None else text
+        string_id = string_ids.get(text)
+        if string_id is None:
+            string_id = string_ids[text] = len(strings)
+            strings.append(text)
+        return string_id
+
+    event_ids = array('q')
+    string_columns = [array('i') for _ in _EVENT_STRING_FIELDS]
+    flags = bytearray()
+    task_counts = array('i')
+    task_text = array('i')
+    task_completed = bytearray()
+    for event, tasks in planner.window_rows():
+        event_ids.append(event.event_id)
+        for column, field in zip(string_columns, _EVENT_STRING_FIELDS):
+            column.append(intern(getattr(event, field)))
+        flags.append(_REMINDER_FLAG if event.reminder_set else 0)
+        task_counts.append(len(tasks))
+        for description, completed in tasks:
+            task_text.append(intern(description))
+            task_completed.append(1 if completed else 0)
+
+    string_ends = array('i')
+    position = 0
+    for text in strings:
+        position += len(text)
+        string_ends.append(position)
+    blob = "".join(strings).encode("utf-8", "surrogatepass")
+
+    sections = [string_ends.tobytes(), blob, event_ids.tobytes(),
+                *(column.tobytes() for column in string_columns),
+                bytes(flags), task_counts.tobytes(), task_text.tobytes(), bytes(task_completed)]
+    checksum = 0
+    for section in sections:
+        checksum = zlib.crc32(section, checksum)
+    window = planner.window_start
+    window_minutes = _NO_WINDOW if window is None else (window - _EPOCH) // datetime.timedelta(minutes=1)
+    header = _HEADER.pack(_MAGIC, FORMAT_VERSION, schema_version, _BYTE_ORDER, generation, window_minutes,
+                          len(event_ids), len(task_text), len(strings), len(blob),
+                          db_uid.encode("ascii"), checksum)
+
+    partial = path + ".part"
+    with open(partial, "wb") as f:
+        f.write(header)
+        for section in sections:
+            f.write(section)
+    os.replace(partial, path)
+    info = SnapshotInfo(len(event_ids), len(task_text), len(strings), os.path.getsize(path),
+                        time.perf_counter() - started)
+    app_logger.info(f"Wrote planner snapshot {path}: {info.events} events, {info.tasks} tasks, "
+                    f"{info.strings} strings, {info.size} bytes in {info.seconds:.3f}s.")
+    return info
+
+
+def _read_file(path: str):
+    """Maps a file read-only, or reads it if it cannot be mapped. Returns a buffer and a closer."""
+    f = open(path, "rb")
+    try:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        data = f.read()
+        f.close()
+        return data, lambda: None
+    f.close()  # The mapping stays valid after the file is closed
+    return mapped, mapped.close
+
+
+def load_snapshot(planner: EventPlanner, db_manager, path: str, max_cold_pages: int = 12) -> Optional[int]:
+    """
+    Loads a snapshot into an empty planner if it is valid for the database's current contents.
+    :param planner: An empty EventPlanner.
+    :param db_manager: The DBManager the planner will fault older events in from.
+    :param path: The snapshot file.
+    :param max_cold_pages: Passed to EventPlanner.restore_window.
+    :return: The number of events loaded, or None if there is no usable snapshot (the planner is
+             then untouched and should be loaded from the database).
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        data, close = _read_file(path)
+    except OSError as e:
+        app_logger.warning(f"Could not read planner snapshot {path}: {e}")
+        return None
+    try:
+        rows = _decode(data, _state_token(db_manager), path)
+        if rows is None:
+            return None
+        window_start, events, heads = rows
+    finally:
+        close()
+
+    if window_start is None:
+        return planner.bulk_load(zip(events, heads))
+    return planner.restore_window(db_manager, window_start, zip(events, heads), max_cold_pages)
+
+
+def _decode(data, expected: Tuple[int, str, int], path: str):
+    """Validates and decodes a snapshot buffer. Returns (window start, events, task list heads) or None."""
+    if len(data) < _HEADER.size:
+        app_logger.info(f"Ignoring planner snapshot {path}: file is truncated.")
+        return None
+    (magic, format_version, schema_version, byte_order, generation, window_minutes,
+     event_count, task_count, string_count, blob_size, db_uid, checksum) = _HEADER.unpack_from(data)
+    found = (schema_version, db_uid.decode("ascii", "replace"), generation)
+    if magic != _MAGIC or format_version != FORMAT_VERSION or byte_order != _BYTE_ORDER:
+        app_logger.info(f"Ignoring planner snapshot {path}: unsupported format.")
+        return None
+    if found != expected:
+        app_logger.info(f"Ignoring planner snapshot {path}: written for database state {found}, "
+                        f"database is at {expected}.")
+        return None
+    sizes = [4 * string_count, blob_size, 8 * event_count, *([4 * event_count] * len(_EVENT_STRING_FIELDS)),
+             event_count, 4 * event_count, 4 * task_count, task_count]
+    if len(data) != _HEADER.size + sum(sizes):
+        app_logger.info(f"Ignoring planner snapshot {path}: size does not match its header.")
+        return None
+    view = memoryview(data)
+    try:
+        sections = []
+        offset = _HEADER.size
+        crc = 0
+        for size in sizes:
+            section = view[offset:offset + size]
+            crc = zlib.crc32(section, crc)
+            sections.append(section)
+            offset += size
+        if crc != checksum:
+            app_logger.warning(f"Ignoring planner snapshot {path}: checksum mismatch.")
+            return None
+
+        string_ends = array('i', sections[0].tobytes())
+        text = str(sections[1], "utf-8", "surrogatepass")
+        strings = []
+        start = 0
+        for end in string_ends:
+            strings.append(text[start:end])
+            start = end
+        event_ids = array('q', sections[2].tobytes())
+        columns = [[strings[i] for i in array('i', section.tobytes())] for section in sections[3:9]]
+        flags = sections[9].tobytes()
+        task_counts = array('i', sections[10].tobytes())
+        task_text = array('i', sections[11].tobytes())
+        task_completed = sections[12].tobytes()
+    finally:
+        view.release()
+
+    events = [Event(event_id, name, date, time, bool(flag & _REMINDER_FLAG), location, description, attendees)
+              for event_id, name, date, time, location, description, attendees, flag
+              in zip(event_ids, *columns, flags)]
+    heads = []
+    position = 0
+    for count in task_counts:
+        head = None
+        # Chain each event's tasks back to front, so every node is linked as it is created
+        for i in range(position + count - 1, position - 1, -1):
+            node = LLNode(strings[task_text[i]], task_completed[i] == 1)
+            node.next = head
+            head = node
+        heads.append(head)
+        position += count
+    window_start = None if window_minutes == _NO_WINDOW else _EPOCH + datetime.timedelta(minutes=window_minutes)
+    return window_start, events, heads
+
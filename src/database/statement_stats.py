@@ -0,0 +1,210 @@
+"""
+Per-statement latency statistics for DBManager.
+Every timed statement kind (e.g. 'save_event', 'save_tasks.delete', 'commit') gets an exact call
+counter, a row counter and a log-scale latency histogram from which p50/p95/p99 are estimated. Histogram
+buckets are a quarter of a power of two wide, so percentiles are accurate to about 10% while
+recording stays O(1) and memory stays constant. Timing can be sampled to keep overhead down;
+each kind is sampled on its own, so kinds that always run together (a save and its commit) are
+all timed, and calls are counted whether or not they are timed.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+from core.event_planner import logger as app_logger
+
+_SUB_BUCKETS = 4  # Histogram buckets per power of two
+_HISTOGRAM_SIZE = 64 * _SUB_BUCKETS  # Covers any duration up to 2**64 ns
+
+
+def _bucket(nanoseconds: int) -> int:
+    """Maps a duration to its histogram bucket (exact below 8ns, then 4 buckets per doubling)."""
+    if nanoseconds < 8:
+        return max(nanoseconds, 0)
+    bits = nanoseconds.bit_length()
+    return (bits - 2) * _SUB_BUCKETS + ((nanoseconds >> (bits - 3)) & 3)
+
+
+def _bucket_midpoint(index: int) -> float:
+    """Returns the middle of a histogram bucket, in nanoseconds."""
+    if index < 8:
+        return float(index)
+    shift = index // _SUB_BUCKETS - 1
+    lower = (_SUB_BUCKETS + index % _SUB_BUCKETS) << shift
+    return lower + (1 << shift) / 2
+
+
+class _KindStats:
+    __slots__ = ('count', 'countdown', 'sampled', 'errors', 'rows', 'total_ns', 'max_ns', 'histogram')
+
+    def __init__(self):
+        self.count = 0  # Calls, timed or not
+        self.countdown = 1  # Calls left until the next timed one
+        self.sampled = 0
+        self.errors = 0
+        self.rows = 0  # Rows affected or returned by sampled calls
+        self.total_ns = 0
+        self.max_ns = 0
+        self.histogram = [0] * _HISTOGRAM_SIZE  # Sampled calls per bucket
+
+    def percentile_ms(self, fraction: float) -> float:
+        """Estimates a latency percentile from the histogram, in milliseconds."""
+        if not self.sampled:
+            return 0.0
+        rank = max(1, round(fraction * self.sampled))
+        seen = 0
+        for bucket, calls in enumerate(self.histogram):
+            seen += calls
+            if seen >= rank:
+                return min(_bucket_midpoint(bucket), self.max_ns) / 1e6
+        return self.max_ns / 1e6
+
+
+class _Timer:
+    """Times one block; set `rows` inside the block to record rows affected or returned."""
+    __slots__ = ('_stats', '_kind', '_started', 'rows')
+
+    def __init__(self, stats: 'StatementStats', kind: str):
+        self._stats = stats
+        self._kind = kind
+        self.rows = 0
+
+    def __enter__(self) -> '_Timer':
+        self._started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._stats.record(self._kind, time.perf_counter_ns() - self._started, self.rows, exc_type is not None)
+
+
+class _NullTimer:
+    """Stands in for _Timer when a call is not sampled."""
+    __slots__ = ('rows',)
+
+    def __enter__(self) -> '_NullTimer':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class StatementStats:
+    def __init__(self, sample_rate: float = 1.0, log_interval: Optional[float] = None):
+        """
+        :param sample_rate: Fraction of statements timed, from 0.0 (statistics off) to 1.0 (every
+                            statement). With a rate below 1, every 1/rate-th statement of each
+                            kind is timed; all statements are still counted.
+        :param log_interval: If set, a summary line is logged at most every log_interval seconds
+                             while statements are running.
+        """
+        self.log_interval = log_interval
+        self._lock = threading.Lock()
+        self._kinds: Dict[str, _KindStats] = {}
+        self._sample_every = 1
+        self.sample_rate = sample_rate
+        self._started = time.monotonic()
+        self._next_log = self._started + log_interval if log_interval else None
+
+    @property
+    def sample_rate(self) -> float:
+        return 0.0 if self._sample_every == 0 else 1.0 / self._sample_every
+
+    @sample_rate.setter
+    def sample_rate(self, rate: float) -> None:
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError(f"Sample rate must be between 0 and 1, not {rate}.")
+        with self._lock:
+            self._sample_every = 0 if rate == 0 else max(1, round(1 / rate))
+            for stats in self._kinds.values():
+                stats.countdown = 1
+
+    def _kind(self, kind: str) -> _KindStats:
+        """Returns the statistics of a kind, creating them on first use (call with the lock held)."""
+        stats = self._kinds.get(kind)
+        if stats is None:
+            stats = self._kinds[kind] = _KindStats()
+        return stats
+
+    def sample(self, kind: str) -> bool:
+        """
+        Counts one statement of the given kind and returns True if it should be timed
+        (and then passed to record()). Counts nothing when statistics are off (rate 0).
+        """
+        if self._sample_every == 0:
+            return False
+        with self._lock:
+            stats = self._kind(kind)
+            stats.count += 1
+            stats.countdown -= 1
+            if stats.countdown > 0:
+                return False
+            stats.countdown = self._sample_every
+            return True
+
+    def record(self, kind: str, elapsed_ns: int, rows: int = 0, failed: bool = False) -> None:
+        """Adds the timing of one statement of the given kind, already counted by sample(kind)."""
+        with self._lock:
+            stats = self._kind(kind)
+            stats.sampled += 1
+            stats.total_ns += elapsed_ns
+            if elapsed_ns > stats.max_ns:
+                stats.max_ns = elapsed_ns
+            if rows > 0:
+                stats.rows += rows
+            if failed:
+                stats.errors += 1
+            stats.histogram[_bucket(elapsed_ns)] += 1
+        if self._next_log is not None and time.monotonic() >= self._next_log:
+            self._next_log = time.monotonic() + self.log_interval
+            self.log_summary()
+
+    def timer(self, kind: str):
+        """
+        Returns a context manager timing a block (e.g. a query and the loop reading its rows)
+        if this call is sampled:
+            with stats.timer('load_events') as timer:
+                timer.rows = len(rows)
+        """
+        return _Timer(self, kind) if self.sample(kind) else _NULL_TIMER
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        Returns {kind: {'count', 'sampled', 'errors', 'rows', 'total_ms', 'mean_ms', 'p50_ms',
+        'p95_ms', 'p99_ms', 'max_ms'}}. 'count' is the exact number of calls; latencies,
+        errors and rows cover the 'sampled' (timed) calls only.
+        """
+        with self._lock:
+            result = {}
+            for kind, stats in sorted(self._kinds.items()):
+                result[kind] = {
+                    'count': stats.count,
+                    'sampled': stats.sampled,
+                    'errors': stats.errors,
+                    'rows': stats.rows,
+                    'total_ms': stats.total_ns / 1e6,
+                    'mean_ms': stats.total_ns / stats.sampled / 1e6 if stats.sampled else 0.0,
+                    'p50_ms': stats.percentile_ms(0.50),
+                    'p95_ms': stats.percentile_ms(0.95),
+                    'p99_ms': stats.percentile_ms(0.99),
+                    'max_ms': stats.max_ns / 1e6,
+                }
+            return result
+
+    def reset(self) -> None:
+        """Clears all counters and histograms."""
+        with self._lock:
+            self._kinds = {}
+            self._started = time.monotonic()
+
+    def log_summary(self) -> None:
+        """Logs one line with the busiest statement kinds (by total time) and their percentiles."""
+        snapshot = self.snapshot()
+        busiest = sorted(snapshot.items(), key=lambda item: item[1]['total_ms'], reverse=True)[:8]
+        parts = [f"{kind} n={s['count']} p50={s['p50_ms']:.2f} p95={s['p95_ms']:.2f} p99={s['p99_ms']:.2f}"
+                 for kind, s in busiest]
+        app_logger.info(f"DB statement latency (ms) over {time.monotonic() - self._started:.1f}s: "
+                        + ("; ".join(parts) or "no statements"))
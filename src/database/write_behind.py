@@ -0,0 +1,221 @@
+"""
+Write-behind persistence for the Event Planner.
+A background thread owns its own SQLite connection and writes planner changes
+(EventPlanner.collect_changes) in batches, so the GUI thread never waits on disk.
+Repeated writes to the same event or task list are coalesced while they are pending.
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+from core.event_planner import PlannerChanges, logger as app_logger
+from database.db_manager import DBManager
+
+
+class WriteBehindWriter:
+    def __init__(self, db_name: str = "events.db", flush_interval: float = 2.0, max_pending: int = 500,
+                 db_factory: Optional[Callable[[], DBManager]] = None):
+        """
+        Starts the writer thread.
+        :param db_name: The SQLite database file the writer opens its own connection to.
+        :param flush_interval: Seconds between timed flushes while changes are pending.
+        :param max_pending: Number of pending rows (events + deletions + task lists) that triggers an early flush.
+        :param db_factory: Optional callable creating the DBManager inside the writer thread.
+        """
+        self.db_name = db_name
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._db_factory = db_factory or (lambda: DBManager(db_name=self.db_name))
+
+        # Pending changes, coalesced per row
+        self._pending_events = {}  # {event_id: Event}
+        self._pending_deletes = set()  # {event_id}
+        self._pending_tasks = {}  # {event_id: [(task, completed), ...]}
+
+        self._condition = threading.Condition()
+        self._wake = threading.Event()
+        self._submitted_seq = 0  # Incremented on every submit
+        self._written_seq = 0  # Highest submit sequence known to be on disk
+        self._writing = False
+        self._closing = False
+        self._last_error = None
+        self._stats = {'submitted': 0, 'coalesced': 0, 'batches': 0, 'rows_written': 0, 'errors': 0,
+                       'last_batch_seconds': 0.0}
+
+        self._db_manager = None  # Opened by the writer thread
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._last_error is not None:
+            raise self._last_error
+        app_logger.info(f"Write-behind writer started for {self.db_name}")
+
+    # --- Producer side (GUI thread) ---
+    def submit(self, changes: PlannerChanges) -> None:
+        """
+        Queues a planner delta for writing. Returns immediately.
+        Later changes to the same event or task list replace earlier pending ones.
+        :param changes: A PlannerChanges from EventPlanner.collect_changes().
+        """
+        if changes.is_empty():
+            return
+        with self._condition:
+            if self._closing:
+                raise RuntimeError("Write-behind writer is closed.")
+            for event_id in changes.deleted_event_ids:
+                if self._pending_events.pop(event_id, None) is not None:
+                    self._stats['coalesced'] += 1
+                if self._pending_tasks.pop(event_id, None) is not None:
+                    self._stats['coalesced'] += 1
+                self._pending_deletes.add(event_id)
+            for event in changes.events:
+                if event.event_id in self._pending_events:
+                    self._stats['coalesced'] += 1
+                self._pending_deletes.discard(event.event_id)
+                self._pending_events[event.event_id] = event
+            for event_id, tasks in changes.task_lists.items():
+                if event_id in self._pending_tasks:
+                    self._stats['coalesced'] += 1
+                self._pending_tasks[event_id] = tasks
+            self._stats['submitted'] += len(changes.events) + len(changes.deleted_event_ids) + len(changes.task_lists)
+            self._submitted_seq += 1
+            if self._pending_count() >= self.max_pending:
+                self._wake.set()
+
+    def request_flush(self) -> None:
+        """Asks the writer to write pending changes now, without waiting."""
+        self._wake.set()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Writes everything submitted so far and waits until it is on disk.
+        :param timeout: Maximum seconds to wait, or None to wait indefinitely.
+        :return: True if all submitted changes were written, False on timeout or write error.
+        """
+        with self._condition:
+            target = self._submitted_seq
+            errors_before = self._stats['errors']
+            self._wake.set()
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while self._written_seq < target and self._stats['errors'] == errors_before:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return self._written_seq >= target
+
+    def is_idle(self) -> bool:
+        """Returns True if nothing is pending or being written."""
+        with self._condition:
+            return not self._writing and self._pending_count() == 0
+
+    def take_error(self) -> Optional[Exception]:
+        """Returns and clears the last write error, if any. Failed changes are retried on the next flush."""
+        with self._condition:
+            error, self._last_error = self._last_error, None
+            return error
+
+    def stats(self) -> dict:
+        """
+        Returns a copy of the writer's counters plus the current number of pending rows and,
+        under 'statements', the latency statistics of the writer's own DBManager.
+        """
+        with self._condition:
+            stats = dict(self._stats)
+            stats['pending'] = self._pending_count()
+        stats['statements'] = self._db_manager.stats() if self._db_manager is not None else {}
+        return stats
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Flushes pending changes, stops the thread and closes its connection.
+        :param timeout: Maximum seconds to wait for the final flush and thread exit.
+        :return: True if the writer shut down with everything written.
+        """
+        flushed = self.flush(timeout)
+        with self._condition:
+            self._closing = True
+        self._wake.set()
+        self._thread.join(timeout)
+        return flushed and not self._thread.is_alive()
+
+    # --- Consumer side (writer thread) ---
+    def _pending_count(self) -> int:
+        return len(self._pending_events) + len(self._pending_deletes) + len(self._pending_tasks)
+
+    def _run(self) -> None:
+        """Writer thread main loop: wait for a timer tick or wake-up, then write the pending batch."""
+        try:
+            db_manager = self._db_manager = self._db_factory()
+        except Exception as e:
+            app_logger.error(f"Write-behind writer could not open {self.db_name}: {e}")
+            self._last_error = e
+            self._ready.set()
+            return
+        self._ready.set()
+        try:
+            while True:
+                self._wake.wait(self.flush_interval)
+                self._wake.clear()
+                written = self._write_pending(db_manager)
+                with self._condition:
+                    # On shutdown, stop once drained or if the final write failed
+                    if self._closing and (self._pending_count() == 0 or not written):
+                        break
+        finally:
+            db_manager.close()
+            app_logger.info("Write-behind writer stopped.")
+
+    def _write_pending(self, db_manager: DBManager) -> bool:
+        """Swaps out the pending changes and writes them in one transaction. Returns False if the write failed."""
+        with self._condition:
+            if self._pending_count() == 0:
+                self._written_seq = self._submitted_seq
+                self._condition.notify_all()
+                return True
+            batch = PlannerChanges(
+                events=list(self._pending_events.values()),
+                deleted_event_ids=sorted(self._pending_deletes),
+                task_lists=self._pending_tasks,
+            )
+            batch_seq = self._submitted_seq
+            self._pending_events = {}
+            self._pending_deletes = set()
+            self._pending_tasks = {}
+            self._writing = True
+
+        started = time.perf_counter()
+        try:
+            db_manager.apply_changes(batch)
+        except Exception as e:
+            app_logger.error(f"Write-behind flush failed, will retry: {e}")
+            with self._condition:
+                self._requeue(batch)
+                self._stats['errors'] += 1
+                self._last_error = e
+                self._writing = False
+                self._condition.notify_all()
+            return False
+
+        with self._condition:
+            self._stats['batches'] += 1
+            self._stats['rows_written'] += len(batch.events) + len(batch.deleted_event_ids) + len(batch.task_lists)
+            self._stats['last_batch_seconds'] = time.perf_counter() - started
+            self._written_seq = max(self._written_seq, batch_seq)
+            self._writing = False
+            self._condition.notify_all()
+        return True
+
+    def _requeue(self, batch: PlannerChanges) -> None:
+        """Puts a failed batch back, without overriding anything submitted while it was being written."""
+        for event in batch.events:
+            if event.event_id not in self._pending_deletes:
+                self._pending_events.setdefault(event.event_id, event)
+        for event_id in batch.deleted_event_ids:
+            if event_id not in self._pending_events:
+                self._pending_deletes.add(event_id)
+        for event_id, tasks in batch.task_lists.items():
+            if event_id not in self._pending_deletes:
+                self._pending_tasks.setdefault(event_id, tasks)
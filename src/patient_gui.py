@@ -1,21 +1,30 @@
+import sys
+import startup_profiler
+if __name__ == "__main__":
+    startup_profiler.start("patient_gui", sys.argv)  # Only if STARTUP_PROFILE or --profile-startup is set
+
 import tkinter as tk
 from patient_discharge import launch_discharge_module
 
 
 def main():
-    root = tk.Tk()
-    root.title("Hospital Management System")
-    root.geometry("400x250")
+    startup_profiler.mark("imports_done")
+    with startup_profiler.phase("create_root"):
+        root = tk.Tk()
+    with startup_profiler.phase("build_widgets"):
+        root.title("Hospital Management System")
+        root.geometry("400x250")
 
-    heading = tk.Label(root, text="Hospital Management System", font=("Helvetica", 16, "bold"))
-    heading.pack(pady=20)
+        heading = tk.Label(root, text="Hospital Management System", font=("Helvetica", 16, "bold"))
+        heading.pack(pady=20)
 
-    btn_discharge = tk.Button(root, text="Search & Discharge Module", width=30, command=launch_discharge_module)
-    btn_discharge.pack(pady=10)
+        btn_discharge = tk.Button(root, text="Search & Discharge Module", width=30, command=launch_discharge_module)
+        btn_discharge.pack(pady=10)
 
-    # Placeholder for future modules
-    btn_exit = tk.Button(root, text="Exit", width=30, command=root.quit)
-    btn_exit.pack(pady=10)
+        # Placeholder for future modules
+        btn_exit = tk.Button(root, text="Exit", width=30, command=root.quit)
+        btn_exit.pack(pady=10)
+    startup_profiler.finish_after_first_paint(root)
 
     root.mainloop()
 
@@ -4,8 +4,9 @@ Generates comprehensive PDF reports showing each data structure's operations and
 """
 
 import datetime
+import threading
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -13,6 +14,14 @@ from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.pdfgen import canvas
 
+# progress(steps_done, total_steps, stage); steps_done may be fractional while the PDF is being laid out
+ProgressCallback = Callable[[float, int, str], None]
+
+
+class ReportCancelled(Exception):
+    """Raised when report generation is cancelled (see ReportJob.cancel)."""
+
+
 class DataStructureReportGenerator:
     def __init__(self, event_planner):
         """
@@ -146,78 +155,94 @@ class DataStructureReportGenerator:
         
         return styles
     
-    def generate_comprehensive_report(self, filename: str = None) -> str:
+    def generate_comprehensive_report(self, filename: str = None, progress: Optional[ProgressCallback] = None,
+                                      cancelled: Optional[Callable[[], bool]] = None) -> str:
         """
         Generate a comprehensive PDF report of all data structures.
         :param filename: Output filename (optional)
+        :param progress: Called after each section and while the PDF is laid out (optional)
+        :param cancelled: Polled between steps; generation stops with ReportCancelled once it returns True (optional)
         :return: Path to generated report
         """
         if filename is None:
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"data_structure_report_{timestamp}.pdf"
-        
-        # Create document
-        doc = SimpleDocTemplate(filename, pagesize=A4, topMargin=0.5*inch)
-        story = []
-        
-        # Add title page
-        self._add_title_page(story)
-        
-        # Add executive summary
-        self._add_executive_summary(story)
-        
-        # Add table of contents
-        self._add_table_of_contents(story)
-        
-        # Add each data structure analysis
-        self._add_binary_search_tree_analysis(story)
-        self._add_linked_list_analysis(story)
-        self._add_stack_analysis(story)
-        self._add_queue_analysis(story)
-        
-        # Add integration analysis
-        self._add_integration_analysis(story)
-        
-        # Add performance summary
-        self._add_performance_summary(story)
-        
-        # Add conclusion
-        self._add_conclusion(story)
-        
-        # Build PDF
-        doc.build(story)
-        return filename
 
-    def generate_activity_receipt(self, filename: str = None) -> str:
+        sections = [
+            ("Title page", self._add_title_page),
+            ("Executive summary", self._add_executive_summary),
+            ("Table of contents", self._add_table_of_contents),
+            # Each data structure analysis
+            ("Binary search tree", self._add_binary_search_tree_analysis),
+            ("Linked list", self._add_linked_list_analysis),
+            ("Stack", self._add_stack_analysis),
+            ("Queue", self._add_queue_analysis),
+            ("Integration analysis", self._add_integration_analysis),
+            ("Performance summary", self._add_performance_summary),
+            ("Conclusion", self._add_conclusion),
+        ]
+        return self._build_report(filename, sections, progress, cancelled)
+
+    def generate_activity_receipt(self, filename: str = None, progress: Optional[ProgressCallback] = None,
+                                  cancelled: Optional[Callable[[], bool]] = None) -> str:
         """
         Generate a receipt-like report showing data structure activities.
         :param filename: Output filename (optional)
+        :param progress: Called after each section and while the PDF is laid out (optional)
+        :param cancelled: Polled between steps; generation stops with ReportCancelled once it returns True (optional)
         :return: Path to generated report
         """
         if filename is None:
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"activity_receipt_{timestamp}.pdf"
-        
+
+        sections = [
+            ("Receipt header", self._add_receipt_header),
+            # Data structure activities
+            ("Binary search tree", self._add_bst_activities),
+            ("Linked list", self._add_linked_list_activities),
+            ("Stack", self._add_stack_activities),
+            ("Queue", self._add_queue_activities),
+            ("Receipt footer", self._add_receipt_footer),
+        ]
+        return self._build_report(filename, sections, progress, cancelled)
+
+    def _build_report(self, filename: str, sections: List, progress: Optional[ProgressCallback],
+                      cancelled: Optional[Callable[[], bool]]) -> str:
+        """
+        Runs the section builders in order and lays out the PDF, reporting progress as it goes.
+        The layout counts as one step, advanced fractionally as ReportLab reports flowables done.
+        """
+        total_steps = len(sections) + 1
+
+        def check_cancelled():
+            if cancelled is not None and cancelled():
+                raise ReportCancelled(f"Report {filename} was cancelled.")
+
+        story = []
+        for done, (stage, add_section) in enumerate(sections):
+            check_cancelled()
+            if progress:
+                progress(done, total_steps, stage)
+            add_section(story)
+
         # Create document
         doc = SimpleDocTemplate(filename, pagesize=A4, topMargin=0.5*inch)
-        story = []
-        
-        # Add receipt header
-        self._add_receipt_header(story)
-        
-        # Add data structure activities
-        self._add_bst_activities(story)
-        self._add_linked_list_activities(story)
-        self._add_stack_activities(story)
-        self._add_queue_activities(story)
-        
-        # Add receipt footer
-        self._add_receipt_footer(story)
-        
+        flowables = max(len(story), 1)
+
+        def on_layout_progress(kind, value):
+            # ReportLab reports SIZE_EST (flowables to lay out), then PROGRESS (flowables done) and PAGE
+            check_cancelled()
+            if progress and kind == 'PROGRESS':
+                progress(len(sections) + min(value / flowables, 1.0), total_steps, "Laying out PDF")
+
+        doc.setProgressCallBack(on_layout_progress)
         # Build PDF
         doc.build(story)
+        if progress:
+            progress(total_steps, total_steps, "Done")
         return filename
-    
+
     def _add_title_page(self, story: List):
         """Add title page to the report."""
         story.append(Spacer(1, 2*inch))
@@ -935,3 +960,68 @@ class DataStructureReportGenerator:
         </para>
         """
         story.append(Paragraph(footer_text, self.styles['Normal']))
+
+
+class ReportJob:
+    def __init__(self, planner, filename: str, receipt: bool = False,
+                 progress: Optional[ProgressCallback] = None):
+        """
+        Generates a report on a background thread.
+        :param planner: What the report describes. Pass EventPlanner.freeze() rather than a live
+                        planner, so the report is consistent while the planner keeps changing.
+        :param filename: The PDF file to write.
+        :param receipt: True for the activity receipt, False for the comprehensive report.
+        :param progress: Called as progress(steps_done, total_steps, stage), on the report thread.
+        """
+        self.filename = filename
+        self.receipt = receipt
+        self.steps_done = 0.0
+        self.total_steps = 0
+        self.stage = "Starting"
+        self.result = None  # Path of the finished report
+        self.seconds = None  # Generation time of the finished report
+        self.error = None
+        self._planner = planner
+        self._progress = progress
+        self._cancelled = threading.Event()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="report", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        started = time.perf_counter()
+        try:
+            generator = DataStructureReportGenerator(self._planner)
+            generate = generator.generate_activity_receipt if self.receipt else generator.generate_comprehensive_report
+            self.result = generate(self.filename, progress=self._on_progress, cancelled=self._cancelled.is_set)
+            self.seconds = time.perf_counter() - started
+        except Exception as e:
+            self.error = e
+        finally:
+            self._done.set()
+
+    def _on_progress(self, steps_done: float, total_steps: int, stage: str):
+        self.steps_done, self.total_steps, self.stage = steps_done, total_steps, stage
+        if self._progress is not None:
+            self._progress(steps_done, total_steps, stage)
+
+    @property
+    def fraction(self) -> float:
+        """Progress from 0.0 to 1.0."""
+        return self.steps_done / self.total_steps if self.total_steps else 0.0
+
+    @property
+    def done(self) -> bool:
+        """True once the report has been written, has failed or was cancelled."""
+        return self._done.is_set()
+
+    def cancel(self) -> None:
+        """Stops generation at the next section or layout step; `error` becomes a ReportCancelled."""
+        self._cancelled.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits for the report to finish.
+        :return: True if it was written, False if it failed, was cancelled or is still running.
+        """
+        return self._done.wait(timeout) and self.error is None
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Opt-in startup profiler shared by the application entry points (main.py, src/main.py,
+src/patient_gui.py and src/Stacks.py).
+
+Profiling is off unless the STARTUP_PROFILE environment variable is set (to 1 for the default
+output file, or to the path of the JSON file to write) or the --profile-startup[=PATH] flag is
+passed. Entry points call start() before their heavy imports and finish() once the application
+is ready for input; code in between wraps its steps in phase() blocks and records instants with
+mark(). When profiling is off those calls do nothing.
+
+While active, the profiler also times every import made on the main thread that loads new
+modules, so the report shows which modules (PIL, ReportLab, tkinter...) startup spends its time
+importing and in which phase. finish() writes the timeline as JSON and a readable summary next
+to it (same name, .txt), and prints the summary to stderr so it shows up in CI logs.
+
+To compare a profile with a baseline (exits with status 1 on a regression):
+    python src/startup_profiler.py startup-profile-event_planner.json --baseline baseline.json
+"""
+
+import argparse
+import atexit
+import builtins
+import contextlib
+import datetime
+import importlib.util
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ENV_VAR = "STARTUP_PROFILE"
+FLAG = "--profile-startup"
+
+_active = None  # The running StartupProfiler, if profiling is on
+
+
+class StartupProfiler:
+    """
+    Records a timeline of named phases and marks, and the imports made while it runs.
+    Times are seconds since the profiler was created (time.perf_counter()).
+    Use start() rather than creating one directly, so phase() and mark() find it.
+    """
+
+    def __init__(self, app: str, output: str):
+        """
+        :param app: Name of the application, written to the report.
+        :param output: Path of the JSON file to write; the summary goes next to it with a .txt suffix.
+        """
+        self.app = app
+        self.output = output
+        self.started_at = datetime.datetime.now()
+        self._t0 = time.perf_counter()
+        self.phases: List[dict] = []
+        self.marks: List[dict] = []
+        self.imports: List[dict] = []
+        self._open_phases: List[dict] = []
+        self._import_frames: List[list] = []  # [child seconds] per import in progress
+        self._thread = threading.get_ident()
+        self._original_import = None
+        self.report = None  # Set by finish()
+
+    def elapsed(self) -> float:
+        """Returns the seconds since the profiler started."""
+        return time.perf_counter() - self._t0
+
+    # --- Timeline ---
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """Times the enclosed block as a phase; phases opened inside it are nested under it."""
+        record = {'name': name, 'start': self.elapsed(), 'end': None, 'seconds': None,
+                  'depth': len(self._open_phases),
+                  'parent': self._open_phases[-1]['name'] if self._open_phases else None}
+        self.phases.append(record)
+        self._open_phases.append(record)
+        try:
+            yield record
+        finally:
+            record['end'] = self.elapsed()
+            record['seconds'] = record['end'] - record['start']
+            self._open_phases.remove(record)
+
+    def mark(self, name: str) -> None:
+        """Records an instant, e.g. 'first_paint'."""
+        self.marks.append({'name': name, 'at': self.elapsed()})
+
+    # --- Import timing ---
+    def install_import_hook(self) -> None:
+        """Starts timing imports by wrapping builtins.__import__."""
+        if self._original_import is None:
+            self._original_import = builtins.__import__
+            builtins.__import__ = self._timed_import
+
+    def remove_import_hook(self) -> None:
+        """Restores builtins.__import__ (unless something else replaced it since)."""
+        if self._original_import is not None:
+            if builtins.__import__ == self._timed_import:
+                builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import or builtins.__import__
+        if threading.get_ident() != self._thread:
+            return original(name, globals, locals, fromlist, level)  # Other threads are not profiled
+        modules_before = len(sys.modules)
+        frame = [0.0]
+        self._import_frames.append(frame)
+        started = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            seconds = time.perf_counter() - started
+            self._import_frames.pop()
+            loaded = len(sys.modules) - modules_before
+            if self._import_frames:
+                self._import_frames[-1][0] += seconds
+            if loaded > 0:
+                self.imports.append({
+                    'module': self._absolute_name(name, globals, level),
+                    'seconds': seconds,
+                    'self_seconds': max(seconds - frame[0], 0.0),
+                    'new_modules': loaded,
+                    'depth': len(self._import_frames),
+                    'phase': self._open_phases[-1]['name'] if self._open_phases else None,
+                    'at': started - self._t0,
+                })
+
+    @staticmethod
+    def _absolute_name(name: str, globals, level: int) -> str:
+        """Resolves a relative import (level > 0) against the importing module's package."""
+        if not level:
+            return name
+        try:
+            return importlib.util.resolve_name("." * level + name, (globals or {}).get('__package__'))
+        except (ImportError, ValueError):
+            return "." * level + name
+
+    # --- Output ---
+    def build_report(self, completed: bool = True) -> dict:
+        """Returns the report as a JSON-serializable dictionary."""
+        total = self.elapsed()
+        top_level = [record for record in self.imports if record['depth'] == 0]
+        by_package: Dict[str, float] = {}
+        for record in self.imports:
+            package = record['module'].lstrip(".").split(".")[0] or record['module']
+            by_package[package] = by_package.get(package, 0.0) + record['self_seconds']
+        return {
+            'app': self.app,
+            'completed': completed,
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'python': sys.version.split()[0],
+            'platform': sys.platform,
+            'total_seconds': total,
+            'phases': [dict(record, end=record['end'] if record['end'] is not None else total,
+                            seconds=record['seconds'] if record['seconds'] is not None else total - record['start'])
+                       for record in self.phases],
+            'marks': list(self.marks),
+            'imports': {
+                'total_seconds': sum(record['seconds'] for record in top_level),
+                'modules_loaded': sum(record['new_modules'] for record in top_level),
+                'by_package': dict(sorted(by_package.items(), key=lambda item: -item[1])),
+                'slowest': sorted(self.imports, key=lambda record: -record['seconds'])[:25],
+            },
+        }
+
+    def finish(self, completed: bool = True) -> dict:
+        """
+        Stops timing imports and writes the JSON report and the summary. Only the first call
+        has an effect; later calls return the same report.
+        :param completed: False if startup did not reach the point where finish() is normally
+                          called (e.g. the application exited first).
+        :return: The report dictionary.
+        """
+        if self.report is not None:
+            return self.report
+        self.remove_import_hook()
+        self.report = self.build_report(completed)
+        summary = format_summary(self.report)
+        directory = os.path.dirname(self.output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.output, "w", encoding="utf-8") as f:
+            json.dump(self.report, f, indent=2)
+        with open(os.path.splitext(self.output)[0] + ".txt", "w", encoding="utf-8") as f:
+            f.write(summary)
+        print(summary, file=sys.stderr)
+        logger.info(f"Startup profile written to {self.output}.")
+        return self.report
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:9.1f} ms"
+
+
+def format_summary(report: dict) -> str:
+    """Formats a report (as built by StartupProfiler.build_report) as readable text."""
+    status = "completed" if report['completed'] else "did not complete"
+    lines = [f"Startup profile: {report['app']} ({status} in {report['total_seconds'] * 1000:.1f} ms, "
+             f"Python {report['python']} on {report['platform']})", "",
+             f"{'Phase':<40} {'start':>12} {'duration':>12}"]
+    for record in report['phases']:
+        label = "  " * record['depth'] + record['name']
+        lines.append(f"{label:<40} {_ms(record['start']):>12} {_ms(record['seconds']):>12}")
+    if report['marks']:
+        lines += ["", f"{'Mark':<40} {'at':>12}"]
+        lines += [f"{mark['name']:<40} {_ms(mark['at']):>12}" for mark in report['marks']]
+    imports = report['imports']
+    lines += ["", f"Imports: {imports['total_seconds'] * 1000:.1f} ms loading {imports['modules_loaded']} modules",
+              "  Slowest (including the imports they trigger):"]
+    for record in imports['slowest'][:10]:
+        phase = f" during {record['phase']}" if record['phase'] else ""
+        lines.append(f"    {record['module']:<36} {_ms(record['seconds'])} ({record['new_modules']} modules{phase})")
+    lines.append("  By top-level package (own time):")
+    for package, seconds in list(imports['by_package'].items())[:10]:
+        lines.append(f"    {package:<36} {_ms(seconds)}")
+    return "\n".join(lines) + "\n"
+
+
+def compare(report: dict, baseline: dict, max_regression: float = 0.25, min_delta: float = 0.02) -> List[str]:
+    """
+    Compares a report with a baseline report of the same application.
+    The total, every phase and every mark present in both are compared (by name, first occurrence).
+    :param max_regression: Allowed slowdown as a fraction of the baseline time (0.25 = 25%).
+    :param min_delta: Slowdowns below this many seconds are never reported (timer noise).
+    :return: A description of each regression; empty if there is none.
+    """
+    def timings(data: dict) -> Dict[str, float]:
+        found = {'total': data['total_seconds'], 'imports': data['imports']['total_seconds']}
+        for record in data['phases']:
+            found.setdefault(f"phase {record['name']}", record['seconds'])
+        for mark in data['marks']:
+            found.setdefault(f"mark {mark['name']}", mark['at'])
+        return found
+
+    current, previous = timings(report), timings(baseline)
+    regressions = []
+    for name, before in previous.items():
+        after = current.get(name)
+        if after is None:
+            continue
+        if after - before > min_delta and after > before * (1 + max_regression):
+            regressions.append(f"{name}: {before * 1000:.1f} ms -> {after * 1000:.1f} ms "
+                               f"(+{(after / before - 1) * 100 if before else float('inf'):.0f}%)")
+    return regressions
+
+
+# --- Module-level API used by the entry points ---
+def requested_output(app: str, argv: Optional[List[str]] = None) -> Optional[str]:
+    """
+    Returns the JSON file to write if profiling was requested, else None.
+    A --profile-startup[=PATH] flag is removed from argv (in place) so the application does
+    not see it; it takes precedence over the STARTUP_PROFILE environment variable.
+    """
+    default = f"startup-profile-{app}.json"
+    if argv is not None:
+        for i, arg in enumerate(argv[1:], start=1):
+            if arg == FLAG or arg.startswith(FLAG + "="):
+                del argv[i]
+                return arg.partition("=")[2] or default
+    value = os.environ.get(ENV_VAR, "").strip()
+    if value.lower() in ("", "0", "false", "no", "off"):
+        return None
+    return default if value.lower() in ("1", "true", "yes", "on") else value
+
+
+def start(app: str, argv: Optional[List[str]] = None) -> Optional[StartupProfiler]:
+    """
+    Starts profiling if it was requested (see requested_output) and not already started.
+    If the process exits before finish() is called, the report is written at exit, marked as
+    not completed.
+    :param app: Application name, used in the report and the default file name.
+    :param argv: The command line (usually sys.argv), checked for --profile-startup.
+    :return: The active StartupProfiler, or None if profiling is off.
+    """
+    global _active
+    if _active is not None:
+        return _active
+    output = requested_output(app, argv)
+    if output is None:
+        return None
+    _active = StartupProfiler(app, output)
+    _active.install_import_hook()
+    atexit.register(_finish_at_exit, _active)
+    return _active
+
+
+def _finish_at_exit(profiler: StartupProfiler) -> None:
+    if profiler.report is None:
+        profiler.finish(completed=False)
+
+
+def active() -> Optional[StartupProfiler]:
+    """Returns the running profiler, or None if profiling is off."""
+    return _active
+
+
+def phase(name: str):
+    """Context manager timing a startup phase; does nothing when profiling is off."""
+    return _active.phase(name) if _active is not None else contextlib.nullcontext()
+
+
+def mark(name: str) -> None:
+    """Records a startup instant; does nothing when profiling is off."""
+    if _active is not None:
+        _active.mark(name)
+
+
+def finish() -> Optional[dict]:
+    """Ends startup profiling and writes the report. Returns the report, or None if profiling is off."""
+    return _active.finish() if _active is not None else None
+
+
+def finish_after_first_paint(root) -> None:
+    """
+    For Tk applications whose startup ends when the main window is drawn: marks 'first_paint'
+    once the root window is mapped and its pending redraws have run, then finishes.
+    Does nothing when profiling is off.
+    """
+    if _active is None:
+        return
+
+    def painted():
+        mark('first_paint')
+        finish()
+
+    def on_map(event):
+        if event.widget is root and _active.report is None:
+            root.after_idle(painted)
+    root.bind("<Map>", on_map, add="+")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Prints a profile's summary and, given a baseline, fails on regressions."""
+    parser = argparse.ArgumentParser(description="Summarize a startup profile or compare it with a baseline.")
+    parser.add_argument("profile", help="JSON file written by the startup profiler")
+    parser.add_argument("--baseline", help="Earlier profile of the same application to compare with")
+    parser.add_argument("--max-regression", type=float, default=0.25,
+                        help="Allowed slowdown as a fraction of the baseline (default 0.25)")
+    parser.add_argument("--min-delta-ms", type=float, default=20.0,
+                        help="Ignore slowdowns smaller than this (default 20 ms)")
+    args = parser.parse_args(argv)
+
+    with open(args.profile, encoding="utf-8") as f:
+        report = json.load(f)
+    print(format_summary(report))
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(report, baseline, args.max_regression, args.min_delta_ms / 1000)
+    if regressions:
+        print("Startup regressions against the baseline:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("No startup regressions against the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
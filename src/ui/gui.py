@@ -1,10 +1,14 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
+from typing import Optional
 import datetime
 import threading
 import time
+import itertools
 import logging
 
+import startup_profiler
+
 # Configure basic logging for the GUI part
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -14,6 +18,11 @@ try:
     # Assuming core/event_planner.py is the new path for event_planner_integrated.py
     from core.event_planner import EventPlanner, Event, LLNode
     from database.db_manager import DBManager
+    from database.write_behind import WriteBehindWriter
+    from database.backup import BackupScheduler, backup_path, rotate_backups
+    from database.snapshot import default_path as snapshot_path, load_snapshot, write_snapshot
+    from ui.virtual_event_list import VirtualEventList
+    from ui.refresh_scheduler import RefreshScheduler
 except ImportError as e:
     logger.error(f"Failed to import backend modules: {e}")
     messagebox.showerror("Import Error", "Could not load backend modules. "
@@ -22,29 +31,57 @@ except ImportError as e:
     exit() # Exit if core modules cannot be imported
 
 class EventPlannerGUI:
-    def __init__(self, master: tk.Tk):
+    FILTER_DELAY_MS = 120  # Filter keystrokes closer together than this make a single query
+    FILTER_BATCH = 2000  # Filter matches added to the event list per batch (a few milliseconds each)
+
+    def __init__(self, master: tk.Tk, started: Optional[float] = None):
         """
         Initializes the Event Planner GUI application.
+        The window is shown with an empty event list first; the data is loaded once it has been
+        drawn (see _on_first_paint), and the Tasks, Reminders and Undo tabs are built when first selected.
         :param master: The root Tkinter window.
+        :param started: time.perf_counter() when the application started, for the startup
+                        timings (defaults to now).
         """
+        self.started = time.perf_counter() if started is None else started
+        self.startup_timings = {}  # {phase: seconds since started}, see _record_startup
         self.master = master
         master.title("Event Planner")
         master.geometry("1000x700") # Increased size for better layout
         master.protocol("WM_DELETE_WINDOW", self._on_closing) # Handle window close event
 
         # Initialize DB Manager and load max event ID
-        self.db_manager = DBManager()
-        max_id = self.db_manager.get_max_event_id()
+        with startup_profiler.phase("open_database"):
+            self.db_manager = DBManager()
+            max_id = self.db_manager.get_max_event_id()
         self.planner = EventPlanner(initial_event_id_counter=max_id + 1)
+        with startup_profiler.phase("start_workers"):
+            # Background writer with its own connection; planner changes are handed to it after each action
+            self.writer = WriteBehindWriter(self.db_manager.db_name)
+            # Hourly online backups into ./backups, keeping the last day's worth
+            self.backup_scheduler = BackupScheduler(self.db_manager, "backups", interval=3600, keep=24)
         
         # --- Status Bar (Initialize early as it's used during loading) ---
         self.status_label = ttk.Label(master, text="Ready", relief=tk.SUNKEN, anchor=tk.W)
         self.status_label.pack(side=tk.BOTTOM, fill=tk.X)
 
+        # Report progress (packed above the status bar while a report is being generated)
+        self.report_job = None
+        self.report_progress_frame = ttk.Frame(master)
+        self.report_progress_label = ttk.Label(self.report_progress_frame, text="")
+        self.report_progress_label.pack(side=tk.LEFT)
+        self.report_cancel_button = ttk.Button(self.report_progress_frame, text="Cancel", command=self._cancel_report)
+        self.report_cancel_button.pack(side=tk.RIGHT)
+        self.report_progress = ttk.Progressbar(self.report_progress_frame, mode="determinate", maximum=100)
+        self.report_progress.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=5)
+        # Shown while the write-behind writer is saving on our behalf (Save All, quitting)
+        self.save_progress = ttk.Progressbar(master, mode="indeterminate", length=150)
+        self._closing = False
+
         # Track events that have already been warned about to avoid spam
         self.warned_events = set() # Moved here to be part of GUI instance
-
-        self._load_data_from_db() # Load existing events and tasks from DB (now status_label exists)
+        self.history_start = None # Oldest datetime whose events are in memory (set when loading)
+        self.current_event_tasks_id = None # ID of the event whose tasks the Tasks tab shows
 
         # --- Main Notebook (Tabs) ---
         self.notebook = ttk.Notebook(master)
@@ -53,26 +90,32 @@ class EventPlannerGUI:
         # --- Events Tab ---
         self.events_frame = ttk.Frame(self.notebook, padding="10")
         self.notebook.add(self.events_frame, text="Events")
-        self._setup_events_tab()
+        with startup_profiler.phase("build_events_tab"):
+            self._setup_events_tab()
 
-        # --- Tasks Tab ---
+        # --- Tasks, Reminders and Undo History Tabs (empty until first selected) ---
         self.tasks_frame = ttk.Frame(self.notebook, padding="10")
         self.notebook.add(self.tasks_frame, text="Tasks")
-        self._setup_tasks_tab()
-
-        # --- Reminders Tab ---
         self.reminders_frame = ttk.Frame(self.notebook, padding="10")
         self.notebook.add(self.reminders_frame, text="Reminders")
-        self._setup_reminders_tab()
-
-        # --- Undo History Tab ---
         self.undo_frame = ttk.Frame(self.notebook, padding="10")
         self.notebook.add(self.undo_frame, text="Undo History")
-        self._setup_undo_tab()
 
-        # Start periodic reminder check
-        self._check_reminders_periodic()
-        self.master.after(1000, self._update_all_displays) # Initial display update (now all widgets exist)
+        # Redraws are requested per tab and coalesced; hidden tabs are built and redrawn when selected
+        self.refresh_scheduler = RefreshScheduler(self.notebook)
+        self.refresh_scheduler.register(self.events_frame, lambda: self._display_events(filter_upcoming=False))
+        self.refresh_scheduler.register(self.tasks_frame, self._display_tasks_for_selected_event,
+                                        build=self._setup_tasks_tab)
+        self.refresh_scheduler.register(self.reminders_frame, self._display_reminder_queue,
+                                        build=self._setup_reminders_tab)
+        self.refresh_scheduler.register(self.undo_frame, self._display_edit_history,
+                                        build=self._setup_undo_tab)
+        self._record_startup('widgets_built')
+
+        # Load the data once the window is on screen (or shortly anyway, if it is never mapped)
+        self._data_loaded = False
+        master.bind("<Map>", self._on_map, add="+")
+        self._load_fallback = master.after(500, self._load_initial_data)
         
         # --- Report Generation Button ---
         # Removed from master frame, will add to a tab or specific location if requested.
@@ -173,15 +216,48 @@ class EventPlannerGUI:
         ttk.Button(button_frame, text="Delete Event", command=self._delete_event).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Clear Fields", command=self._clear_event_entry_fields).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Refresh Display", command=lambda: self._display_events(filter_upcoming=True)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Load Older Events", command=self._load_older_events).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Save All Data", command=self._save_all_data_to_db).pack(side=tk.LEFT, padx=5) # Added Save button
         ttk.Button(button_frame, text="Generate Report", command=self._generate_report).pack(side=tk.LEFT, padx=5) # Added Generate Report button
+        ttk.Button(button_frame, text="Back Up Now", command=self._backup_now).pack(side=tk.LEFT, padx=5)
+
+        # --- Search Frame (full-text search over the whole database) ---
+        search_frame = ttk.Frame(self.events_frame, padding="5")
+        search_frame.pack(side=tk.TOP, fill=tk.X, padx=5)
+        ttk.Label(search_frame, text="Search events and tasks:").pack(side=tk.LEFT, padx=5)
+        self.search_entry = ttk.Entry(search_frame, width=40)
+        self.search_entry.pack(side=tk.LEFT, padx=5)
+        self.search_entry.bind("<Return>", lambda e: self._search_events())
+        ttk.Button(search_frame, text="Search", command=self._search_events).pack(side=tk.LEFT, padx=5)
+
+        # --- Filter (as-you-type prefix search over the events in memory) ---
+        filter_frame = ttk.Frame(self.events_frame, padding="5")
+        filter_frame.pack(side=tk.TOP, fill=tk.X, padx=5)
+        ttk.Label(filter_frame, text="Filter list:").pack(side=tk.LEFT, padx=5)
+        self.filter_var = tk.StringVar()
+        self.filter_entry = ttk.Entry(filter_frame, width=40, textvariable=self.filter_var)
+        self.filter_entry.pack(side=tk.LEFT, padx=5)
+        self.filter_entry.bind("<FocusIn>", lambda e: self._prepare_filter())
+        self.filter_entry.bind("<Escape>", lambda e: self._clear_filter())
+        ttk.Button(filter_frame, text="Clear", command=self._clear_filter).pack(side=tk.LEFT, padx=5)
+        self.filter_status = ttk.Label(filter_frame, text="Matches words in names, locations and attendees.")
+        self.filter_status.pack(side=tk.LEFT, padx=5)
+        self._filter_pending = None  # after id of the debounced query
+        self._filter_fill = None  # after id of the next batch of matches
+        self._filter_generation = 0  # Bumped per query; batches of older queries stop
+        self._show_upcoming = False  # Range the event list (and the filter) covers
+        self._filter_query = None  # Query whose matches the event list shows
+        self.filter_var.trace_add("write", lambda *args: self._schedule_filter())
 
         # --- Event List Treeview ---
         tree_frame = ttk.Frame(self.events_frame, padding="5")
         tree_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=5, pady=5)
 
         columns = ("ID", "Name", "Date", "Time", "Location", "Reminder", "Description", "Attendees")
-        self.event_tree = ttk.Treeview(tree_frame, columns=columns, show="headings")
+        # Only the visible rows exist in the Treeview; scrolling refills them from the planner
+        self.event_list = VirtualEventList(tree_frame, self.planner, columns, self._event_row_values,
+                                           on_select=self._load_selected_event_details)
+        self.event_tree = self.event_list.tree
         for col in columns:
             self.event_tree.heading(col, text=col, anchor=tk.W)
             self.event_tree.column(col, width=100, anchor=tk.W)
@@ -194,14 +270,6 @@ class EventPlannerGUI:
         self.event_tree.column("Description", width=200) # Wider for description
         self.event_tree.column("Attendees", width=150)
 
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.event_tree.yview)
-        self.event_tree.configure(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side="right", fill="y")
-        self.event_tree.pack(side="left", fill="both", expand=True)
-
-        self.event_tree.bind("<<TreeviewSelect>>", self._load_selected_event_details)
-
         # Initial display - show all events by default
         self._display_events(filter_upcoming=False)
 
@@ -213,9 +281,12 @@ class EventPlannerGUI:
 
     def _generate_report(self):
         """Generates a report of data structure executions."""
+        if self.report_job is not None:
+            self._show_message("Report In Progress", "A report is already being generated.")
+            return
         # This functionality depends on the report_generator module
         try:
-            from reports.report_generator import DataStructureReportGenerator
+            from reports.report_generator import ReportCancelled, ReportJob
         except ImportError:
             messagebox.showerror("Import Error", "Report generator module not found. "
                                                 "Ensure 'reports/report_generator.py' is available.")
@@ -249,19 +320,40 @@ class EventPlannerGUI:
         if not file_path:  # User cancelled the dialog
             return
         
-        # Initialize report generator
-        report_generator = DataStructureReportGenerator(self.planner)
+        # Build the report on a worker thread from a frozen copy of the planner, so the window stays usable
+        self.report_job = ReportJob(self.planner.freeze(), file_path, receipt=report_type)
+        self.report_cancel_button.config(state=tk.NORMAL)
+        self.report_progress_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, before=self.notebook)
+        self._poll_report_job(self.report_job)
+
+    def _poll_report_job(self, job):
+        """Shows a running report's progress and notifies the user when it is done."""
+        from reports.report_generator import ReportCancelled
+        if not job.done:
+            self.report_progress['value'] = job.fraction * 100
+            self.report_progress_label.config(text=f"Generating report: {job.stage}...")
+            self.master.after(100, lambda: self._poll_report_job(job))
+            return
+        self.report_progress_frame.pack_forget()
+        self.report_job = None
+        if isinstance(job.error, ReportCancelled):
+            self.status_label.config(text="Report generation cancelled.")
+        elif job.error is not None:
+            logger.error(f"Error generating report: {job.error}")
+            messagebox.showerror("Error", f"Failed to generate report: {job.error}")
+        elif job.receipt:
+            self.status_label.config(text=f"Activity receipt saved as {job.result}.")
+            messagebox.showinfo("Receipt Generated", f"Activity receipt saved successfully as:\n{job.result}")
+        else:
+            self.status_label.config(text=f"Comprehensive report saved as {job.result}.")
+            messagebox.showinfo("Report Generated", f"Comprehensive report saved successfully as:\n{job.result}")
 
-        try:
-            # Generate the appropriate report type
-            if report_type:
-                report_path = report_generator.generate_activity_receipt(file_path)
-                messagebox.showinfo("Receipt Generated", f"Activity receipt saved successfully as:\n{report_path}")
-            else:
-                report_path = report_generator.generate_comprehensive_report(file_path)
-                messagebox.showinfo("Report Generated", f"Comprehensive report saved successfully as:\n{report_path}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to generate report: {e}")
+    def _cancel_report(self):
+        """Cancels the report being generated, if any."""
+        if self.report_job is not None:
+            self.report_job.cancel()
+            self.report_cancel_button.config(state=tk.DISABLED)
+            self.report_progress_label.config(text="Cancelling report...")
 
     def _setup_tasks_tab(self):
         """Sets up the UI elements for the Tasks tab."""
@@ -304,9 +396,6 @@ class EventPlannerGUI:
         task_scrollbar.pack(side="right", fill="y")
         self.task_tree.pack(side="left", fill="both", expand=True)
 
-        # Variable to hold the ID of the event whose tasks are currently displayed
-        self.current_event_tasks_id = None
-        
     def _setup_reminders_tab(self):
         """Sets up the UI elements for the Reminders tab."""
         ttk.Label(self.reminders_frame, text="Current Reminder Queue:").pack(pady=5, anchor=tk.W)
@@ -317,8 +406,6 @@ class EventPlannerGUI:
         self.reminder_listbox.config(yscrollcommand=reminder_scrollbar.set)
         reminder_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        self._display_reminder_queue()
-
     def _setup_undo_tab(self):
         """Sets up the UI elements for the Undo History tab."""
         button_frame = ttk.Frame(self.undo_frame, padding="10")
@@ -333,8 +420,6 @@ class EventPlannerGUI:
         self.undo_listbox.config(yscrollcommand=undo_scrollbar.set)
         undo_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        self._display_edit_history()
-
     # --- Event Tab Methods ---
     def _get_event_input(self) -> dict:
         """Collects event details from entry fields."""
@@ -393,11 +478,10 @@ class EventPlannerGUI:
         event_data = self._get_event_input()
         try:
             new_event = self.planner.create_event(**event_data)
-            self.db_manager.save_event(new_event)
-            self._save_tasks_to_db_for_event(new_event.event_id) # Save initial empty task list
+            self._flush_changes()
             self._show_message("Success", f"Event '{new_event.name}' added successfully with ID: {new_event.event_id}")
             self._clear_event_entry_fields()
-            self.event_tree.selection_remove(self.event_tree.selection()) # Explicitly deselect after creation
+            self.event_list.clear_selection() # Explicitly deselect after creation
             self._update_all_displays()
             # Log queue operation if reminder was set
             if event_data.get('reminder_set', False):
@@ -410,21 +494,20 @@ class EventPlannerGUI:
 
     def _update_event(self):
         """Handles the 'Update Event' button click."""
-        selected_item = self.event_tree.selection()
-        if not selected_item:
+        event_id = self.event_list.selected_event_id
+        if event_id is None:
             self._show_message("Selection Error", "Please select an event to update.")
             return
 
-        event_id = int(self.event_tree.item(selected_item, "values")[0])
         event_data = self._get_event_input() # Get updated data from fields
 
         try:
             updated_event = self.planner.update_event(event_id, **event_data)
             if updated_event:
-                self.db_manager.save_event(updated_event)
+                self._flush_changes()
                 self._show_message("Success", f"Event ID {event_id} updated successfully.")
                 self._clear_event_entry_fields()
-                self.event_tree.selection_remove(self.event_tree.selection()) # Explicitly deselect after update
+                self.event_list.clear_selection() # Explicitly deselect after update
                 self._update_all_displays()
                 # Reminder re-queuing is handled directly in EventPlanner.update_event
             else:
@@ -437,21 +520,21 @@ class EventPlannerGUI:
 
     def _delete_event(self):
         """Handles the 'Delete Event' button click."""
-        selected_item = self.event_tree.selection()
-        if not selected_item:
+        event_id = self.event_list.selected_event_id
+        selected_event = self.planner.get_event(event_id) if event_id is not None else None
+        if selected_event is None:
             self._show_message("Selection Error", "Please select an event to delete.")
             return
 
-        event_id = int(self.event_tree.item(selected_item, "values")[0])
-        event_name = self.event_tree.item(selected_item, "values")[1]
+        event_name = selected_event.name
 
         if messagebox.askyesno("Confirm Deletion", f"Are you sure you want to delete '{event_name}' (ID: {event_id})?"):
             try:
                 if self.planner.delete_event(event_id):
-                    self.db_manager.delete_event(event_id) # Delete from DB
+                    self._flush_changes() # Delete from DB
                     self._show_message("Success", f"Event '{event_name}' deleted successfully.")
                     self._clear_event_entry_fields()
-                    self.event_tree.selection_remove(self.event_tree.selection()) # Explicitly deselect after deletion
+                    self.event_list.clear_selection() # Explicitly deselect after deletion
                     self._update_all_displays()
                 else:
                     self._show_message("Error", f"Failed to delete event ID {event_id}.")
@@ -461,17 +544,16 @@ class EventPlannerGUI:
 
     def _load_selected_event_details(self, event=None):
         """Loads details of the selected event into the input fields."""
-        selected_item = self.event_tree.selection()
-        if not selected_item:
+        event_id = self.event_list.selected_event_id
+        selected_event = self.planner.get_event(event_id) if event_id is not None else None
+        if selected_event is None:
             self._clear_event_entry_fields()
             self.current_event_tasks_id = None
-            self.selected_event_for_tasks_label.config(text="No Event Selected")
-            self._display_tasks_for_selected_event() # Clear tasks display
+            self.refresh_scheduler.invalidate(self.tasks_frame) # Clear tasks display
             return
 
-        values = self.event_tree.item(selected_item, "values")
-        event_id = int(values[0])
-        
+        values = self._event_row_values(selected_event)
+
         # Clear fields first (but not selection)
         for entry in self.entries.values():
             entry.delete(0, tk.END)
@@ -502,31 +584,176 @@ class EventPlannerGUI:
 
         # Set selected event for tasks tab
         self.current_event_tasks_id = event_id
-        self.selected_event_for_tasks_label.config(text=f"Selected Event: {values[1]} (ID: {event_id})")
-        self._display_tasks_for_selected_event() # Update tasks display
+        self.refresh_scheduler.invalidate(self.tasks_frame) # Update tasks display
 
     def _display_events(self, filter_upcoming: bool = True):
         """
-        Populates the event Treeview with events from the planner.
+        Shows upcoming or all events in the event list, in chronological order, narrowed to the
+        matches of the filter field if it is not empty.
+        Only the rows in view are materialized; they are read from the planner by position.
         :param filter_upcoming: True for upcoming events, False for all events.
         """
-        # Clear existing items
-        for item in self.event_tree.get_children():
-            self.event_tree.delete(item)
-
-        events_to_display = self.planner.view_events(upcoming=filter_upcoming)
-        for event in events_to_display:
-            self.event_tree.insert("", tk.END, values=(
-                event.event_id,
-                event.name,
-                event.date,
-                event.time,
-                event.location,
-                str(event.reminder_set), # Store as string for Treeview
-                event.description,
-                event.attendees
-            ))
-        self.status_label.config(text=f"Displayed {len(events_to_display)} events.")
+        self._show_upcoming = filter_upcoming
+        self._cancel_filter_fill()
+        if self.filter_var.get().strip():
+            self._run_filter()
+            return
+        self._filter_query = None
+        start = self.planner.count_before(datetime.datetime.now()) if filter_upcoming else 0
+        self.event_list.set_range(start)
+        self.status_label.config(text=f"Displayed {self.event_list.row_count()} events.")
+
+    # --- Filter Methods ---
+    def _prepare_filter(self):
+        """Builds the planner's word index when the filter field is first focused, before any typing."""
+        if not self.planner.has_search_index():
+            self.filter_status.config(text="Indexing events...")
+            self.filter_status.update_idletasks()
+            self.planner.build_search_index()
+            self.filter_status.config(text="Matches words in names, locations and attendees.")
+
+    def _schedule_filter(self):
+        """Debounces filter keystrokes: the query runs once typing pauses for FILTER_DELAY_MS."""
+        if self._filter_pending is not None:
+            self.master.after_cancel(self._filter_pending)
+        self._filter_pending = self.master.after(self.FILTER_DELAY_MS, self._on_filter_changed)
+
+    def _on_filter_changed(self):
+        self._filter_pending = None
+        self._display_events(filter_upcoming=self._show_upcoming)
+
+    def _clear_filter(self):
+        """Empties the filter field and shows the unfiltered list right away."""
+        if self.filter_var.get():
+            self.filter_var.set("")  # Schedules a query through the trace; run it now instead
+        if self._filter_pending is not None:
+            self.master.after_cancel(self._filter_pending)
+            self._filter_pending = None
+        self._cancel_filter_fill()
+        self.filter_status.config(text="Matches words in names, locations and attendees.")
+        self._display_events(filter_upcoming=self._show_upcoming)
+
+    def _cancel_filter_fill(self):
+        """Stops adding matches of the current query (a newer query replaces it)."""
+        self._filter_generation += 1
+        if self._filter_fill is not None:
+            self.master.after_cancel(self._filter_fill)
+            self._filter_fill = None
+
+    def _run_filter(self):
+        """
+        Shows the filter's matches: the first batch at once, so the visible rows appear in the
+        same frame, and the rest in later batches while the list stays responsive.
+        """
+        query = self.filter_var.get().strip()
+        start = datetime.datetime.now() if self._show_upcoming else None
+        matches = self.planner.iter_search_prefix(query, start=start)
+        batch = list(itertools.islice(matches, self.FILTER_BATCH))
+        # A refresh of the same query (e.g. after an edit) keeps the scroll position
+        self.event_list.show_events(batch, scroll_to_top=query != self._filter_query)
+        self._filter_query = query
+        self._after_filter_batch(query, matches, len(batch) == self.FILTER_BATCH, self._filter_generation)
+
+    def _continue_filter(self, query, matches, generation):
+        """Adds the next batch of matches, unless a newer query started since."""
+        self._filter_fill = None
+        if generation != self._filter_generation:
+            return
+        batch = list(itertools.islice(matches, self.FILTER_BATCH))
+        self.event_list.extend_events(batch)
+        self._after_filter_batch(query, matches, len(batch) == self.FILTER_BATCH, generation)
+
+    def _after_filter_batch(self, query, matches, more, generation):
+        count = self.event_list.row_count()
+        if more:
+            self.filter_status.config(text=f"{count}+ matches...")
+            self._filter_fill = self.master.after(1, self._continue_filter, query, matches, generation)
+        else:
+            self.filter_status.config(text=f"{count} matches in loaded events.")
+            self.status_label.config(text=f"Displayed {count} events matching '{query}'.")
+
+    @staticmethod
+    def _event_row_values(event: Event) -> tuple:
+        """Returns the event list columns for an event."""
+        return (
+            event.event_id,
+            event.name,
+            event.date,
+            event.time,
+            event.location,
+            str(event.reminder_set), # Store as string for Treeview
+            event.description,
+            event.attendees
+        )
+
+    def _search_events(self):
+        """
+        Runs a full-text search in the database and lists the ranked matches in a results window.
+        Recent edits are only searchable once they reach the database, so the query runs once
+        the write-behind writer has caught up, without blocking the Tk thread meanwhile.
+        """
+        query = self.search_entry.get().strip()
+        if not query:
+            return
+        self.writer.request_flush()
+        if not self.writer.is_idle():
+            self.status_label.config(text=f"Searching for '{query}'...")
+        self._when_writer_idle(lambda: self._run_search(query))
+
+    def _run_search(self, query: str):
+        """Queries the full-text index and shows the results (called once pending writes are on disk)."""
+        self._report_writer_error() # Search anyway; the failed edits are retried on the next flush
+        try:
+            results = self.db_manager.search(query, limit=100)
+        except Exception as e:
+            logger.error(f"Error searching for '{query}': {e}", exc_info=True)
+            self._show_message("Search Error", f"Search failed: {e}")
+            return
+        self.status_label.config(text=f"{len(results)} matches for '{query}'.")
+        if not results:
+            self._show_message("Search", f"No events or tasks match '{query}'.")
+            return
+
+        window = tk.Toplevel(self.master)
+        window.title(f"Search results: {query}")
+        window.geometry("800x400")
+        columns = ("Type", "Event ID", "Event", "Date", "Time", "Match")
+        results_tree = ttk.Treeview(window, columns=columns, show="headings")
+        for col, width in zip(columns, (60, 70, 160, 90, 60, 340)):
+            results_tree.heading(col, text=col, anchor=tk.W)
+            results_tree.column(col, width=width, anchor=tk.W)
+        scrollbar = ttk.Scrollbar(window, orient="vertical", command=results_tree.yview)
+        results_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        results_tree.pack(side="left", fill="both", expand=True)
+        for result in results:
+            results_tree.insert("", tk.END, values=(
+                result['kind'].title(), result['event_id'], result['name'],
+                result['date'], result['time'], result['snippet']))
+
+        def open_result(event=None):
+            selected = results_tree.selection()
+            if selected:
+                values = results_tree.item(selected[0], "values")
+                self._show_event_in_tree(int(values[1]), values[3], values[4])
+        results_tree.bind("<Double-1>", open_result)
+        ttk.Label(window, text="Double-click a result to select its event.").pack(side=tk.BOTTOM)
+
+    def _show_event_in_tree(self, event_id: int, date: str, time: str):
+        """Loads an event into the planner if needed (e.g. an older search hit) and selects it in the events list."""
+        try:
+            event_dt = self.planner._get_datetime(date, time)
+            self.planner.ensure_loaded(event_dt, event_dt)
+        except Exception as e:
+            logger.error(f"Error loading event {event_id}: {e}", exc_info=True)
+            self._show_message("Database Error", f"Failed to load event {event_id}: {e}")
+            return
+        self._show_upcoming = event_dt >= datetime.datetime.now()
+        self._clear_filter() # The event may not match the filter
+        if self.event_list.see(event_id):
+            self.notebook.select(self.events_frame)
+            return
+        self._show_message("Search", f"Event {event_id} is no longer available.")
 
     # --- Task Tab Methods ---
     def _add_task(self):
@@ -542,7 +769,7 @@ class EventPlannerGUI:
         
         try:
             if self.planner.add_task(self.current_event_tasks_id, task_desc):
-                self._save_tasks_to_db_for_event(self.current_event_tasks_id)
+                self._flush_changes()
                 self._show_message("Success", f"Task '{task_desc}' added.")
                 self.task_entry.delete(0, tk.END)
                 self._display_tasks_for_selected_event()
@@ -568,7 +795,7 @@ class EventPlannerGUI:
         if messagebox.askyesno("Confirm Removal", f"Are you sure you want to remove task '{task_desc}'?"):
             try:
                 if self.planner.remove_task(self.current_event_tasks_id, task_desc):
-                    self._save_tasks_to_db_for_event(self.current_event_tasks_id)
+                    self._flush_changes()
                     self._show_message("Success", f"Task '{task_desc}' removed.")
                     self._display_tasks_for_selected_event()
                 else:
@@ -592,7 +819,7 @@ class EventPlannerGUI:
         
         try:
             if self.planner.mark_task_complete(self.current_event_tasks_id, task_desc):
-                self._save_tasks_to_db_for_event(self.current_event_tasks_id)
+                self._flush_changes()
                 self._show_message("Success", f"Task '{task_desc}' marked complete.")
                 self._display_tasks_for_selected_event()
             else:
@@ -603,6 +830,11 @@ class EventPlannerGUI:
 
     def _display_tasks_for_selected_event(self):
         """Displays tasks for the currently selected event in the task Treeview."""
+        event = self.planner.get_event(self.current_event_tasks_id) if self.current_event_tasks_id is not None else None
+        if event is None:
+            self.selected_event_for_tasks_label.config(text="No Event Selected")
+        else:
+            self.selected_event_for_tasks_label.config(text=f"Selected Event: {event.name} (ID: {event.event_id})")
         # Clear existing items
         for item in self.task_tree.get_children():
             self.task_tree.delete(item)
@@ -640,7 +872,7 @@ class EventPlannerGUI:
                     self.status_label.config(text=f"Processed reminders for: {names}") 
                 else:
                     self.status_label.config(text="Processed some reminders.")
-                self._save_all_data_to_db() # Save changes if events were removed from queue (processed)
+                self._flush_changes() # Dequeuing past events changes nothing persistent, so this is usually a no-op
             elif three_min_reminders: # If only 3-min reminders were found, update status bar for them
                 event_names = [e.name for e in three_min_reminders if isinstance(e, Event)]
                 if event_names:
@@ -650,22 +882,22 @@ class EventPlannerGUI:
             else:
                 self.status_label.config(text="No reminders to process at this time.")
 
-            self._display_reminder_queue() # Always update the listbox
+            self.refresh_scheduler.invalidate(self.reminders_frame) # Always update the listbox (when shown)
         except Exception as e:
             logger.error(f"Error processing reminders: {e}", exc_info=True)
             self._show_message("Error", f"Failed to process reminders: {e}")
 
     def _display_reminder_queue(self):
         """Populates the reminder listbox with detailed information."""
-        self.reminder_listbox.delete(0, tk.END)
+        lines = []
         reminders = self.planner.view_reminder_queue()
         if not reminders:
-            self.reminder_listbox.insert(tk.END, "📭 No reminders in queue.")
-            self.reminder_listbox.insert(tk.END, "")
-            self.reminder_listbox.insert(tk.END, "💡 Tip: Create events with reminders enabled to see them here!")
+            lines.append("📭 No reminders in queue.")
+            lines.append("")
+            lines.append("💡 Tip: Create events with reminders enabled to see them here!")
         else:
-            self.reminder_listbox.insert(tk.END, f"📋 Queue Status: {len(reminders)} reminder(s) pending")
-            self.reminder_listbox.insert(tk.END, "━" * 50)
+            lines.append(f"📋 Queue Status: {len(reminders)} reminder(s) pending")
+            lines.append("━" * 50)
             
             # Calculate time until each event
             current_time = datetime.datetime.now()
@@ -691,22 +923,25 @@ class EventPlannerGUI:
                         # Past event
                         time_str = "OVERDUE"
                     
-                    self.reminder_listbox.insert(tk.END, f"{i}. 🔔 {event.name}")
-                    self.reminder_listbox.insert(tk.END, f"    📅 {event.date} at {event.time} ({time_str})")
-                    self.reminder_listbox.insert(tk.END, f"    🆔 Event ID: {event.event_id}")
+                    lines.append(f"{i}. 🔔 {event.name}")
+                    lines.append(f"    📅 {event.date} at {event.time} ({time_str})")
+                    lines.append(f"    🆔 Event ID: {event.event_id}")
                     if i < len(reminders):
-                        self.reminder_listbox.insert(tk.END, "")
+                        lines.append("")
                         
                 except Exception as e:
-                    self.reminder_listbox.insert(tk.END, f"{i}. ❌ Error processing event: {event.name}")
+                    lines.append(f"{i}. ❌ Error processing event: {event.name}")
                     logger.error(f"Error calculating time for event {event.event_id}: {e}")
             
-            self.reminder_listbox.insert(tk.END, "━" * 50)
-            self.reminder_listbox.insert(tk.END, "⏰ 3-minute alerts will show automatically!") # Updated message
-            self.reminder_listbox.insert(tk.END, "🔄 Updates every 60 seconds")
+            lines.append("━" * 50)
+            lines.append("⏰ 3-minute alerts will show automatically!") # Updated message
+            lines.append("🔄 Updates every 60 seconds")
+        self._sync_listbox(self.reminder_listbox, lines)
 
     def _check_reminders_periodic(self):
         """Periodically checks and processes reminders."""
+        if self._closing:
+            return
         self._process_reminders_gui() # This handles both reminder processing and 3-minute warnings
         # Schedule the next check in 60 seconds (60000 milliseconds) for reasonable precision
         self.master.after(60000, self._check_reminders_periodic)
@@ -736,8 +971,8 @@ class EventPlannerGUI:
                 return
             
             undone_event = self.planner.undo_last_edit()
+            self._flush_changes() # Save the restored state (or the removal of an undone creation)
             if undone_event:
-                self.db_manager.save_event(undone_event) # Save the restored state
                 self._show_message("✅ Undo Successful", 
                                    f"Last action undone successfully!\n\n" +
                                    f"📝 Event ID {undone_event.event_id} restored to previous state.\n" +
@@ -756,101 +991,248 @@ class EventPlannerGUI:
 
     def _display_edit_history(self):
         """Populates the undo history listbox with detailed information."""
-        self.undo_listbox.delete(0, tk.END)
+        lines = []
         history = self.planner.view_edited_events()
         if not history:
-            self.undo_listbox.insert(tk.END, "📚 No edit history available.")
-            self.undo_listbox.insert(tk.END, "")
-            self.undo_listbox.insert(tk.END, "💡 Create or edit events to see undo history here!")
-            self.undo_listbox.insert(tk.END, "")
-            self.undo_listbox.insert(tk.END, "🔄 Stack can hold up to 10 previous states")
+            lines.append("📚 No edit history available.")
+            lines.append("")
+            lines.append("💡 Create or edit events to see undo history here!")
+            lines.append("")
+            lines.append("🔄 Stack can hold up to 10 previous states")
         else:
-            self.undo_listbox.insert(tk.END, f"📚 Undo History: {len(history)} state(s) available")
-            self.undo_listbox.insert(tk.END, "━" * 50)
-            self.undo_listbox.insert(tk.END, "⬇️ Most recent (top of stack) ⬇️")
-            self.undo_listbox.insert(tk.END, "")
+            lines.append(f"📚 Undo History: {len(history)} state(s) available")
+            lines.append("━" * 50)
+            lines.append("⬇️ Most recent (top of stack) ⬇️")
+            lines.append("")
             
             # Display in reverse chronological order (most recent first)
             for i, event_state in enumerate(reversed(history), 1):
                 if i == 1:
-                    self.undo_listbox.insert(tk.END, f"🔝 {i}. {event_state.name}")
+                    lines.append(f"🔝 {i}. {event_state.name}")
                 else:
-                    self.undo_listbox.insert(tk.END, f"    {i}. {event_state.name}")
+                    lines.append(f"    {i}. {event_state.name}")
                 
-                self.undo_listbox.insert(tk.END, f"      📅 {event_state.date} at {event_state.time}")
-                self.undo_listbox.insert(tk.END, f"      🆔 Event ID: {event_state.event_id}")
+                lines.append(f"      📅 {event_state.date} at {event_state.time}")
+                lines.append(f"      🆔 Event ID: {event_state.event_id}")
                 
                 if hasattr(event_state, 'location') and event_state.location:
-                    self.undo_listbox.insert(tk.END, f"      📍 Location: {event_state.location}")
+                    lines.append(f"      📍 Location: {event_state.location}")
                 
                 if i < len(history):
-                    self.undo_listbox.insert(tk.END, "")
+                    lines.append("")
             
-            self.undo_listbox.insert(tk.END, "")
-            self.undo_listbox.insert(tk.END, "⬆️ Oldest (bottom of stack) ⬆️")
-            self.undo_listbox.insert(tk.END, "━" * 50)
-            self.undo_listbox.insert(tk.END, f"💾 Stack Usage: {len(history)}/10 slots")
-            self.undo_listbox.insert(tk.END, "🔄 Click 'Undo Last Action' to pop from stack!")
+            lines.append("")
+            lines.append("⬆️ Oldest (bottom of stack) ⬆️")
+            lines.append("━" * 50)
+            lines.append(f"💾 Stack Usage: {len(history)}/10 slots")
+            lines.append("🔄 Click 'Undo Last Action' to pop from stack!")
+        self._sync_listbox(self.undo_listbox, lines)
+
+    # --- Startup ---
+    def _record_startup(self, phase: str) -> float:
+        """Records how long after startup a phase finished. Returns the seconds elapsed."""
+        elapsed = time.perf_counter() - self.started
+        self.startup_timings[phase] = elapsed
+        startup_profiler.mark(phase)
+        return elapsed
+
+    def _on_map(self, event):
+        """Waits for the first drawing of the root window, then loads the data."""
+        if event.widget is self.master and 'first_paint' not in self.startup_timings:
+            # Redraws are idle callbacks queued by the mapping; ours runs after them
+            self.master.after_idle(self._on_first_paint)
+
+    def _on_first_paint(self):
+        if 'first_paint' not in self.startup_timings:
+            elapsed = self._record_startup('first_paint')
+            logger.info(f"Time to first paint: {elapsed * 1000:.0f} ms.")
+        self.master.after(1, self._load_initial_data) # Let the drawn window reach the screen first
+
+    def _load_initial_data(self):
+        """
+        Populates the window in steps after it is first shown: loads the data, fills the event
+        list, then starts the reminder checks and redraws the visible tab.
+        """
+        if self._data_loaded or self._closing:
+            return
+        self._data_loaded = True
+        self.master.after_cancel(self._load_fallback)
+        self.status_label.config(text="Loading events...")
+        self.status_label.update_idletasks()
+        with startup_profiler.phase("load_data"):
+            self._load_data_from_db()
+        self._record_startup('data_loaded')
+        with startup_profiler.phase("show_events"):
+            self._display_events(filter_upcoming=False)
+            self.status_label.update_idletasks()
+        self._record_startup('events_shown')
+        self._check_reminders_periodic()
+        self._update_all_displays()
+        timings = ", ".join(f"{phase} {seconds * 1000:.0f} ms" for phase, seconds in self.startup_timings.items())
+        logger.info(f"Startup timings since launch: {timings}.")
+        startup_profiler.finish() # The window is drawn and populated: startup ends here
 
     # --- Persistence and General Methods ---
     def _load_data_from_db(self):
         """Loads all events and their tasks from the database into the EventPlanner."""
         logger.info("Loading data from database...")
         try:
-            events_from_db = self.db_manager.load_events()
-            for event_data in events_from_db:
-                # Use the special loading method to avoid side effects
-                self.planner._add_event_for_loading(event_data)
-                # Load tasks for each event
-                tasks_ll_head = self.db_manager.load_tasks(event_data.event_id)
-                self.planner.todo_lists[event_data.event_id] = tasks_ll_head
-                
-            logger.info(f"Loaded {len(events_from_db)} events and their tasks from DB.")
-            self.status_label.config(text=f"Loaded {len(events_from_db)} events from database.")
+            # Only the hot window (recent and upcoming events) is loaded; older months are faulted in on demand.
+            # The snapshot written on the last clean shutdown is used if the database has not changed since.
+            with startup_profiler.phase("load_snapshot"):
+                loaded = load_snapshot(self.planner, self.db_manager, snapshot_path(self.db_manager.db_name))
+            if loaded is None:
+                with startup_profiler.phase("load_window"):
+                    loaded = self.planner.load_window(self.db_manager)
+            self.history_start = self.planner.window_start
+            self.status_label.config(text=f"Loaded {loaded} events since {self.history_start:%Y-%m-%d} from database.")
         except Exception as e:
             logger.error(f"Error loading data from DB: {e}", exc_info=True)
             self._show_message("Database Error", f"Failed to load data from database: {e}")
 
+    def _load_older_events(self):
+        """Faults in the month before the oldest history shown so far and displays past events."""
+        if self.history_start is None:
+            return
+        try:
+            older_start = (self.history_start - datetime.timedelta(days=1)).replace(day=1, hour=0, minute=0)
+            loaded = self.planner.ensure_loaded(older_start, self.history_start)
+            self.history_start = older_start
+            self._display_events(filter_upcoming=False)
+            self.event_list.scroll_to(0) # The newly loaded month is at the top
+            self.status_label.config(text=f"Loaded {loaded} older events from {older_start:%B %Y}.")
+        except Exception as e:
+            logger.error(f"Error loading older events: {e}", exc_info=True)
+            self._show_message("Database Error", f"Failed to load older events: {e}")
+
     def _save_all_data_to_db(self):
         """Saves all current events and their tasks from the EventPlanner to the database."""
         logger.info("Saving all data to database...")
         try:
-            # Get all events (upcoming and past) to ensure all are saved
-            all_events = self.planner.view_events(upcoming=False) + self.planner.view_events(upcoming=True)
-            # Filter out duplicates (view_events might return overlapping sets if an event is both upcoming/past based on current time)
-            unique_event_ids = set()
-            unique_events = []
-            for event in all_events:
-                if event.event_id not in unique_event_ids:
-                    unique_events.append(event)
-                    unique_event_ids.add(event.event_id)
-
-            for event in unique_events:
-                self.db_manager.save_event(event)
-                # Save tasks for each event
-                tasks_ll_head = self.planner.todo_lists.get(event.event_id)
-                self.db_manager.save_tasks(event.event_id, tasks_ll_head)
-            logger.info(f"Saved {len(unique_events)} events and their tasks to DB.")
-            self.status_label.config(text=f"Saved {len(unique_events)} events to database.")
-            self._show_message("Save Success", "All data saved successfully!") # Confirmation message
+            # Rewrite every event and task list (plus any pending deletions) on the writer thread
+            self.planner.mark_all_dirty()
+            changes = self.planner.collect_changes()
+            self.writer.submit(changes)
+            self.writer.request_flush()
+            self.status_label.config(text=f"Saving {len(changes.events)} events to database...")
+            self._show_save_progress()
+            self._when_writer_idle(lambda: self._on_save_all_complete(len(changes.events)))
         except Exception as e:
             logger.error(f"Error saving data to DB: {e}", exc_info=True)
             self._show_message("Database Error", f"Failed to save data to database: {e}")
 
-    def _save_tasks_to_db_for_event(self, event_id: int):
-        """Saves tasks for a specific event to the database."""
+    def _on_save_all_complete(self, event_count: int):
+        """Reports the outcome of a Save All in the status bar once the writer has finished."""
+        self._hide_save_progress()
+        if self._report_writer_error():
+            return
+        logger.info(f"Saved {event_count} events and their tasks to DB.")
+        self.status_label.config(text=f"Saved {event_count} events to database.")
+
+    def _show_save_progress(self):
+        """Shows the busy indicator next to the status bar while the writer works."""
+        if not self.save_progress.winfo_ismapped():
+            self.save_progress.pack(side=tk.BOTTOM, anchor=tk.E, padx=10, before=self.notebook)
+            self.save_progress.start(50)
+
+    def _hide_save_progress(self):
+        self.save_progress.stop()
+        self.save_progress.pack_forget()
+
+    def _backup_now(self):
+        """Starts an online backup on a background thread and reports progress in the status bar."""
+        directory = self.backup_scheduler.directory
+        job = self.db_manager.backup(backup_path(directory, self.db_manager.db_name))
+        self.status_label.config(text="Backing up database...")
+
+        def poll():
+            if not job.done:
+                if job.total_pages:
+                    self.status_label.config(text=f"Backing up database... {job.pages_copied * 100 // job.total_pages}%")
+                self.master.after(100, poll)
+            elif job.error is not None:
+                self._show_message("Backup Error", f"Backup failed: {job.error}")
+            else:
+                rotate_backups(directory, self.db_manager.db_name, self.backup_scheduler.keep)
+                self.status_label.config(text=f"Backed up database to {job.dest}.")
+
+        poll()
+
+    def _when_writer_idle(self, callback, poll_ms: int = 100, errors_before: int = None):
+        """Calls callback on the Tk thread once the write-behind writer is idle or has hit a write error."""
+        stats = self.writer.stats()
+        if errors_before is None:
+            errors_before = stats['errors']
+        if self.writer.is_idle() or stats['errors'] > errors_before:
+            callback()
+        else:
+            self.master.after(poll_ms, lambda: self._when_writer_idle(callback, poll_ms, errors_before))
+
+    def _flush_changes(self):
+        """Hands the events and task lists changed since the last flush to the write-behind writer."""
+        if self._closing:
+            return # The writer is shutting down; the final flush already has everything
+        self._report_writer_error()
         try:
-            tasks_ll_head = self.planner.todo_lists.get(event_id)
-            self.db_manager.save_tasks(event_id, tasks_ll_head)
-            logger.debug(f"Tasks for event {event_id} saved to DB.")
+            self.writer.submit(self.planner.collect_changes())
         except Exception as e:
-            logger.error(f"Error saving tasks for event {event_id}: {e}", exc_info=True)
-            self._show_message("Database Error", f"Failed to save tasks for event {event_id}: {e}")
+            logger.error(f"Error queueing changes for the database: {e}", exc_info=True)
+            self._show_message("Database Error", f"Failed to save changes to database: {e}")
+
+    def _report_writer_error(self) -> bool:
+        """Shows the last background write error, if any. Returns True if there was one."""
+        error = self.writer.take_error()
+        if error is None:
+            return False
+        self._show_message("Database Error", f"Failed to save changes to database: {error}\n\n"
+                                             "The changes are kept and will be retried.")
+        return True
 
     def _on_closing(self):
-        """Handles the window closing event, saving data and closing DB connection."""
-        if messagebox.askyesno("Quit", "Do you want to save changes before quitting?"):
-            self._save_all_data_to_db()
+        """
+        Handles the window closing event. Pending changes are flushed and the database threads
+        stopped on a background thread while the window stays responsive; the window closes
+        once they are done.
+        """
+        if self._closing:
+            if messagebox.askyesno("Quit", "Still saving changes. Quit without waiting?\n\n"
+                                           "Changes not yet written will be lost."):
+                logger.warning("Quit before the final save finished; some changes may not be saved.")
+                self.master.destroy()
+            return
+        if self.planner.has_unsaved_changes() and messagebox.askyesno("Quit", "Do you want to save changes before quitting?"):
+            self._flush_changes()
+        self._closing = True
+        if self.report_job is not None:
+            self.report_job.cancel()
+        self.status_label.config(text="Saving changes before exit...")
+        self._show_save_progress()
+        self.notebook.pack_forget() # No more edits; the window only shows the progress until it closes
+        result = {}
+
+        def shut_down():
+            result['writer_closed'] = self.writer.close()
+            self.backup_scheduler.stop(timeout=5.0)
+
+        worker = threading.Thread(target=shut_down, name="shutdown", daemon=True)
+        worker.start()
+        self._finish_closing(worker, result)
+
+    def _finish_closing(self, worker: threading.Thread, result: dict):
+        """Closes the window once the shutdown thread has finished (polled from the Tk thread)."""
+        if worker.is_alive():
+            self.master.after(100, lambda: self._finish_closing(worker, result))
+            return
+        if not result.get('writer_closed'):
+            logger.error("Write-behind writer did not finish cleanly; some changes may not be saved.")
+        elif self.history_start is None:
+            logger.info("Closed before the data was loaded; keeping the existing planner snapshot.")
+        elif not self.planner.has_unsaved_changes():
+            try:
+                write_snapshot(self.planner, self.db_manager, snapshot_path(self.db_manager.db_name))
+            except Exception as e:
+                logger.warning(f"Could not write planner snapshot: {e}")
+        logger.info(f"Display refreshes: {self.refresh_scheduler.stats()}")
         self.db_manager.close()
         self.master.destroy()
 
@@ -858,16 +1240,32 @@ class EventPlannerGUI:
         """Displays a message box to the user."""
         messagebox.showinfo(title, message)
 
-    def _update_all_displays(self):
-        """Refreshes all relevant display areas in the GUI."""
-        # Show all events (both upcoming and past) to ensure deleted events disappear
-        self._display_events(filter_upcoming=False) 
-        self._display_reminder_queue()
-        self._display_edit_history()
-        # Only update tasks display if an event is currently selected
-        if self.current_event_tasks_id:
-            self._display_tasks_for_selected_event()
+    @staticmethod
+    def _sync_listbox(listbox: tk.Listbox, lines: list):
+        """
+        Makes a listbox show `lines`, replacing only the lines between the unchanged
+        beginning and end, so a small change costs a couple of Tk calls instead of a full refill.
+        """
+        current = listbox.get(0, tk.END)
+        prefix = 0
+        limit = min(len(current), len(lines))
+        while prefix < limit and current[prefix] == lines[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and current[-1 - suffix] == lines[-1 - suffix]:
+            suffix += 1
+        if prefix + suffix < len(current):
+            listbox.delete(prefix, len(current) - suffix - 1)
+        if prefix + suffix < len(lines):
+            listbox.insert(prefix, *lines[prefix:len(lines) - suffix])
 
+    def _update_all_displays(self):
+        """
+        Marks all display areas as out of date. The visible tab is redrawn once Tk is idle,
+        so a burst of actions costs a single redraw; the others are redrawn when selected.
+        """
+        # Events (both upcoming and past), reminders, undo history and the selected event's tasks
+        self.refresh_scheduler.invalidate_all()
 
 # Main application entry point
 if __name__ == "__main__":
@@ -0,0 +1,99 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Dict, Optional
+
+
+class RefreshScheduler:
+    """
+    Coalesces display refreshes for the tabs of a ttk.Notebook.
+    Callers mark tabs dirty instead of redrawing them. One refresh pass runs when Tk is next idle
+    (after_idle), however many requests arrived before it, and it only redraws the visible tab.
+    Hidden tabs stay dirty and are redrawn when they are selected.
+    Tabs registered with a build function are also constructed lazily, the first time they are shown.
+    """
+
+    def __init__(self, notebook: ttk.Notebook):
+        """
+        :param notebook: The notebook whose tabs are refreshed; tab changes are watched.
+        """
+        self.notebook = notebook
+        self._refreshers: Dict[str, Callable[[], None]] = {}  # {tab widget name: refresh function}
+        self._builders: Dict[str, Callable[[], None]] = {}  # {tab widget name: build function} of unbuilt tabs
+        self._dirty = set()
+        self._pending = None  # after_idle id of the scheduled pass
+        self._stats = {'requests': 0, 'refreshes': 0, 'coalesced': 0, 'deferred': 0}
+        notebook.bind("<<NotebookTabChanged>>", lambda e: self._schedule(), add="+")
+
+    def register(self, tab: tk.Widget, refresh: Callable[[], None],
+                 build: Optional[Callable[[], None]] = None) -> None:
+        """
+        Registers the function that redraws a tab (a widget added to the notebook).
+        :param tab: The tab's widget.
+        :param refresh: Redraws the tab's contents.
+        :param build: If given, creates the tab's widgets; it is called once, just before the tab is
+                      first redrawn, i.e. when it is first shown. Otherwise the tab is built already.
+        """
+        name = str(tab)
+        self._refreshers[name] = refresh
+        if build is not None:
+            self._builders[name] = build
+            self._dirty.add(name)  # Its first showing builds and draws it
+            self._schedule()
+
+    def is_built(self, tab: tk.Widget) -> bool:
+        """Returns False for a lazily built tab that has not been shown yet."""
+        return str(tab) not in self._builders
+
+    def invalidate(self, *tabs: tk.Widget) -> None:
+        """Marks tabs as needing a redraw and schedules a refresh pass."""
+        for tab in tabs:
+            name = str(tab)
+            self._stats['requests'] += 1
+            if name in self._dirty:
+                self._stats['coalesced'] += 1  # Already waiting for a redraw
+            self._dirty.add(name)
+        self._schedule()
+
+    def invalidate_all(self) -> None:
+        """Marks every registered tab as needing a redraw."""
+        self.invalidate(*(self.notebook.nametowidget(name) for name in self._refreshers))
+
+    def _schedule(self) -> None:
+        if self._pending is None and self._dirty:
+            self._pending = self.notebook.after_idle(self._run)
+
+    def _run(self) -> None:
+        """Redraws the visible tab if it is dirty; other dirty tabs wait until they are shown."""
+        self._pending = None
+        visible = self.notebook.select()
+        if visible in self._dirty:
+            self._dirty.discard(visible)
+            builder = self._builders.pop(visible, None)
+            if builder is not None:
+                builder()
+            self._stats['refreshes'] += 1
+            self._refreshers[visible]()
+        self._stats['deferred'] = len(self._dirty)
+
+    def flush(self) -> None:
+        """Redraws every dirty tab now, visible or not (tabs not built yet stay unbuilt)."""
+        if self._pending is not None:
+            self.notebook.after_cancel(self._pending)
+            self._pending = None
+        for name in list(self._dirty):
+            if name in self._builders:
+                continue
+            self._dirty.discard(name)
+            self._stats['refreshes'] += 1
+            self._refreshers[name]()
+        self._stats['deferred'] = len(self._dirty)
+
+    def stats(self) -> dict:
+        """
+        Returns {'requests', 'refreshes', 'coalesced', 'deferred', 'skipped'}: refresh requests
+        received, redraws performed, requests merged into an already pending redraw, hidden tabs
+        currently waiting to be shown, and the redraws saved overall (requests - refreshes).
+        """
+        stats = dict(self._stats)
+        stats['skipped'] = max(stats['requests'] - stats['refreshes'], 0)
+        return stats
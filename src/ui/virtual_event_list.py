@@ -0,0 +1,253 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, List, Optional, Tuple
+
+from core.event_planner import Event, EventPlanner
+
+
+class VirtualEventList:
+    """
+    A Treeview of the planner's events that only holds the rows in view.
+    The list covers a range of chronological positions in the planner (e.g. upcoming events are
+    positions [count_before(now), event_count())). Scrolling does not move the Treeview; it moves
+    the first position shown and refills the Treeview with the visible rows plus a small buffer,
+    read with EventPlanner.events_slice, whether the planner holds a hundred events or a million.
+    Alternatively the list shows an explicit sequence of events (e.g. search matches, see
+    show_events), which may keep growing while it is displayed.
+
+    Item ids are str(event_id). Refreshing reconciles the Treeview with the new rows instead of
+    rebuilding it: rows that left the view are deleted, new ones inserted, rows of events the
+    planner reports as changed (EventPlanner.take_view_changes) are updated in place and the
+    order is fixed with a single call if needed. A one-row edit therefore costs O(1) Tk calls.
+    The selection is remembered by event ID so it survives its row scrolling out of view.
+    """
+
+    def __init__(self, parent: tk.Widget, planner: EventPlanner, columns: Tuple[str, ...],
+                 row_values: Callable[[Event], tuple], on_select: Optional[Callable[[], None]] = None,
+                 buffer_rows: int = 5):
+        """
+        Creates the Treeview and its scrollbar inside parent.
+        :param parent: The container to pack the list into.
+        :param planner: The planner whose events are listed.
+        :param columns: The Treeview column names (configure headings via `tree`).
+        :param row_values: Maps an Event to the values shown in its row.
+        :param on_select: Called when the user selects or deselects an event.
+        :param buffer_rows: Rows materialized beyond the viewport, so partly visible rows are filled.
+        """
+        self.planner = planner
+        self.row_values = row_values
+        self.on_select = on_select
+        self.buffer_rows = buffer_rows
+        self.selected_event_id = None
+        self._range_start = 0
+        self._range_stop = None  # None: up to the last event
+        self._events = None  # Events shown instead of a planner range (see show_events)
+        self._event_offsets = {}  # {event_id: offset in _events}
+        self._top = 0  # Offset of the first visible row within the range
+        self._shown = []  # Item ids currently in the Treeview, in order
+        self.last_reconcile = {'inserted': 0, 'updated': 0, 'deleted': 0, 'reordered': False}
+
+        self.tree = ttk.Treeview(parent, columns=columns, show="headings", selectmode="browse")
+        self.scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self.tree.bind("<Configure>", lambda e: self.refresh())
+        self.tree.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.tree.bind("<Button-4>", lambda e: self._scroll_by(-3))  # X11 wheel up
+        self.tree.bind("<Button-5>", lambda e: self._scroll_by(3))  # X11 wheel down
+        self.tree.bind("<Up>", lambda e: self._move_selection(-1))
+        self.tree.bind("<Down>", lambda e: self._move_selection(1))
+        self.tree.bind("<Prior>", lambda e: self._scroll_by(-self.visible_rows()))
+        self.tree.bind("<Next>", lambda e: self._scroll_by(self.visible_rows()))
+
+    # --- Range and geometry ---
+    def set_range(self, start: int = 0, stop: Optional[int] = None) -> None:
+        """
+        Shows the events at chronological positions [start, stop) and refreshes the rows.
+        The scroll offset is kept (clamped to the new range).
+        """
+        self._range_start = max(start, 0)
+        self._range_stop = stop
+        self._events = None
+        self._event_offsets = {}
+        self.refresh()
+
+    def show_events(self, events: List[Event], scroll_to_top: bool = True) -> None:
+        """
+        Shows the given events, in the given order, instead of a range of the planner's events
+        (until set_range is called) and refreshes the rows.
+        :param scroll_to_top: If False, the scroll offset is kept (clamped), e.g. when showing
+                              an updated version of the same list.
+        """
+        self._events = []
+        self._event_offsets = {}
+        if scroll_to_top:
+            self._top = 0
+        self.extend_events(events)
+
+    def extend_events(self, events: List[Event]) -> None:
+        """Appends events to the list shown by show_events, e.g. as more search matches arrive."""
+        for event in events:
+            self._event_offsets[event.event_id] = len(self._events)
+            self._events.append(event)
+        self.refresh()
+
+    def row_count(self) -> int:
+        """Returns the number of events in the displayed range."""
+        if self._events is not None:
+            return len(self._events)
+        stop = self.planner.event_count() if self._range_stop is None else self._range_stop
+        return max(min(stop, self.planner.event_count()) - self._range_start, 0)
+
+    def visible_rows(self) -> int:
+        """Returns how many rows fit in the Treeview at its current height."""
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        # One row's worth of height is taken by the headings
+        return max(self.tree.winfo_height() // row_height - 1, 1)
+
+    # --- Scrolling ---
+    def scroll_to(self, offset: int) -> None:
+        """Makes the row at `offset` within the range the first visible row (clamped)."""
+        self._top = offset
+        self.refresh()
+
+    def _scroll_by(self, rows: int) -> str:
+        self.scroll_to(self._top + rows)
+        return "break"
+
+    def _on_scrollbar(self, action: str, amount: str, unit: Optional[str] = None) -> None:
+        """Scrollbar command: 'moveto fraction' or 'scroll n units|pages'."""
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * self.row_count()))
+        elif action == "scroll":
+            step = self.visible_rows() if unit == "pages" else 1
+            self._scroll_by(int(amount) * step)
+
+    def _on_mouse_wheel(self, event) -> str:
+        # Windows reports multiples of 120 per notch, macOS small deltas; only the direction is used
+        return self._scroll_by(-3 if event.delta > 0 else 3)
+
+    def _move_selection(self, step: int) -> str:
+        """Moves the selection by one row, scrolling when it would leave the viewport."""
+        offset = self.offset_of(self.selected_event_id) if self.selected_event_id is not None else None
+        if offset is None:
+            offset = self._top - step  # Nothing selected in range: start at the first visible row
+        offset = min(max(offset + step, 0), self.row_count() - 1)
+        if offset < 0:
+            return "break"
+        if offset < self._top:
+            self._top = offset
+        elif offset >= self._top + self.visible_rows():
+            self._top = offset - self.visible_rows() + 1
+        events = self._rows(offset, 1)
+        if events:
+            self.selected_event_id = events[0].event_id
+            self.refresh()
+            if self.on_select:
+                self.on_select()
+        return "break"
+
+    # --- Rows and selection ---
+    def refresh(self) -> None:
+        """Brings the Treeview up to date with the rows at the current scroll offset."""
+        total = self.row_count()
+        visible = self.visible_rows()
+        self._top = min(max(self._top, 0), max(total - visible, 0))
+        count = min(visible + self.buffer_rows, total - self._top)
+        events = self._rows(self._top, count)
+        self._reconcile(events, self.planner.take_view_changes())
+        if self.selected_event_id is not None and str(self.selected_event_id) in self._shown:
+            if self.tree.selection() != (str(self.selected_event_id),):
+                self.tree.selection_set(str(self.selected_event_id))
+
+        if total:
+            self.scrollbar.set(self._top / total, min((self._top + visible) / total, 1.0))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _rows(self, offset: int, count: int) -> List[Event]:
+        """Returns up to `count` events from the given row offset."""
+        if self._events is not None:
+            return self._events[offset:offset + count]
+        return self.planner.events_slice(self._range_start + offset, count)
+
+    def _reconcile(self, events, changed_ids) -> None:
+        """
+        Makes the Treeview show exactly `events`, touching only rows that differ.
+        :param events: The events to show, in order.
+        :param changed_ids: IDs of events whose values may have changed since they were shown.
+        """
+        wanted = [str(event.event_id) for event in events]
+        wanted_set = set(wanted)
+        shown_set = set(self._shown)
+        gone = [iid for iid in self._shown if iid not in wanted_set]
+        if gone:
+            self.tree.delete(*gone)
+        kept = [iid for iid in self._shown if iid in wanted_set]
+
+        inserted = updated = 0
+        for event, iid in zip(events, wanted):
+            if iid not in shown_set:
+                self.tree.insert("", tk.END, iid=iid, values=self.row_values(event))
+                kept.append(iid)
+                inserted += 1
+            elif event.event_id in changed_ids:
+                self.tree.item(iid, values=self.row_values(event))
+                updated += 1
+        reordered = kept != wanted
+        if reordered:
+            self.tree.set_children("", *wanted)  # One call moves every row into place
+        self._shown = wanted
+        self.last_reconcile = {'inserted': inserted, 'updated': updated, 'deleted': len(gone), 'reordered': reordered}
+
+    def _on_tree_select(self, event=None) -> None:
+        """
+        Records selection changes made by the user. <<TreeviewSelect>> is delivered later from the
+        event queue, so changes made by refresh() are recognized by comparing with selected_event_id.
+        """
+        selection = self.tree.selection()
+        if selection:
+            if int(selection[0]) == self.selected_event_id:
+                return
+            self.selected_event_id = int(selection[0])
+        elif self.selected_event_id is not None and self.tree.exists(str(self.selected_event_id)):
+            self.selected_event_id = None  # Deselected by the user, not scrolled out of view
+        else:
+            return
+        if self.on_select:
+            self.on_select()
+
+    def clear_selection(self) -> None:
+        """Deselects the selected event (reporting it if one was selected)."""
+        had_selection = self.selected_event_id is not None
+        self.selected_event_id = None
+        self.tree.selection_remove(self.tree.selection())
+        if had_selection and self.on_select:
+            self.on_select()
+
+    def offset_of(self, event_id: int) -> Optional[int]:
+        """Returns an event's row offset within the displayed range, or None if it is not in it."""
+        if self._events is not None:
+            return self._event_offsets.get(event_id)
+        position = self.planner.position_of(event_id)
+        if position is None or not 0 <= position - self._range_start < self.row_count():
+            return None
+        return position - self._range_start
+
+    def see(self, event_id: int) -> bool:
+        """
+        Scrolls an event into view and selects it (reporting the selection).
+        :return: False if the event is not in the displayed range.
+        """
+        offset = self.offset_of(event_id)
+        if offset is None:
+            return False
+        if not self._top <= offset < self._top + self.visible_rows():
+            self._top = offset - self.visible_rows() // 2
+        self.selected_event_id = event_id
+        self.refresh()
+        if self.on_select:
+            self.on_select()
+        return True
@@ -0,0 +1,97 @@
+import unittest
+import asyncio
+import contextlib
+import datetime
+import os
+import sys
+import sqlite3
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from core.event_planner import Event
+from database.async_db import AsyncDBManager
+
+
+class TestAsyncDBManager(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        """
+        Open the facade on a temporary database file
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = AsyncDBManager(os.path.join(self.tmpdir.name, "events.db"), max_queue=4)
+
+    async def asyncTearDown(self):
+        await self.db.close()
+        self.tmpdir.cleanup()
+
+    def _event(self, event_id):
+        return Event(event_id, f"Event {event_id}", f"2030-01-{event_id % 28 + 1:02d}", "10:00", False)
+
+    async def test_concurrent_small_writes_share_transactions(self):
+        """
+        Test many concurrent single-event saves are committed in a few batches
+        """
+        await asyncio.gather(*(self.db.save_event(self._event(i)) for i in range(1, 201)))
+        stats = self.db.stats()
+        self.assertEqual(stats['batched_rows'], 200)
+        self.assertLess(stats['batches'], 10)
+        self.assertEqual(len(await self.db.load_events()), 200)
+        self.assertEqual(await self.db.get_max_event_id(), 200)
+
+    async def test_stream_events_in_order(self):
+        """
+        Test streaming yields events chronologically in chunks, and can stop early
+        """
+        await self.db.save_events(self._event(i) for i in range(1, 51))
+        dates = [event.date async for event in self.db.stream_events(chunk_size=7)]
+        self.assertEqual(len(dates), 50)
+        self.assertEqual(dates, sorted(dates))
+
+        window = [event async for event in self.db.stream_events(datetime.datetime(2030, 1, 5),
+                                                                 datetime.datetime(2030, 1, 6))]
+        self.assertEqual({event.date for event in window}, {"2030-01-05"})
+
+        async with contextlib.aclosing(self.db.stream_events(chunk_size=5)) as events:
+            async for _ in events:
+                break
+        self.assertEqual(self.db.stats()['pool']['readers_in_use'], 0)
+
+    async def test_stream_events_skips_tasks(self):
+        """
+        Test streaming does not run the task query
+        """
+        await self.db.save_events(self._event(i) for i in range(1, 6))
+        self.db.db.reset_stats()
+        self.assertEqual(len([event async for event in self.db.stream_events()]), 5)
+        self.assertNotIn('load_range.tasks', self.db.db.stats())
+
+    async def test_failed_batch_only_fails_the_bad_caller(self):
+        """
+        Test a batched write rejected because of one caller's events still saves everyone else's
+        """
+        bad = Event(1, None, "2030-01-01", "10:00", False)  # name is NOT NULL
+        results = await asyncio.gather(self.db.save_event(self._event(2)), self.db.save_event(bad),
+                                       self.db.save_events([self._event(3), self._event(4)]),
+                                       return_exceptions=True)
+        self.assertIsNone(results[0])
+        self.assertIsInstance(results[1], sqlite3.IntegrityError)
+        self.assertEqual(results[2], 2)
+        self.assertEqual(sorted(event.event_id for event in await self.db.load_events()), [2, 3, 4])
+        self.assertEqual(self.db.stats()['split_batches'], 1)
+
+        with self.assertRaises(sqlite3.IntegrityError):  # A lone caller gets the error directly
+            await self.db.save_event(bad)
+        self.assertEqual(self.db.stats()['split_batches'], 1)
+
+    async def test_in_memory_database(self):
+        """
+        Test the facade works with an in-memory database on a single worker
+        """
+        async with AsyncDBManager(":memory:") as db:
+            await db.save_events([self._event(1), self._event(2)])
+            self.assertEqual([event.event_id async for event in db.stream_events()], [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
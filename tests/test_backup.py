@@ -0,0 +1,121 @@
+import unittest
+import datetime
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from core.event_planner import Event
+from database.db_manager import DBManager
+from database.backup import BackupCancelled, BackupScheduler, backup_path, list_backups, rotate_backups, validate_backup
+
+
+class TestBackup(unittest.TestCase):
+    def setUp(self):
+        """
+        Use a temporary directory for the database and its backups
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = DBManager(os.path.join(self.tmpdir.name, "events.db"))
+        self.db.save_events(Event(i, f"Event {i}", "2030-01-01", "10:00", False, description="x" * 200)
+                            for i in range(1, 501))
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+    def test_backup_runs_in_steps_while_writes_continue(self):
+        """
+        Test an incremental backup completes during writes and is a valid database
+        """
+        steps = []
+        job = self.db.backup(self._path("copy.db"), pages_per_step=5, progress=lambda done, total: steps.append(done))
+        for i in range(501, 521):
+            self.db.save_event(Event(i, f"Event {i}", "2030-01-02", "10:00", False))
+        self.assertTrue(job.wait(10), job.error)
+        self.assertGreater(len(steps), 1)
+        self.assertEqual(steps[-1], job.total_pages)
+        self.assertEqual(validate_backup(self._path("copy.db"), self.db.schema_version()), len(DBManager._MIGRATIONS))
+        self.assertFalse(os.path.exists(self._path("copy.db.part")))
+
+    def test_cancel_leaves_no_file(self):
+        """
+        Test a cancelled backup reports BackupCancelled and removes its partial file
+        """
+        started = threading.Event()
+        release = threading.Event()
+
+        def progress(done, total):
+            started.set()
+            release.wait(5)
+
+        job = self.db.backup(self._path("copy.db"), pages_per_step=1, progress=progress)
+        started.wait(5)
+        job.cancel()
+        release.set()
+        self.assertFalse(job.wait(10))
+        self.assertIsInstance(job.error, BackupCancelled)
+        self.assertEqual([name for name in os.listdir(self.tmpdir.name) if name.startswith("copy")], [])
+
+    def test_restore_validates_before_replacing(self):
+        """
+        Test restore swaps in a good backup and refuses corrupt or newer ones
+        """
+        self.assertTrue(self.db.backup(self._path("copy.db")).wait(10))
+        self.db.delete_event(1)
+        self.db.save_event(Event(999, "After backup", "2030-01-01", "10:00", False))
+
+        with open(self._path("junk.db"), "wb") as f:
+            f.write(b"not a database" * 100)
+        newer = sqlite3.connect(self._path("newer.db"))
+        newer.executescript("CREATE TABLE events (event_id INTEGER); CREATE TABLE tasks (task_id INTEGER); "
+                            "PRAGMA user_version = 99;")
+        newer.close()
+        for bad in ("junk.db", "newer.db", "missing.db"):
+            with self.assertRaises(ValueError):
+                self.db.restore(self._path(bad))
+        self.assertEqual(len(self.db.load_events()), 500)
+
+        self.assertEqual(self.db.restore(self._path("copy.db")), len(DBManager._MIGRATIONS))
+        ids = {event.event_id for event in self.db.load_events()}
+        self.assertIn(1, ids)
+        self.assertNotIn(999, ids)
+        self.assertEqual([r["event_id"] for r in self.db.search("After backup")], [])
+
+    def test_rotation_keeps_newest(self):
+        """
+        Test rotation deletes the oldest timestamped backups only
+        """
+        paths = [backup_path(self.tmpdir.name, self.db.db_name, datetime.datetime(2030, 1, day)) for day in (3, 1, 2)]
+        for path in paths:
+            open(path, "w").close()
+        open(self._path("other-20300101-000000.db"), "w").close()
+        removed = rotate_backups(self.tmpdir.name, self.db.db_name, keep=2)
+        self.assertEqual(removed, [paths[1]])
+        self.assertEqual(list_backups(self.tmpdir.name, self.db.db_name), sorted([paths[0], paths[2]]))
+
+    def test_scheduler_backs_up_and_rotates(self):
+        """
+        Test on-demand backups through the scheduler are rotated to the configured count
+        """
+        directory = self._path("backups")
+        scheduler = BackupScheduler(self.db, directory, interval=3600, keep=1)
+        try:
+            first = scheduler.backup_now()
+            os.rename(first, backup_path(directory, self.db.db_name, datetime.datetime(2000, 1, 1)))
+            second = scheduler.backup_now()
+        finally:
+            scheduler.stop(5)
+        self.assertEqual(list_backups(directory, self.db.db_name), [second])
+        self.assertEqual(scheduler.last_backup, second)
+        self.assertIsNone(scheduler.backup_now())  # Stopped
+
+
+if __name__ == "__main__":
+    unittest.main()
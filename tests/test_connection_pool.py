@@ -0,0 +1,93 @@
+import unittest
+import os
+import sys
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from core.event_planner import Event
+from database.db_manager import DBManager
+
+
+class TestConnectionPool(unittest.TestCase):
+    def setUp(self):
+        """
+        Use a temporary database file so readers get their own connections
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = DBManager(os.path.join(self.tmpdir.name, "events.db"), max_readers=2)
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def _run_threads(self, target, count):
+        errors = []
+
+        def run(index):
+            try:
+                target(index)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        return errors
+
+    def test_concurrent_writers_and_readers(self):
+        """
+        Test one DBManager can be shared by writer and reader threads
+        """
+        def work(index):
+            for i in range(20):
+                event_id = index * 100 + i + 1
+                self.db.save_event(Event(event_id, f"E{event_id}", "2030-01-01", "10:00", False))
+                self.db.insert_tasks(event_id, ["a", "b"])
+                self.db.load_events()
+                self.db.load_tasks(event_id)
+
+        self.assertEqual(self._run_threads(work, 6), [])
+        self.assertEqual(len(self.db.load_events()), 120)
+        stats = self.db.pool_stats()
+        self.assertLessEqual(stats['readers_open'], 2)
+        self.assertEqual(stats['readers_in_use'], 0)
+        self.assertGreaterEqual(stats['writer_checkouts'], 240)
+
+    def test_readers_are_read_only_and_bounded(self):
+        """
+        Test reader connections refuse writes and the pool waits instead of opening more
+        """
+        with self.db.pool.reader() as conn:
+            with self.assertRaises(Exception):
+                conn.execute("DELETE FROM events")
+            with self.db.pool.reader():
+                released = threading.Event()
+
+                def third_reader():
+                    with self.db.pool.reader():
+                        released.set()
+
+                thread = threading.Thread(target=third_reader)
+                thread.start()
+                self.assertFalse(released.wait(0.2))
+        thread.join(5)
+        self.assertTrue(released.is_set())
+        self.assertEqual(self.db.pool_stats()['reader_waits'], 1)
+
+    def test_memory_database_shares_the_writer(self):
+        """
+        Test readers of an in-memory database see the writer's data
+        """
+        db = DBManager(":memory:")
+        db.save_event(Event(1, "Only", "2030-01-01", "10:00", False))
+        self.assertEqual([e.event_id for e in db.load_events()], [1])
+        self.assertEqual(db.pool_stats()['readers_open'], 0)
+        db.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
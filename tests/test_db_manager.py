@@ -0,0 +1,539 @@
+import unittest
+import sys
+import os
+import tempfile
+import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from core.event_planner import EventPlanner, Event, PlannerChanges
+from database.db_manager import DBManager
+from database.statement_stats import StatementStats
+from data_structures.linked_list import LLNode
+
+
+class TestDBManager(unittest.TestCase):
+    def setUp(self):
+        """
+        Use an in-memory database for each test
+        """
+        self.db = DBManager(db_name=":memory:")
+        self.event = Event(1, "Conference", "2030-05-01", "09:00", False)
+        self.db.save_event(self.event)
+
+    def tearDown(self):
+        self.db.close()
+
+    def _task_list(self, head):
+        tasks = []
+        while head:
+            tasks.append((head.data, head.completed))
+            head = head.next
+        return tasks
+
+    # ---- TASK PERSISTENCE ----
+    def test_save_tasks_round_trip(self):
+        """
+        Test a task list survives a save and reload in order
+        """
+        planner = EventPlanner()
+        planner._add_event_for_loading(self.event)
+        planner.add_tasks(1, ["Book venue", "Print badges", "Order food"])
+        planner.complete_tasks(1, ["Print badges"])
+        self.db.save_tasks(1, planner.todo_lists[1])
+        self.assertEqual(self._task_list(self.db.load_tasks(1)),
+                         [("Book venue", False), ("Print badges", True), ("Order food", False)])
+
+        # Saving again replaces rather than duplicates
+        self.db.save_tasks(1, planner.todo_lists[1])
+        self.assertEqual(len(self._task_list(self.db.load_tasks(1))), 3)
+
+    def test_insert_tasks_appends(self):
+        """
+        Test bulk append leaves existing rows intact
+        """
+        self.assertEqual(self.db.insert_tasks(1, ["First"]), 1)
+        self.assertEqual(self.db.insert_tasks(1, (f"Task {i}" for i in range(299))), 299)
+        tasks = self._task_list(self.db.load_tasks(1))
+        self.assertEqual(len(tasks), 300)
+        self.assertEqual(tasks[0], ("First", False))
+
+
+    # ---- BULK WRITES ----
+    def test_save_events_in_chunks(self):
+        """
+        Test a generator of events is written across several chunks
+        """
+        events = (Event(i, f"Event {i}", "2030-06-01", "10:00", i % 2 == 0) for i in range(2, 252))
+        self.assertEqual(self.db.save_events(events, chunk_size=40), 250)
+        loaded = {event.event_id: event for event in self.db.load_events()}
+        self.assertEqual(len(loaded), 251)
+        self.assertTrue(loaded[2].reminder_set)
+        self.assertEqual(loaded[251].name, "Event 251")
+
+    def test_save_tasks_bulk_replaces_lists(self):
+        """
+        Test bulk task saves replace each event's rows and accept empty lists
+        """
+        planner = EventPlanner()
+        for event_id in (1, 2):
+            planner._add_event_for_loading(Event(event_id, f"E{event_id}", "2030-06-01", "10:00", False))
+        self.db.save_events(planner._events_by_id.values())
+        self.db.insert_tasks(2, ["stale"])
+
+        planner.add_tasks(1, ["a", "b", "c"])
+        written = self.db.save_tasks_bulk({1: planner.todo_lists.get(1), 2: planner.todo_lists.get(2)},
+                                          chunk_size=2)
+        self.assertEqual(written, 3)
+        self.assertEqual([t[0] for t in self._task_list(self.db.load_tasks(1))], ["a", "b", "c"])
+        self.assertIsNone(self.db.load_tasks(2))
+
+
+    # ---- STARTUP LOAD ----
+    def test_load_all_streams_events_with_tasks(self):
+        """
+        Test load_all returns events chronologically with their task chains attached
+        """
+        self.db.save_events([Event(2, "Later", "2030-07-01", "08:00", True),
+                             Event(3, "Earliest", "2001-01-01", "08:00", False)])
+        self.db.insert_tasks(2, ["x", "y"])
+        self.db.insert_tasks(1, ["z"])
+        rows = list(self.db.load_all())
+        self.assertEqual([event.event_id for event, _ in rows], [3, 1, 2])
+        self.assertIsNone(rows[0][1])
+        self.assertEqual([t[0] for t in self._task_list(rows[2][1])], ["x", "y"])
+
+        planner = EventPlanner()
+        self.assertEqual(planner.bulk_load(rows), 3)
+        self.assertEqual([e.event_id for e in planner.view_events(upcoming=True)], [1, 2])
+        self.assertEqual([e.event_id for e in planner.view_reminder_queue()], [2])
+        self.assertEqual(len(planner.get_tasks(2)), 2)
+
+    def test_bulk_load_builds_balanced_tree(self):
+        """
+        Test a large chronological load produces a shallow BST
+        """
+        self.db.save_events(Event(i, f"E{i}", f"2030-01-01", f"{i // 60 % 24:02d}:{i % 60:02d}", False)
+                            for i in range(2, 1025))
+        planner = EventPlanner()
+        planner.bulk_load(self.db.load_all())
+
+        def height(node):
+            return 0 if node is None else 1 + max(height(node.left), height(node.right))
+        self.assertLessEqual(height(planner.bst_root), 11)
+        self.assertEqual(len(planner.view_events(upcoming=True)), 1024)
+
+
+    # ---- STORAGE PROFILES ----
+    def test_save_event_keeps_tasks(self):
+        """
+        Test re-saving an event does not cascade-delete its tasks
+        """
+        self.db.insert_tasks(1, ["keep me"])
+        self.event.name = "Renamed"
+        self.db.save_event(self.event)
+        self.assertEqual(self._task_list(self.db.load_tasks(1)), [("keep me", False)])
+
+    def test_delete_event_cascades_to_tasks(self):
+        """
+        Test foreign keys are enforced so deleting an event removes its task rows
+        """
+        self.db.insert_tasks(1, ["orphan?"])
+        self.db.delete_event(1)
+        self.assertEqual(self.db.conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0], 0)
+
+    def test_profiles_configure_connection(self):
+        """
+        Test each named profile applies WAL, sync level and foreign keys to a file database
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for profile, synchronous in (("durable", 2), ("balanced", 1), ("bulk-load", 0)):
+                db = DBManager(os.path.join(tmpdir, "profiles.db"), profile=profile)
+                applied = db.apply_profile(profile)
+                self.assertEqual(applied["journal_mode"], "wal")
+                self.assertEqual(applied["synchronous"], synchronous)
+                self.assertEqual(applied["foreign_keys"], 1)
+                db.close()
+        with self.assertRaises(ValueError):
+            DBManager(":memory:", profile="reckless")
+
+    # ---- SCHEMA MIGRATIONS ----
+    def test_new_database_is_fully_migrated(self):
+        """
+        Test a fresh database reaches the latest schema version and keeps starts_at in sync
+        """
+        self.assertEqual(self.db.schema_version(), len(DBManager._MIGRATIONS))
+        self.db.save_event(Event(2, "Late", "1970-01-02", "00:30", False))
+        row = self.db.conn.execute("SELECT starts_at FROM events WHERE event_id = 2").fetchone()
+        self.assertEqual(row[0], 86400 + 1800)
+        plan = " ".join(str(r) for r in self.db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM events WHERE starts_at BETWEEN 0 AND 10"))
+        self.assertIn("idx_events_starts_at", plan)
+
+    def test_legacy_database_is_migrated_and_backfilled(self):
+        """
+        Test an unversioned database gets the indexes and a chunked starts_at backfill
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "legacy.db")
+            legacy = DBManager(path)
+            legacy.conn.executescript("""
+                DROP INDEX idx_tasks_event_id; DROP INDEX idx_events_starts_at;
+                ALTER TABLE events DROP COLUMN starts_at; PRAGMA user_version = 0;
+            """)
+            legacy.conn.executemany(
+                "INSERT INTO events (event_id, name, date, time, reminder_set) VALUES (?, ?, ?, ?, 0)",
+                [(i, f"Event {i}", "2001-01-01", f"{i % 24:02d}:00") for i in range(2, 60)])
+            legacy.conn.commit()
+            legacy.close()
+
+            db = DBManager(path, chunk_size=7)
+            self.assertEqual(db.schema_version(), len(DBManager._MIGRATIONS))
+            self.assertEqual(db.conn.execute("SELECT COUNT(*) FROM events WHERE starts_at IS NULL").fetchone()[0], 0)
+            for event_id, date, time, starts_at in db.conn.execute("SELECT event_id, date, time, starts_at FROM events"):
+                self.assertEqual(starts_at, DBManager._starts_at(date, time))
+            indexes = {row[1] for row in db.conn.execute("SELECT * FROM sqlite_master WHERE type = 'index'")}
+            self.assertTrue({"idx_tasks_event_id", "idx_events_starts_at"} <= indexes)
+            db.close()
+
+    def test_backfill_handles_unpadded_dates(self):
+        """
+        Test unpadded dates and times get the same starts_at as saved rows, including rows an
+        earlier SQL backfill left NULL, and are then found by the hot window
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "legacy.db")
+            legacy = DBManager(path)
+            legacy.conn.executescript("""
+                DROP INDEX idx_events_starts_at; ALTER TABLE events DROP COLUMN starts_at; PRAGMA user_version = 1;
+            """)
+            legacy.conn.executemany(
+                "INSERT INTO events (event_id, name, date, time, reminder_set) VALUES (?, ?, ?, ?, 0)",
+                [(2, "Padded", "2030-02-01", "09:00"), (3, "Unpadded", "2030-2-1", "9:00"), (4, "Broken", "soon", "9:00")])
+            legacy.conn.commit()
+            legacy.close()
+
+            with self.assertLogs(level='WARNING') as logs:
+                db = DBManager(path, chunk_size=2)
+            self.assertIn("[4]", logs.output[0])
+            rows = dict(db.conn.execute("SELECT event_id, starts_at FROM events WHERE event_id > 1"))
+            self.assertEqual(rows, {2: 1896166800, 3: 1896166800, 4: None})
+            self.assertEqual(EventPlanner().load_window(db, now=datetime.datetime(2030, 2, 1)), 2)
+
+            # A database whose rows were backfilled by the old SQL conversion is repaired
+            db.conn.execute("UPDATE events SET starts_at = NULL WHERE event_id = 3")
+            db.conn.execute("PRAGMA user_version = 4")
+            db.conn.commit()
+            with self.assertLogs(level='WARNING'):
+                db._migrate()
+            self.assertEqual(db.conn.execute("SELECT starts_at FROM events WHERE event_id = 3").fetchone()[0],
+                             1896166800)
+            db.close()
+
+    def test_orphaned_tasks_are_deleted(self):
+        """
+        Test the migration removes tasks left behind while foreign keys were off, and unindexes them
+        """
+        self.db.insert_tasks(1, ["Keep me"])
+        self.db.conn.execute("PRAGMA foreign_keys = OFF")
+        self.db.conn.execute("INSERT INTO tasks (event_id, task_description, completed) VALUES (99, 'Stray note', 0)")
+        self.db.conn.execute("PRAGMA user_version = 5")
+        self.db.conn.commit()
+        self.db.conn.execute("PRAGMA foreign_keys = ON")
+        indexed = "SELECT COUNT(*) FROM tasks_fts WHERE tasks_fts MATCH ?"
+        self.assertEqual(self.db.conn.execute(indexed, ("stray",)).fetchone()[0], 1)
+
+        self.db._migrate()
+        self.assertEqual([row[0] for row in self.db.conn.execute("SELECT task_description FROM tasks")], ["Keep me"])
+        self.assertEqual(self.db.conn.execute(indexed, ("stray",)).fetchone()[0], 0)
+        self.assertEqual(len(self.db.search("keep")), 1)
+
+    # ---- FULL-TEXT SEARCH ----
+    def test_search_events_and_tasks(self):
+        """
+        Test search ranks event and task matches, highlights them and follows edits and deletes
+        """
+        self.db.save_event(Event(2, "Board meeting", "2001-03-04", "10:00", False, "HQ", "Quarterly numbers", "Dana"))
+        self.db.insert_tasks(2, ["Print the conference agenda", "Book room"])
+
+        results = self.db.search("confer")
+        self.assertEqual([(r['kind'], r['event_id']) for r in results], [("event", 1), ("task", 2)])
+        self.assertEqual(results[1]['snippet'], "Print the [conference] agenda")
+        self.assertEqual(results[1]['date'], "2001-03-04")
+        self.assertEqual(len(self.db.search("confer", limit=1, offset=1)), 1)
+        self.assertEqual(len(self.db.search('quarterly "numbers')), 1)  # Stray quotes are not FTS syntax errors
+        self.assertEqual(self.db.search("board NEAR("), [])  # Operators are ordinary words
+        self.assertEqual(len(self.db.search('"board meeting" OR nobody', raw=True)), 1)
+
+        self.db.save_event(Event(1, "Workshop", "2030-05-01", "09:00", False))
+        self.db.delete_event(2)
+        self.assertEqual(self.db.search("confer"), [])
+        self.assertEqual([r['event_id'] for r in self.db.search("workshop")], [1])
+
+    def test_search_index_is_built_for_existing_rows(self):
+        """
+        Test the search migration indexes rows written before it ran
+        """
+        self.db.conn.execute("INSERT INTO events_fts(events_fts) VALUES ('delete-all')")
+        self.db.conn.execute("PRAGMA user_version = 2")
+        self.db.conn.commit()
+        self.db._migrate()
+        self.assertEqual([r['event_id'] for r in self.db.search("conference")], [1])
+
+    def test_interrupted_bulk_import_restores_search_triggers(self):
+        """
+        Test reopening a database after an import died mid-way recreates the search triggers and index
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "import.db")
+            db = DBManager(path)
+            for trigger in DBManager._FTS_TRIGGERS:  # As left by a bulk_import that was killed mid-way
+                db.conn.execute(f"DROP TRIGGER {trigger}")
+            db.conn.commit()
+            db.save_event(Event(1, "Kickoff meeting", "2030-05-01", "09:00", False))
+            db.close()
+
+            with self.assertLogs(level='WARNING'):
+                db = DBManager(path)
+            triggers = {row[0] for row in db.conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+            self.assertEqual(triggers, set(DBManager._FTS_TRIGGERS))
+            self.assertEqual([r['event_id'] for r in db.search("kickoff")], [1])
+            db.save_event(Event(2, "Kickoff review", "2030-05-02", "09:00", False))
+            self.assertEqual(len(db.search("kickoff")), 2)
+            db.close()
+
+
+class TestIncrementalFlush(unittest.TestCase):
+    def setUp(self):
+        """
+        Pair a fresh planner with an in-memory database
+        """
+        self.db = DBManager(db_name=":memory:")
+        self.planner = EventPlanner()
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_flush_writes_only_the_delta(self):
+        """
+        Test creates, task edits and deletes are flushed, and a second flush is empty
+        """
+        keep = self.planner.create_event("Keep", "2030-01-01", "10:00", False)
+        drop = self.planner.create_event("Drop", "2030-01-02", "10:00", False)
+        self.planner.add_tasks(keep.event_id, ["a", "b"])
+        first = self.planner.flush(self.db)
+        self.assertEqual(sorted(e.event_id for e in first.events), [keep.event_id, drop.event_id])
+        self.assertEqual(first.task_lists, {keep.event_id: [("a", False), ("b", False)]})
+
+        self.planner.mark_task_complete(keep.event_id, "a")
+        self.planner.delete_event(drop.event_id)
+        second = self.planner.flush(self.db)
+        self.assertEqual(second.events, [])
+        self.assertEqual(second.deleted_event_ids, [drop.event_id])
+        self.assertEqual(list(second.task_lists), [keep.event_id])
+
+        self.assertTrue(self.planner.flush(self.db).is_empty())
+        self.assertEqual([e.event_id for e in self.db.load_events()], [keep.event_id])
+        head = self.db.load_tasks(keep.event_id)
+        self.assertEqual((head.data, head.completed, head.next.data), ("a", True, "b"))
+
+    def test_reminder_processing_is_not_a_change(self):
+        """
+        Test dequeuing past reminders leaves nothing to flush
+        """
+        self.planner.create_event("Old", "2000-01-01", "10:00", True)
+        self.planner.flush(self.db)
+        processed, _ = self.planner.process_reminders()
+        self.assertEqual(len(processed), 1)
+        self.assertFalse(self.planner.has_unsaved_changes())
+
+    def test_failed_flush_keeps_changes(self):
+        """
+        Test a failing write leaves the changes recorded for the next flush
+        """
+        self.planner.create_event("Retry", "2030-01-01", "10:00", False)
+
+        class FailingDB:
+            def apply_changes(self, changes):
+                raise RuntimeError("disk full")
+
+        with self.assertRaises(RuntimeError):
+            self.planner.flush(FailingDB())
+        self.assertTrue(self.planner.has_unsaved_changes())
+        self.assertEqual(len(self.planner.flush(self.db).events), 1)
+
+
+class TestWindowedLoading(unittest.TestCase):
+    def setUp(self):
+        """
+        Store one event on the 10th of every month from January 2025 to July 2026, each with a task
+        """
+        self.db = DBManager(db_name=":memory:")
+        self.now = datetime.datetime(2026, 6, 15, 12, 0)
+        events, tasks = [], {}
+        event_id = 1
+        for year, month in [(y, m) for y in (2025, 2026) for m in range(1, 13)][:19]:
+            events.append(Event(event_id, f"Event {year}-{month:02d}", f"{year}-{month:02d}-10", "09:00", False))
+            tasks[event_id] = [(f"Task {event_id}", False)]
+            event_id += 1
+        self.db.apply_changes(PlannerChanges(events=events, deleted_event_ids=[], task_lists=tasks))
+        self.planner = EventPlanner()
+
+    def tearDown(self):
+        self.db.close()
+
+    def _resident_dates(self):
+        return [e.date for e in self.planner._inorder_events()]
+
+    def test_load_range_uses_the_time_index(self):
+        """
+        Test load_range returns only events (with tasks) inside the half-open range
+        """
+        rows = list(self.db.load_range(datetime.datetime(2025, 3, 1), datetime.datetime(2025, 5, 10, 9, 0)))
+        self.assertEqual([e.date for e, _ in rows], ["2025-03-10", "2025-04-10"])
+        self.assertEqual(rows[0][1].data, "Task 3")
+
+    def test_hot_window_and_fault_in(self):
+        """
+        Test only the hot window loads at startup and older months fault in on demand
+        """
+        self.assertEqual(self.planner.load_window(self.db, past_days=30, max_cold_pages=2, now=self.now), 2)
+        self.assertEqual(self._resident_dates(), ["2026-06-10", "2026-07-10"])
+
+        older = self.planner.events_between(datetime.datetime(2025, 1, 1), datetime.datetime(2025, 3, 31))
+        self.assertEqual([e.date for e in older], ["2025-01-10", "2025-02-10", "2025-03-10"])
+        self.assertEqual(len(self.planner.open_tasks_between(datetime.datetime(2025, 1, 1), self.now)), 4)
+
+        # Touching one more month evicts the least recently used pages down to the cap
+        self.planner.ensure_loaded(datetime.datetime(2025, 6, 1), datetime.datetime(2025, 6, 30))
+        self.assertEqual(self._resident_dates(), ["2025-03-10", "2025-06-10", "2026-06-10", "2026-07-10"])
+        self.assertNotIn(1, self.planner._events_by_id)
+        self.assertNotIn(1, self.planner.todo_lists)
+        self.assertFalse(self.planner.has_unsaved_changes())
+
+    def test_changed_cold_events_survive_eviction(self):
+        """
+        Test edited cold events stay resident and unflushed deletions are not faulted back in
+        """
+        self.planner.load_window(self.db, past_days=30, max_cold_pages=1, now=self.now)
+        self.planner.ensure_loaded(datetime.datetime(2025, 1, 1), datetime.datetime(2025, 2, 28))
+        self.planner.update_event(1, name="Edited")
+        self.planner.delete_event(2)
+        self.planner.ensure_loaded(datetime.datetime(2025, 8, 1), datetime.datetime(2025, 9, 30))
+        self.planner.ensure_loaded(datetime.datetime(2025, 1, 1), datetime.datetime(2025, 2, 28))
+
+        self.assertEqual(self.planner._events_by_id[1].name, "Edited")
+        self.assertNotIn(2, self.planner._events_by_id)
+        self.assertEqual(self._resident_dates(), ["2025-01-10", "2026-06-10", "2026-07-10"])
+
+    def test_small_pages_update_the_tree_in_place(self):
+        """
+        Test faulting in and evicting a page much smaller than the resident tree inserts and
+        deletes its nodes one by one, keeping order and subtree sizes correct
+        """
+        future = [Event(100 + i, f"Future {i}", (datetime.date(2026, 7, 1) + datetime.timedelta(days=i)).isoformat(),
+                        "10:00", False) for i in range(200)]
+        self.db.apply_changes(PlannerChanges(events=future, deleted_event_ids=[], task_lists={}))
+        self.planner.load_window(self.db, past_days=30, max_cold_pages=1, now=self.now)
+        self.planner._rebuild_bst = None  # Any full rebuild would fail
+
+        self.planner.ensure_loaded(datetime.datetime(2025, 3, 1), datetime.datetime(2025, 3, 31))
+        self.assertEqual(self.planner.event_count(), 203)
+        self.assertEqual(self.planner.events_slice(0, 2)[0].date, "2025-03-10")
+        self.planner.ensure_loaded(datetime.datetime(2025, 5, 1), datetime.datetime(2025, 5, 31))
+        dates = self._resident_dates()
+        self.assertEqual(dates[:2], ["2025-05-10", "2026-06-10"])
+        self.assertEqual(dates, sorted(dates))
+        self.assertEqual(self.planner.event_count(), 203)
+        self.assertEqual(self.planner.count_before(datetime.datetime(2026, 7, 1)), 2)
+
+
+class TestStatementStats(unittest.TestCase):
+    def setUp(self):
+        """
+        Time every statement of an in-memory database
+        """
+        self.db = DBManager(db_name=":memory:", stats_sample_rate=1.0)
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_statements_are_timed_per_kind(self):
+        """
+        Test each statement kind gets its own counters, rows and percentiles
+        """
+        self.db.reset_stats()
+        head = LLNode("Book room")
+        head.next = LLNode("Send agenda")
+        for i in range(1, 4):
+            self.db.save_event(Event(i, f"Meeting {i}", "2030-01-01", "10:00", False))
+            self.db.save_tasks(i, head)
+        self.db.load_tasks(1)
+
+        stats = self.db.stats()
+        self.assertEqual(stats['save_event']['count'], 3)
+        self.assertEqual(stats['save_tasks.delete']['count'], 3)
+        self.assertEqual(stats['save_tasks.insert']['rows'], 6)
+        self.assertEqual(stats['commit']['count'], 6)
+        self.assertEqual(stats['load_tasks']['rows'], 2)
+        commit = stats['commit']
+        self.assertTrue(0 < commit['p50_ms'] <= commit['p95_ms'] <= commit['p99_ms'] <= commit['max_ms'])
+
+        with self.assertRaises(Exception):
+            self.db.save_event(Event(9, None, "2030-01-01", "10:00", False))
+        self.assertEqual(self.db.stats()['save_event']['errors'], 1)
+
+        self.db.reset_stats()
+        self.assertEqual(self.db.stats(), {})
+
+    def test_sampling(self):
+        """
+        Test sampled statistics estimate call counts, and a zero rate records nothing
+        """
+        stats = StatementStats(sample_rate=0.25)
+        for _ in range(100):
+            with stats.timer('query') as timer:
+                timer.rows = 1
+        self.assertEqual(stats.snapshot()['query']['sampled'], 25)
+        self.assertEqual(stats.snapshot()['query']['count'], 100)
+
+        stats.sample_rate = 0
+        stats.reset()
+        with stats.timer('query'):
+            pass
+        self.assertEqual(stats.snapshot(), {})
+        with self.assertRaises(ValueError):
+            stats.sample_rate = 2
+
+    def test_sampling_is_per_kind(self):
+        """
+        Test statements that always run in pairs are all counted exactly and each kind is timed
+        """
+        db = DBManager(db_name=":memory:", stats_sample_rate=0.1)
+        try:
+            db.reset_stats()
+            for i in range(1, 201):
+                db.save_event(Event(i, f"Meeting {i}", "2030-01-01", "10:00", False))
+            stats = db.stats()
+        finally:
+            db.close()
+        self.assertEqual(stats['save_event']['count'], 200)
+        self.assertEqual(stats['save_event']['sampled'], 20)
+        self.assertEqual(stats['commit']['count'], 200)
+        self.assertEqual(stats['commit']['sampled'], 20)
+
+    def test_percentiles_from_histogram(self):
+        """
+        Test percentile estimates stay within a histogram bucket of the true values
+        """
+        stats = StatementStats()
+        for micros in range(1, 1001):
+            stats.record('query', micros * 1000)
+        result = stats.snapshot()['query']
+        for key, expected in (('p50_ms', 0.5), ('p95_ms', 0.95), ('p99_ms', 0.99)):
+            self.assertAlmostEqual(result[key], expected, delta=expected * 0.15)
+        self.assertEqual(result['max_ms'], 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,311 @@
+import unittest
+import datetime
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from core.event_planner import EventPlanner
+
+
+class TestEventPlannerTasks(unittest.TestCase):
+    compact_tasks = False
+
+    def setUp(self):
+        """
+        Initialize a planner with a single event for each test
+        """
+        self.planner = EventPlanner(compact_tasks=self.compact_tasks)
+        self.event = self.planner.create_event("Conference", "2030-05-01", "09:00", False)
+
+    # ---- BULK TASK API ----
+    def test_add_tasks_appends_in_order(self):
+        """
+        Test bulk insertion splices after existing tasks
+        """
+        self.planner.add_task(self.event.event_id, "Book venue")
+        added = self.planner.add_tasks(self.event.event_id, ["Print badges", "Order food"])
+        self.assertEqual(added, 2)
+        self.assertEqual([t["task"] for t in self.planner.get_tasks(self.event.event_id)],
+                         ["Book venue", "Print badges", "Order food"])
+
+    def test_add_tasks_logs_once(self):
+        """
+        Test a bulk insert produces a single execution-log entry
+        """
+        before = len(self.planner.execution_log['linked_list'])
+        self.planner.add_tasks(self.event.event_id, (f"Task {i}" for i in range(300)))
+        self.assertEqual(len(self.planner.execution_log['linked_list']), before + 1)
+        self.assertEqual(len(self.planner.get_tasks(self.event.event_id)), 300)
+
+    def test_add_tasks_unknown_event(self):
+        """
+        Test bulk insertion into a missing event is rejected
+        """
+        self.assertEqual(self.planner.add_tasks(999, ["Nothing"]), 0)
+
+    def test_complete_tasks(self):
+        """
+        Test completion by predicate and by collection of descriptions
+        """
+        self.planner.add_tasks(self.event.event_id, ["Call A", "Call B", "Email C"])
+        self.assertEqual(self.planner.complete_tasks(self.event.event_id, lambda t: t.startswith("Call")), 2)
+        self.assertEqual(self.planner.complete_tasks(self.event.event_id, ["Call A", "Email C"]), 1)
+        self.assertTrue(all(t["completed"] for t in self.planner.get_tasks(self.event.event_id)))
+
+    def test_remove_tasks(self):
+        """
+        Test removal of head, middle and tail nodes in one call
+        """
+        self.planner.add_tasks(self.event.event_id, ["a", "b", "c", "d", "e"])
+        removed = self.planner.remove_tasks(self.event.event_id, {"a", "c", "e"})
+        self.assertEqual(removed, 3)
+        self.assertEqual([t["task"] for t in self.planner.get_tasks(self.event.event_id)], ["b", "d"])
+
+        self.assertEqual(self.planner.remove_tasks(self.event.event_id, lambda t: True), 2)
+        self.assertEqual(self.planner.get_tasks(self.event.event_id), [])
+
+    def test_single_task_operations(self):
+        """
+        Test add/remove/mark on individual tasks, including re-adding after removal
+        """
+        event_id = self.event.event_id
+        for task in ("a", "b", "c"):
+            self.assertTrue(self.planner.add_task(event_id, task))
+        self.assertTrue(self.planner.mark_task_complete(event_id, "b"))
+        self.assertTrue(self.planner.remove_task(event_id, "c"))
+        self.assertFalse(self.planner.remove_task(event_id, "missing"))
+        self.assertTrue(self.planner.add_task(event_id, "d"))
+        self.assertEqual(self.planner.get_tasks(event_id), [
+            {"task": "a", "completed": False},
+            {"task": "b", "completed": True},
+            {"task": "d", "completed": False},
+        ])
+
+    def test_chain_walk_compatibility(self):
+        """
+        Test todo_lists heads can be walked through data/completed/next like LLNode chains
+        """
+        self.planner.add_tasks(self.event.event_id, ["x", "y"])
+        self.planner.complete_tasks(self.event.event_id, ["y"])
+        walked = []
+        current = self.planner.todo_lists.get(self.event.event_id)
+        while current:
+            walked.append((current.data, current.completed))
+            current = current.next
+        self.assertEqual(walked, [("x", False), ("y", True)])
+
+        # Assigning a chain (as the DB loader does) copies it into the store
+        self.planner._set_tasks_for_loading(self.event.event_id, self.planner.todo_lists.get(self.event.event_id))
+        self.assertEqual(len(self.planner.get_tasks(self.event.event_id)), 2)
+
+
+class TestEventPlannerCompactTasks(TestEventPlannerTasks):
+    """Runs the task tests against the array-backed CompactTaskStore."""
+    compact_tasks = True
+
+    def test_slots_and_strings_are_reused(self):
+        """
+        Test removed tasks free their slots and unreferenced descriptions
+        """
+        store = self.planner.todo_lists
+        self.planner.add_tasks(self.event.event_id, ["same"] * 50 + ["unique"])
+        self.assertEqual(len(store._string_ids), 2)
+        self.planner.remove_tasks(self.event.event_id, ["unique"])
+        self.assertNotIn("unique", store._string_ids)
+        slots_before = len(store._text)
+        self.planner.add_tasks(self.event.event_id, ["again"])
+        self.assertEqual(len(store._text), slots_before)
+
+
+class TestOpenTasksBetween(unittest.TestCase):
+    def setUp(self):
+        """
+        Create three events on consecutive days
+        """
+        self.planner = EventPlanner()
+        self.day1 = self.planner.create_event("Day 1", "2030-05-01", "09:00", False)
+        self.day2 = self.planner.create_event("Day 2", "2030-05-02", "09:00", False)
+        self.day3 = self.planner.create_event("Day 3", "2030-05-03", "09:00", False)
+
+    def _window(self, start, end):
+        return self.planner.open_tasks_between(datetime.datetime.fromisoformat(start),
+                                               datetime.datetime.fromisoformat(end))
+
+    def test_only_events_with_open_tasks(self):
+        """
+        Test events without tasks or with only completed tasks are excluded
+        """
+        self.planner.add_tasks(self.day1.event_id, ["a", "b"])
+        self.planner.add_task(self.day2.event_id, "c")
+        self.planner.mark_task_complete(self.day2.event_id, "c")
+        self.planner.complete_tasks(self.day1.event_id, ["a"])
+
+        results = self._window("2030-05-01 00:00", "2030-05-31 00:00")
+        self.assertEqual([event.event_id for event, _ in results], [self.day1.event_id])
+        self.assertEqual(results[0][1], [{"task": "b", "completed": False}])
+
+    def test_counters_follow_mutations(self):
+        """
+        Test counters across removal, deletion and rescheduling
+        """
+        self.planner.add_tasks(self.day1.event_id, ["a"])
+        self.planner.add_tasks(self.day3.event_id, ["x", "y"])
+        self.planner.remove_tasks(self.day1.event_id, ["a"])
+        self.assertEqual([e.event_id for e, _ in self._window("2030-05-01 00:00", "2030-05-02 23:59")], [])
+
+        self.planner.update_event(self.day3.event_id, date="2030-05-02")
+        self.assertEqual([e.event_id for e, _ in self._window("2030-05-02 00:00", "2030-05-02 23:59")],
+                         [self.day3.event_id])
+
+        self.planner.delete_event(self.day3.event_id)
+        self.assertEqual(self._window("2030-01-01 00:00", "2030-12-31 00:00"), [])
+
+    def test_window_bounds_are_inclusive(self):
+        """
+        Test events exactly on the start and end boundaries are returned
+        """
+        for event in (self.day1, self.day2, self.day3):
+            self.planner.add_task(event.event_id, "todo")
+        results = self._window("2030-05-01 09:00", "2030-05-02 09:00")
+        self.assertEqual([e.event_id for e, _ in results], [self.day1.event_id, self.day2.event_id])
+
+
+class TestPositionalAccess(unittest.TestCase):
+    def setUp(self):
+        """
+        Create events in shuffled order, some sharing a datetime
+        """
+        self.planner = EventPlanner()
+        days = [7, 3, 9, 1, 5, 3, 8, 2, 6, 4]
+        self.events = [self.planner.create_event(f"Event {i}", f"2030-05-{day:02d}", "09:00", False)
+                       for i, day in enumerate(days)]
+
+    def _expected(self):
+        return sorted(self.planner._events_by_id.values(), key=lambda e: (e.date, e.time))
+
+    def test_slices_match_chronological_order(self):
+        """
+        Test every slice equals the same window of the in-order traversal
+        """
+        expected = [e.event_id for e in self.planner._inorder_events()]
+        self.assertEqual(self.planner.event_count(), len(expected))
+        for start in range(-1, 12):
+            for count in (0, 1, 3, 20):
+                self.assertEqual([e.event_id for e in self.planner.events_slice(start, count)],
+                                 expected[max(start, 0):max(start, 0) + count])
+
+    def test_sizes_follow_updates_and_deletes(self):
+        """
+        Test rescheduling and deleting remove the old tree node instead of leaving a stale one
+        """
+        self.planner.update_event(self.events[0].event_id, date="2030-04-30")
+        self.planner.delete_event(self.events[4].event_id)
+        self.planner.update_event(self.events[5].event_id, date="2030-05-10")
+        self.planner.undo_last_edit()
+        events = self.planner.events_slice(0, 100)
+        self.assertEqual(self.planner.event_count(), 9)
+        self.assertEqual([(e.date, e.time) for e in events], [(e.date, e.time) for e in self._expected()])
+        self.assertEqual(len({e.event_id for e in events}), 9)
+
+    def test_positions(self):
+        """
+        Test count_before and position_of agree with the slice order, including shared datetimes
+        """
+        events = self.planner.events_slice(0, 100)
+        for position, event in enumerate(events):
+            self.assertEqual(self.planner.position_of(event.event_id), position)
+        self.assertEqual(self.planner.count_before(datetime.datetime(2030, 5, 3, 9, 0)), 2)
+        self.assertEqual(self.planner.count_before(datetime.datetime(2031, 1, 1)), 10)
+        self.assertIsNone(self.planner.position_of(999))
+
+    def test_view_changes(self):
+        """
+        Test take_view_changes reports created, updated and deleted events once
+        """
+        self.planner.take_view_changes()
+        created = self.planner.create_event("New", "2030-05-11", "09:00", False)
+        self.planner.update_event(self.events[1].event_id, name="Renamed")
+        self.planner.delete_event(self.events[2].event_id)
+        self.planner.add_task(self.events[3].event_id, "Task only")
+        self.assertEqual(self.planner.take_view_changes(),
+                         {created.event_id, self.events[1].event_id, self.events[2].event_id})
+        self.assertEqual(self.planner.take_view_changes(), set())
+
+    def test_freeze_is_independent(self):
+        """
+        Test a frozen snapshot keeps its contents while the planner changes
+        """
+        first = self.planner.events_slice(0, 1)[0]
+        name = first.name
+        self.planner.add_tasks(first.event_id, ["a", "b"])
+        snapshot = self.planner.freeze()
+        self.planner.update_event(first.event_id, name="Changed")
+        self.planner.delete_event(self.events[1].event_id)
+        self.planner.add_task(first.event_id, "c")
+
+        self.assertEqual(len(snapshot._events_by_id), 10)
+        self.assertEqual(snapshot._events_by_id[first.event_id].name, name)
+        chain = snapshot.todo_lists[first.event_id]
+        self.assertEqual([chain.data, chain.next.data, chain.next.next], ["a", "b", None])
+        self.assertEqual(len(snapshot.view_events(upcoming=True)) + len(snapshot.view_events(upcoming=False)), 10)
+        self.assertLess(len(snapshot.execution_log['bst']), len(self.planner.execution_log['bst']))
+
+
+class TestPrefixSearch(unittest.TestCase):
+    def setUp(self):
+        """
+        Create events with names, locations and attendees to search
+        """
+        self.planner = EventPlanner()
+        self.board = self.planner.create_event("Board meeting", "2030-05-03", "09:00", False,
+                                               location="Main Hall", attendees="Alice, Bob")
+        self.lunch = self.planner.create_event("Lunch", "2030-05-01", "12:00", False,
+                                               location="Cafe", attendees="Anna")
+        self.review = self.planner.create_event("Budget review", "2030-05-02", "15:00", False,
+                                                location="Boardroom", attendees="Bob")
+
+    def _ids(self, query, **kwargs):
+        return [event.event_id for event in self.planner.search_prefix(query, **kwargs)]
+
+    def test_prefixes_match_all_words_in_date_order(self):
+        """
+        Test every query word must prefix a word of the name, location or attendees
+        """
+        self.assertEqual(self._ids("bo"), [self.review.event_id, self.board.event_id])
+        self.assertEqual(self._ids("BOB me"), [self.board.event_id])
+        self.assertEqual(self._ids("a"), [self.lunch.event_id, self.board.event_id])
+        self.assertEqual(self._ids("oard"), [])
+        self.assertEqual(self._ids("  ,"), [])
+        self.assertEqual(self._ids("bo", start=datetime.datetime(2030, 5, 3)), [self.board.event_id])
+        self.assertEqual(self._ids("bo", end=datetime.datetime(2030, 5, 3)), [self.review.event_id])
+        self.assertEqual(self._ids("bo", limit=1), [self.review.event_id])
+
+    def test_index_follows_changes(self):
+        """
+        Test the index reflects creates, updates, deletes and undo after it was built
+        """
+        self.assertTrue(self._ids("lunch"))
+        self.planner.update_event(self.lunch.event_id, name="Brunch", date="2030-05-04")
+        self.assertEqual(self._ids("lunch"), [])
+        self.assertEqual(self._ids("b"), [self.review.event_id, self.board.event_id, self.lunch.event_id])
+        self.planner.undo_last_edit()
+        self.assertEqual(self._ids("lunch"), [self.lunch.event_id])
+        self.planner.delete_event(self.board.event_id)
+        created = self.planner.create_event("Boat trip", "2030-04-30", "08:00", False)
+        self.assertEqual(self._ids("bo"), [created.event_id, self.review.event_id])
+
+    def test_iterator_survives_changes(self):
+        """
+        Test a search in progress skips events deleted or rescheduled after it started
+        """
+        matches = self.planner.iter_search_prefix("b")
+        self.assertEqual(next(matches).event_id, self.review.event_id)
+        self.planner.delete_event(self.board.event_id)
+        self.planner.update_event(self.lunch.event_id, name="Brunch")
+        self.assertEqual([event.event_id for event in matches], [])
+        self.assertEqual(self._ids("b"), [self.lunch.event_id, self.review.event_id])
+
+
+if __name__ == "__main__":
+    unittest.main()
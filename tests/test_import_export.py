@@ -0,0 +1,119 @@
+import unittest
+import io
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from core.event_planner import EventPlanner, Event
+from database.db_manager import DBManager
+from database.import_export import import_events, export_events, read_ics, write_ics
+
+
+class TestImportExport(unittest.TestCase):
+    def setUp(self):
+        """
+        Use a temporary directory for the database and the exchanged files
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = DBManager(os.path.join(self.tmpdir.name, "events.db"))
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+    def _write_jsonl(self, name, records):
+        with open(self._path(name), "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(record if isinstance(record, str) else json.dumps(record))
+                f.write("\n")
+        return self._path(name)
+
+    def test_import_validates_in_batches_and_reports_progress(self):
+        """
+        Test valid records are imported with new IDs, invalid ones are skipped with line numbers
+        """
+        self.db.save_event(Event(7, "Existing", "2030-01-01", "09:00", False))
+        path = self._write_jsonl("in.jsonl", [
+            {"name": "Kickoff", "date": "2030-02-01", "time": "9:30", "tasks": [{"task": "Slides", "completed": True}]},
+            {"name": "", "date": "2030-02-01", "time": "10:00"},
+            "{not json",
+            "42",
+            "[1, 2]",
+            {"name": "Retro", "date": "2030-02-31", "time": "10:00"},
+            {"name": "Review", "date": "2030-03-01", "time": "11:00", "reminder_set": "yes", "tasks": ["Notes"]},
+        ])
+        progress = []
+        planner = EventPlanner()
+        result = import_events(self.db, path, batch_size=2, planner=planner,
+                               progress=lambda done, skipped: progress.append((done, skipped)))
+
+        self.assertEqual((result.imported, result.skipped, result.tasks), (2, 5, 2))
+        self.assertEqual([error.split(":")[0] for error in result.errors],
+                         ["line 2", "line 3", "line 4", "line 5", "line 6"])
+        self.assertEqual(result.errors[2], "line 4: expected a JSON object")
+        self.assertEqual(progress, [(1, 1), (1, 3), (1, 5), (2, 5)])
+        events = {e.name: e for e in self.db.load_events()}
+        self.assertEqual((events["Kickoff"].event_id, events["Kickoff"].time), (8, "09:30"))
+        self.assertTrue(events["Review"].reminder_set)
+        self.assertEqual(planner.get_tasks(8), [{"task": "Slides", "completed": True}])
+        self.assertEqual(planner.event_id_counter, 10)
+        self.assertEqual([r["event_id"] for r in self.db.search("slides")], [8])  # Search index rebuilt
+
+    def test_round_trip_through_every_format(self):
+        """
+        Test CSV, JSONL and ICS exports import back to the same events and tasks
+        """
+        self.db.save_event(Event(1, "Launch, phase 1; \"final\"", "2030-05-01", "09:00", True,
+                                 "Hall A", "Line one\nLine two " + "x" * 100, "Alice,Bob"))
+        self.db.insert_tasks(1, ["Book venue", "Ünïcode task"])
+        self.db.save_event(Event(2, "Quiet day", "2030-05-02", "00:00", False))
+        self.db.conn.execute("UPDATE tasks SET completed = 1 WHERE task_description = 'Book venue'")
+        self.db.conn.commit()
+        expected = [(e.__dict__, tasks) for e, tasks in self.db.iter_events_with_tasks()]
+
+        for fmt in ("csv", "jsonl", "ics"):
+            path = self._path(f"out.{fmt}")
+            self.assertEqual(export_events(self.db, path), 2)
+            target = DBManager(self._path(f"copy_{fmt}.db"))
+            result = import_events(target, path, keep_ids=True)
+            self.assertEqual(result.skipped, 0, result.errors)
+            actual = [(e.__dict__, tasks) for e, tasks in target.iter_events_with_tasks()]
+            self.assertEqual(actual, expected, fmt)
+            target.close()
+
+    def test_ics_reader_handles_folding_and_foreign_calendars(self):
+        """
+        Test folded lines, all-day dates, UTC times and attendees from other calendar apps
+        """
+        calendar = (
+            "BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\nSUMMARY:Team lun\r\n ch\r\n"
+            "DTSTART;VALUE=DATE:20300601\r\nATTENDEE;CN=\"Lee, Sam\":mailto:sam@example.com\r\n"
+            "ATTENDEE:mailto:kim@example.com\r\nEND:VEVENT\r\n"
+            "BEGIN:VEVENT\r\nSUMMARY:Call\r\nDTSTART:20300602T143000Z\r\nEND:VEVENT\r\nEND:VCALENDAR\r\n"
+        )
+        records = [record for _, record in read_ics(io.StringIO(calendar))]
+        self.assertEqual(records[0]["name"], "Team lunch")
+        self.assertEqual((records[0]["date"], records[0]["time"]), ("2030-06-01", "00:00"))
+        self.assertEqual(records[0]["attendees"], "Lee Sam,kim@example.com")
+        self.assertEqual(records[1]["time"], "14:30")
+
+        # Attendee names survive a round trip through write_ics
+        out = io.StringIO()
+        list(write_ics(out, [(Event(1, "Team lunch", "2030-06-01", "12:00", False,
+                                    attendees=records[0]["attendees"]), [])]))
+        out.seek(0)
+        self.assertEqual(next(read_ics(out))[1]["attendees"], "Lee Sam,kim@example.com")
+
+        out = io.StringIO()
+        list(write_ics(out, [(Event(1, "Ü" * 60, "2030-01-01", "10:00", False), [])]))
+        self.assertTrue(all(len(line.encode("utf-8")) <= 75 for line in out.getvalue().split("\r\n")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+import datetime
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from core.event_planner import Event, EventPlanner, LLNode
+from database.db_manager import DBManager
+from database.snapshot import load_snapshot, write_snapshot
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        """
+        Set up a database with old and recent events, some with tasks, and a windowed planner
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = DBManager(os.path.join(self.tmpdir.name, "events.db"))
+        self.path = os.path.join(self.tmpdir.name, "events.db.snapshot")
+        self.now = datetime.datetime(2030, 6, 15, 12, 0)
+        events = [Event(i, f"Event {i} ✓", (self.now + datetime.timedelta(days=i - 60)).strftime("%Y-%m-%d"),
+                        "09:30", i % 3 == 0, "Room 1", "", "Ann, Bob") for i in range(1, 101)]
+        self.db.save_events(events)
+        head = LLNode("Book room")
+        head.next = LLNode("Send invites", completed=True)
+        self.db.save_tasks(70, head)
+        self.planner = EventPlanner()
+        self.planner.load_window(self.db, now=self.now)
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_round_trip(self):
+        """
+        Test a snapshot restores the same hot window, tasks and window start
+        """
+        info = write_snapshot(self.planner, self.db, self.path)
+        restored = EventPlanner()
+        loaded = load_snapshot(restored, self.db, self.path)
+        self.assertEqual(loaded, info.events)
+        self.assertEqual(restored.window_start, self.planner.window_start)
+        self.assertEqual([(e, t) for e, t in restored.window_rows()], list(self.planner.window_rows()))
+        self.assertEqual(list(restored.todo_lists.iter_tasks(70)), [("Book room", False), ("Send invites", True)])
+        # Older events still fault in from the database
+        old = restored.events_between(datetime.datetime(2030, 1, 1), restored.window_start)
+        self.assertEqual([e.event_id for e in old], list(range(1, 30)))
+
+    def test_stale_after_database_write(self):
+        """
+        Test a snapshot is ignored once the database has changed
+        """
+        write_snapshot(self.planner, self.db, self.path)
+        self.db.save_event(Event(101, "Later", "2030-07-01", "10:00", False))
+        restored = EventPlanner()
+        self.assertIsNone(load_snapshot(restored, self.db, self.path))
+        self.assertIsNone(restored.window_start)
+
+    def test_corrupt_file_is_rejected(self):
+        """
+        Test a damaged or truncated snapshot fails validation instead of loading bad data
+        """
+        write_snapshot(self.planner, self.db, self.path)
+        with open(self.path, "r+b") as f:
+            f.seek(-3, os.SEEK_END)
+            f.write(b"\xff\xff\xff")
+        self.assertIsNone(load_snapshot(EventPlanner(), self.db, self.path))
+        with open(self.path, "r+b") as f:
+            f.truncate(20)
+        self.assertIsNone(load_snapshot(EventPlanner(), self.db, self.path))
+        self.assertIsNone(load_snapshot(EventPlanner(), self.db, self.path + ".missing"))
+
+    def test_other_database_is_rejected(self):
+        """
+        Test a snapshot is not used for a different database (or one restored from a backup)
+        """
+        write_snapshot(self.planner, self.db, self.path)
+        other = DBManager(os.path.join(self.tmpdir.name, "other.db"))
+        try:
+            self.assertIsNone(load_snapshot(EventPlanner(), other, self.path))
+        finally:
+            other.close()
+        self.db.restore(self._backup())
+        self.assertIsNone(load_snapshot(EventPlanner(), self.db, self.path))
+
+    def test_unsaved_changes_are_refused(self):
+        """
+        Test a snapshot cannot be written while the planner has changes the database lacks
+        """
+        self.planner.create_event("New", (self.now + datetime.timedelta(days=1)).strftime("%Y-%m-%d"), "10:00", False)
+        with self.assertRaises(ValueError):
+            write_snapshot(self.planner, self.db, self.path)
+        self.assertFalse(os.path.exists(self.path))
+
+    def _backup(self):
+        dest = os.path.join(self.tmpdir.name, "copy.db")
+        self.assertTrue(self.db.backup(dest).wait(10))
+        return dest
+
+
+if __name__ == '__main__':
+    unittest.main()
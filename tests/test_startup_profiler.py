@@ -0,0 +1,103 @@
+import unittest
+import builtins
+import json
+import os
+import sys
+import tempfile
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import startup_profiler
+
+
+class TestStartupProfiler(unittest.TestCase):
+    def setUp(self):
+        """
+        Set up a temporary directory with a module to import, and no active profiler
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.tmpdir.name, "profile.json")
+        with open(os.path.join(self.tmpdir.name, "profiled_module.py"), "w") as f:
+            f.write("import colorsys\nVALUE = 1\n")
+        sys.path.insert(0, self.tmpdir.name)
+        self.addCleanup(sys.path.remove, self.tmpdir.name)
+        self.addCleanup(sys.modules.pop, "profiled_module", None)
+        startup_profiler._active = None
+        self.addCleanup(setattr, startup_profiler, "_active", None)
+        self.import_function = builtins.__import__
+
+    def tearDown(self):
+        builtins.__import__ = self.import_function
+        self.tmpdir.cleanup()
+
+    def test_disabled_by_default(self):
+        """
+        Test nothing is recorded or written unless profiling was requested
+        """
+        with mock.patch.dict(os.environ, {startup_profiler.ENV_VAR: "0"}):
+            self.assertIsNone(startup_profiler.start("app", ["app"]))
+        with startup_profiler.phase("work"):
+            startup_profiler.mark("ready")
+        self.assertIsNone(startup_profiler.finish())
+        self.assertIs(builtins.__import__, self.import_function)
+
+    def test_flag_and_environment(self):
+        """
+        Test the command-line flag is consumed and takes precedence over the environment variable
+        """
+        argv = ["app", "--profile-startup=" + self.output, "--other"]
+        with mock.patch.dict(os.environ, {startup_profiler.ENV_VAR: "elsewhere.json"}):
+            self.assertEqual(startup_profiler.requested_output("app", argv), self.output)
+            self.assertEqual(argv, ["app", "--other"])
+            self.assertEqual(startup_profiler.requested_output("app", argv), "elsewhere.json")
+        with mock.patch.dict(os.environ, {startup_profiler.ENV_VAR: "1"}):
+            self.assertEqual(startup_profiler.requested_output("app", ["app"]), "startup-profile-app.json")
+
+    def test_timeline_and_imports_are_written(self):
+        """
+        Test phases, marks and imports are recorded and written as JSON and text
+        """
+        profiler = startup_profiler.start("app", ["app", "--profile-startup=" + self.output])
+        self.assertIsNotNone(profiler)
+        with startup_profiler.phase("outer"):
+            with startup_profiler.phase("load"):
+                import profiled_module  # noqa: F401
+            startup_profiler.mark("loaded")
+        report = startup_profiler.finish()
+        self.assertIs(builtins.__import__, self.import_function)
+
+        self.assertTrue(report['completed'])
+        self.assertEqual([(p['name'], p['depth'], p['parent']) for p in report['phases']],
+                         [("outer", 0, None), ("load", 1, "outer")])
+        self.assertEqual([m['name'] for m in report['marks']], ["loaded"])
+        record = next(r for r in report['imports']['slowest'] if r['module'] == "profiled_module")
+        self.assertEqual(record['phase'], "load")
+        self.assertGreaterEqual(record['seconds'], record['self_seconds'])
+        self.assertIn("profiled_module", report['imports']['by_package'])
+
+        with open(self.output) as f:
+            self.assertEqual(json.load(f)['app'], "app")
+        with open(os.path.join(self.tmpdir.name, "profile.txt")) as f:
+            summary = f.read()
+        self.assertIn("outer", summary)
+        self.assertIn("profiled_module", summary)
+        self.assertIs(startup_profiler.finish(), report)  # Only the first call writes
+
+    def test_compare_reports_regressions(self):
+        """
+        Test compare flags phases that got slower beyond both thresholds
+        """
+        def report(total, load):
+            return {'total_seconds': total, 'imports': {'total_seconds': 0.1},
+                    'phases': [{'name': "load", 'seconds': load}], 'marks': [{'name': "first_paint", 'at': total}]}
+
+        self.assertEqual(startup_profiler.compare(report(1.0, 0.5), report(1.0, 0.5)), [])
+        self.assertEqual(startup_profiler.compare(report(1.01, 0.51), report(1.0, 0.5)), [])  # Noise
+        regressions = startup_profiler.compare(report(1.0, 0.9), report(1.0, 0.5))
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith("phase load"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from core.event_planner import EventPlanner
+from database.db_manager import DBManager
+from database.write_behind import WriteBehindWriter
+
+
+class TestWriteBehindWriter(unittest.TestCase):
+    def setUp(self):
+        """
+        Point a writer at a temporary database file with a long timer
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_name = os.path.join(self.tmpdir.name, "events.db")
+        DBManager(self.db_name).close()
+        self.writer = WriteBehindWriter(self.db_name, flush_interval=60)
+        self.planner = EventPlanner()
+
+    def tearDown(self):
+        self.writer.close(timeout=5)
+        self.tmpdir.cleanup()
+
+    def _load(self):
+        db = DBManager(self.db_name)
+        try:
+            return {e.event_id: e for e in db.load_events()}
+        finally:
+            db.close()
+
+    def test_repeated_writes_are_coalesced(self):
+        """
+        Test several updates to one event become a single pending row
+        """
+        event = self.planner.create_event("Draft", "2030-01-01", "10:00", False)
+        self.writer.submit(self.planner.collect_changes())
+        for name in ("Draft 2", "Draft 3", "Final"):
+            self.planner.update_event(event.event_id, name=name)
+            self.writer.submit(self.planner.collect_changes())
+        self.assertEqual(self.writer.stats()['pending'], 1)
+        self.assertEqual(self.writer.stats()['coalesced'], 3)
+
+        self.assertTrue(self.writer.flush(timeout=5))
+        self.assertEqual(self._load()[event.event_id].name, "Final")
+
+    def test_delete_supersedes_pending_write(self):
+        """
+        Test an event created and deleted before a flush never reaches the DB
+        """
+        kept = self.planner.create_event("Kept", "2030-01-01", "10:00", False)
+        gone = self.planner.create_event("Gone", "2030-01-02", "10:00", False)
+        self.planner.add_task(gone.event_id, "never saved")
+        self.writer.submit(self.planner.collect_changes())
+        self.planner.delete_event(gone.event_id)
+        self.writer.submit(self.planner.collect_changes())
+        self.assertTrue(self.writer.flush(timeout=5))
+        self.assertEqual(list(self._load()), [kept.event_id])
+
+    def test_size_threshold_triggers_flush(self):
+        """
+        Test reaching max_pending writes without an explicit flush
+        """
+        self.writer.max_pending = 5
+        for i in range(5):
+            self.planner.create_event(f"E{i}", "2030-01-01", "10:00", False)
+        self.writer.submit(self.planner.collect_changes())
+        for _ in range(50):
+            if self.writer.stats()['batches']:
+                break
+            self.writer._thread.join(0.1)
+        self.assertEqual(self.writer.stats()['batches'], 1)
+
+    def test_close_flushes(self):
+        """
+        Test close writes pending changes and rejects further submits
+        """
+        self.planner.create_event("Last", "2030-01-01", "10:00", False)
+        self.writer.submit(self.planner.collect_changes())
+        self.assertTrue(self.writer.close(timeout=5))
+        self.assertEqual(len(self._load()), 1)
+        self.planner.create_event("Late", "2030-01-01", "10:00", False)
+        with self.assertRaises(RuntimeError):
+            self.writer.submit(self.planner.collect_changes())
+
+
+if __name__ == "__main__":
+    unittest.main()